@@ -10,6 +10,7 @@ from openbb_tmx.models.equity_profile import TmxEquityProfileFetcher
 from openbb_tmx.models.equity_quote import TmxEquityQuoteFetcher
 from openbb_tmx.models.equity_search import TmxEquitySearchFetcher
 from openbb_tmx.models.etf_countries import TmxEtfCountriesFetcher
+from openbb_tmx.models.etf_holders import TmxEtfHoldersFetcher
 from openbb_tmx.models.etf_holdings import TmxEtfHoldingsFetcher
 from openbb_tmx.models.etf_info import TmxEtfInfoFetcher
 from openbb_tmx.models.etf_search import TmxEtfSearchFetcher
@@ -17,11 +18,15 @@ from openbb_tmx.models.etf_sectors import TmxEtfSectorsFetcher
 from openbb_tmx.models.gainers import TmxGainersFetcher
 from openbb_tmx.models.historical_dividends import TmxHistoricalDividendsFetcher
 from openbb_tmx.models.index_constituents import TmxIndexConstituentsFetcher
+from openbb_tmx.models.index_memberships import TmxIndexMembershipsFetcher
 from openbb_tmx.models.index_sectors import TmxIndexSectorsFetcher
 from openbb_tmx.models.index_snapshots import TmxIndexSnapshotsFetcher
 from openbb_tmx.models.insiders_trading import TmxInsidersTradingFetcher
+from openbb_tmx.models.news_search import TmxNewsSearchFetcher
 from openbb_tmx.models.options_chains import TmxOptionsChainsFetcher
+from openbb_tmx.models.options_stats import TmxOptionsStatsFetcher
 from openbb_tmx.models.price_target_consensus import TmxPriceTargetConsensusFetcher
+from openbb_tmx.models.put_call_ratios import TmxPutCallRatiosFetcher
 
 tmx_provider = Provider(
     name="tmx",
@@ -50,16 +55,21 @@ tmx_provider = Provider(
         "EquitySearch": TmxEquitySearchFetcher,
         "EtfSearch": TmxEtfSearchFetcher,
         "EtfHoldings": TmxEtfHoldingsFetcher,
+        "EtfHolders": TmxEtfHoldersFetcher,
         "EtfSectors": TmxEtfSectorsFetcher,
         "EtfCountries": TmxEtfCountriesFetcher,
         "EtfInfo": TmxEtfInfoFetcher,
         "EquityGainers": TmxGainersFetcher,
         "HistoricalDividends": TmxHistoricalDividendsFetcher,
         "IndexConstituents": TmxIndexConstituentsFetcher,
+        "IndexMemberships": TmxIndexMembershipsFetcher,
         "IndexSectors": TmxIndexSectorsFetcher,
         "IndexSnapshots": TmxIndexSnapshotsFetcher,
         "InsiderTrading": TmxInsidersTradingFetcher,
+        "NewsSearch": TmxNewsSearchFetcher,
         "OptionsChains": TmxOptionsChainsFetcher,
+        "OptionsStats": TmxOptionsStatsFetcher,
         "PriceTargetConsensus": TmxPriceTargetConsensusFetcher,
+        "PutCallRatios": TmxPutCallRatiosFetcher,
     },
 )
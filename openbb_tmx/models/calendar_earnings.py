@@ -1,7 +1,5 @@
 """TMX Earnings Calendar Model"""
 
-import asyncio
-import json
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
@@ -10,15 +8,20 @@ from openbb_core.provider.standard_models.calendar_earnings import (
     CalendarEarningsData,
     CalendarEarningsQueryParams,
 )
-from openbb_tmx.utils import gql
-from openbb_tmx.utils.helpers import get_random_agent, get_data_from_gql
-from pandas import date_range
+from openbb_tmx.utils.earnings import get_earnings_calendar
 from pydantic import Field, field_validator
 
 
 class TmxCalendarEarningsQueryParams(CalendarEarningsQueryParams):
     """TMX Calendar Earnings Query."""
 
+    use_cache: bool = Field(
+        default=True,
+        description="Whether to use the local earnings archive."
+        + " Settled dates are stored permanently, and upcoming dates are requested again after four hours."
+        + " To request every date again, set to False.",
+    )
+
 
 class TmxCalendarEarningsData(CalendarEarningsData):
     """TMX Calendar Earnings Data."""
@@ -82,51 +85,9 @@ class TmxCalendarEarningsFetcher(
         **kwargs: Any,
     ) -> List[Dict]:
         """Return the raw data from the TMX endpoint."""
-
-        results = []
-        dates = []
-        user_agent = get_random_agent()
-        dates = date_range(query.start_date, end=query.end_date)
-
-        async def create_task(date, results):
-            """Creates a task for a single date in the range."""
-            data = []
-            date = date.strftime("%Y-%m-%d")
-            payload = gql.get_earnings_date_payload.copy()
-            payload["variables"]["date"] = date
-            url = "https://app-money.tmx.com/graphql"
-            r = await get_data_from_gql(
-                method="POST",
-                url=url,
-                data=json.dumps(payload),
-                headers={
-                    "Host": "app-money.tmx.com",
-                    "Referer": "https://money.tmx.com/",
-                    "locale": "en",
-                    "Content-Type": "application/json",
-                    "User-Agent": user_agent,
-                    "Accept": "*/*",
-                },
-                timeout=3,
-            )
-            try:
-                if (
-                    "data" in r
-                    and r["data"].get("getEnhancedEarningsForDate") is not None
-                ):
-                    data = r["data"].get("getEnhancedEarningsForDate")
-                    data = [{"report_date": date, **d} for d in data]
-            except Exception as e:
-                raise (e)
-            if len(data) > 0:
-                results.extend(data)
-            return results
-
-        tasks = [create_task(date, results) for date in dates if date.weekday() < 5]
-
-        await asyncio.gather(*tasks)
-
-        return sorted(results, key=lambda x: x["report_date"])
+        return await get_earnings_calendar(
+            query.start_date, query.end_date, use_cache=query.use_cache
+        )
 
     @staticmethod
     def transform_data(
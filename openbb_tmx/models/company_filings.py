@@ -1,7 +1,5 @@
 """TMX Company Filings Model"""
-import asyncio
-import json
-from dateutil import rrule
+
 from datetime import (
     date as dateType,
     datetime,
@@ -14,8 +12,8 @@ from openbb_core.provider.standard_models.company_filings import (
     CompanyFilingsData,
     CompanyFilingsQueryParams,
 )
-from openbb_tmx.utils import gql
-from openbb_tmx.utils.helpers import get_random_agent, get_data_from_gql
+from openbb_tmx.utils.filings import get_stored_company_filings
+from openbb_tmx.utils.helpers import download_company_filings
 from pydantic import Field
 
 
@@ -30,6 +28,12 @@ class TmxCompanyFilingsQueryParams(CompanyFilingsQueryParams):
         description="The end date to fetch.",
         default=None,
     )
+    use_cache: bool = Field(
+        default=True,
+        description="Whether to use the local filings store."
+        + " Published filings do not change, so only the dates not already stored are requested."
+        + " To bypass, set to False.",
+    )
 
 
 class TmxCompanyFilingsData(CompanyFilingsData):
@@ -77,85 +81,16 @@ class TmxCompanyFilingsFetcher(
     ) -> List[Dict]:
         """Return the raw data from the TMX endpoint."""
 
-        user_agent = get_random_agent()
-        results: List[Dict] = []
-
-        # Generate a list of dates from start_date to end_date with a frequency of 1 week
-        dates = list(
-            rrule.rrule(
-                rrule.WEEKLY, interval=1, dtstart=query.start_date, until=query.end_date
+        if query.use_cache is False:
+            # Failed, and saturated, windows are reported as warnings by the download.
+            filings, _ = await download_company_filings(
+                query.symbol, query.start_date, query.end_date  # type: ignore
             )
-        )
+            return filings
 
-        # Add end_date to the list if it's not there already
-        if dates[-1] != query.end_date:
-            dates.append(query.end_date)  # type: ignore
-
-        # Create a list of 4-week chunks
-        chunks = [
-            (dates[i], dates[i + 1] - timedelta(days=1)) for i in range(len(dates) - 1)
-        ]
-
-        # Adjust the end date of the last chunk to be the final end date
-        chunks[-1] = (chunks[-1][0], query.end_date)  # type: ignore
-
-        async def create_task(start, end, results):
-            """Create tasks from the chunked start/end dates."""
-            data = []
-            payload = gql.get_company_filings_payload
-            payload["variables"]["symbol"] = query.symbol
-            payload["variables"]["fromDate"] = start.strftime("%Y-%m-%d")
-            payload["variables"]["toDate"] = end.strftime("%Y-%m-%d")
-            payload["variables"]["limit"] = 1000
-            url = "https://app-money.tmx.com/graphql"
-
-            async def try_again():
-                return await get_data_from_gql(
-                    method="POST",
-                    url=url,
-                    data=json.dumps(payload),
-                    headers={
-                        "authority": "app-money.tmx.com",
-                        "referer": f"https://money.tmx.com/en/quote/{query.symbol}",
-                        "locale": "en",
-                        "Content-Type": "application/json",
-                        "User-Agent": user_agent,
-                        "Accept": "*/*",
-                    },
-                    timeout=10,
-                )
-
-            try:
-                data = await get_data_from_gql(
-                    method="POST",
-                    url=url,
-                    data=json.dumps(payload),
-                    headers={
-                        "authority": "app-money.tmx.com",
-                        "referer": f"https://money.tmx.com/en/quote/{query.symbol}",
-                        "locale": "en",
-                        "Content-Type": "application/json",
-                        "User-Agent": user_agent,
-                        "Accept": "*/*",
-                    },
-                    timeout=10,
-                )
-            except Exception:
-                data = await try_again()
-
-            if isinstance(data, str):
-                data = await try_again()
-
-            if data != [] and data["data"].get("filings") is not None:
-                results.extend(data["data"]["filings"])
-
-            return results
-
-        tasks = [create_task(chunk[0], chunk[1], results) for chunk in chunks]
-
-        await asyncio.gather(*tasks)
-
-        return sorted(results, key=lambda x: x["filingDate"], reverse=True)
+        return await get_stored_company_filings(
+            query.symbol, query.start_date, query.end_date  # type: ignore
+        )
 
     @staticmethod
     def transform_data(
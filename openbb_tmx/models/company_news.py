@@ -1,8 +1,9 @@
 """TMX Stock News model."""
-import asyncio
-import json
 import pytz
-from datetime import datetime
+from datetime import (
+    date as dateType,
+    datetime,
+)
 from typing import Any, Dict, List, Optional
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -10,8 +11,7 @@ from openbb_core.provider.standard_models.company_news import (
     CompanyNewsData,
     CompanyNewsQueryParams,
 )
-from openbb_tmx.utils import gql
-from openbb_tmx.utils.helpers import get_random_agent, get_data_from_gql
+from openbb_tmx.utils.news import get_news
 from pydantic import Field, field_validator
 
 
@@ -23,6 +23,15 @@ class TmxCompanyNewsQueryParams(CompanyNewsQueryParams):
     page: Optional[int] = Field(
         default=1, description="The page number to start from. Use with limit."
     )
+    start_date: Optional[dateType] = Field(
+        default=None,
+        description="The oldest date of the news. Pages are requested until it is reached,"
+        + " and the limit, if any, applies to each symbol.",
+    )
+    only_new: bool = Field(
+        default=False,
+        description="Return only the news published since the last request for each symbol, in this session.",
+    )
 
 
 class TmxCompanyNewsData(CompanyNewsData):
@@ -60,58 +69,25 @@ class TmxCompanyNewsFetcher(
         **kwargs: Any,
     ) -> List[Dict]:
         """Return the raw data from the TMX endpoint."""
-        user_agent = get_random_agent()
-        symbols = query.symbols.split(",")
+        news = await get_news(
+            query.symbols.split(","),
+            limit=query.limit,
+            start_date=query.start_date,
+            page=query.page or 1,
+            only_new=query.only_new,
+        )
         results = []
-
-        async def create_task(symbol, results):
-            """Makes a POST request to the TMX GraphQL endpoint for a single symbol."""
-
-            symbol = (
-                symbol.upper().replace(".TO", "").replace(".TSX", "").replace("-", ".")
-            )
-            payload = gql.get_company_news_events_payload
-            payload["variables"]["symbol"] = symbol
-            payload["variables"]["page"] = query.page
-            payload["variables"]["limit"] = query.limit
-            payload["variables"]["locale"] = "en"
-            url = "https://app-money.tmx.com/graphql"
-            data = {}
-            response = await get_data_from_gql(
-                method="POST",
-                url=url,
-                data=json.dumps(payload),
-                headers={
-                    "authority": "app-money.tmx.com",
-                    "referer": f"https://money.tmx.com/en/quote/{symbol}",
-                    "locale": "en",
-                    "Content-Type": "application/json",
-                    "User-Agent": user_agent,
-                    "Accept": "*/*",
-                },
-                timeout=3,
+        for item in news:
+            symbol = item["symbols"].split(",")[0]
+            # The newsid is only used to create the URL, and the summary is a duplicated headline.
+            results.append(
+                {
+                    **{k: v for k, v in item.items() if k not in ("newsid", "summary")},
+                    "url": f"https://money.tmx.com/quote/{symbol}/news/{item['newsid']}",
+                }
             )
-            data = response["data"] if response.get("data") else data
-            if data.get("news") is not None:
-                news = data["news"]
-                for i in range(len(news)):
-                    url = f"https://money.tmx.com/quote/{symbol.upper()}/news/{news[i]['newsid']}"
-                    news[i]["url"] = url
-                    # The newsid was used to create the URL, so we drop it.
-                    news[i].pop("newsid", None)
-                    # The summary is a duplicated headline, so we drop it.
-                    news[i].pop("summary", None)
-                    # Add the symbol to the data for multi-ticker support.
-                    news[i]["symbols"] = symbol
-                results.extend(news)
-
-            return results
-
-        tasks = [create_task(symbol, results) for symbol in symbols]
-
-        await asyncio.gather(*tasks)
-
-        return sorted(results, key=lambda d: d["datetime"], reverse=True)
+
+        return results
 
     @staticmethod
     def transform_data(data: List[Dict], **kwargs: Any) -> List[TmxCompanyNewsData]:
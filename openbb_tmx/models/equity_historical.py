@@ -8,6 +8,7 @@ from openbb_tmx.utils.helpers import (
     get_daily_price_history,
     get_intraday_price_history,
     get_weekly_or_monthly_price_history,
+    validate_models,
 )
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.equity_historical import (
@@ -18,7 +19,7 @@ from openbb_core.provider.utils.descriptions import (
     QUERY_DESCRIPTIONS,
 )
 from openbb_core.provider.utils.errors import EmptyDataError
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, Series, to_datetime
 from pydantic import Field, field_validator
 
 _warn = warnings.warn
@@ -104,6 +105,8 @@ class TmxEquityHistoricalData(EquityHistoricalData):
     @classmethod
     def date_validate(cls, v):  # pylint: disable=E0213
         """Validate the datetime format."""
+        if isinstance(v, datetime):
+            return v
         try:
             dt = datetime.strptime(v, "%Y-%m-%d %H:%M:%S%z")
             return dt.astimezone(pytz.timezone("America/New_York"))
@@ -191,18 +194,21 @@ class TmxEquityHistoricalFetcher(
             raise EmptyDataError()
 
         # Handle the date formatting differences.
+        # Dates are parsed here in bulk, so the model does not parse each row.
         results = results.rename(columns={"dateTime": "datetime"})
         if query.interval != "day":
             results["datetime"] = to_datetime(results["datetime"], utc=True)
             if query.interval == "week" or query.interval == "month":
-                results["datetime"] = results["datetime"].dt.strftime("%Y-%m-%d")
+                results["datetime"] = (
+                    results["datetime"].dt.tz_localize(None).dt.normalize()
+                )
             else:
-                results["datetime"] = results["datetime"].dt.strftime(
-                    "%Y-%m-%d %H:%M:%S%z"
+                results["datetime"] = results["datetime"].dt.tz_convert(
+                    "America/New_York"
                 )
         if query.interval == "day":
-            results["datetime"] = to_datetime(results["datetime"]).dt.strftime(
-                "%Y-%m-%d"
+            results["datetime"] = to_datetime(
+                to_datetime(results["datetime"]).dt.strftime("%Y-%m-%d")
             )
 
         symbols = query.symbol.split(",")
@@ -219,10 +225,13 @@ class TmxEquityHistoricalFetcher(
         # For the week beginning 2011-09-12 replace the openPrice NaN with 0 because of 9/11.
         if query.interval == "week":
             results["open"] = results["open"].fillna(0)
-        # Convert any NaN values to None.
+        # Convert any NaN values to None, keeping the dates as datetime objects.
+        dates = Series(
+            list(results.pop("datetime").dt.to_pydatetime()),
+            index=results.index,
+            dtype=object,
+        )
         results = results.fillna(value="N/A").replace("N/A", None)
+        results.insert(0, "datetime", dates)
 
-        return [
-            TmxEquityHistoricalData.model_validate(d)
-            for d in results.to_dict("records")
-        ]
+        return validate_models(TmxEquityHistoricalData, results.to_dict("records"))
@@ -15,7 +15,11 @@ from openbb_core.provider.standard_models.equity_quote import (
 )
 from numpy import nan
 from openbb_tmx.utils import gql
-from openbb_tmx.utils.helpers import get_random_agent, get_data_from_gql
+from openbb_tmx.utils.helpers import (
+    get_data_from_gql,
+    get_random_agent,
+    validate_models,
+)
 from pydantic import Field, field_validator
 
 
@@ -224,6 +228,8 @@ class TmxEquityQuoteData(EquityQuoteData):
     @classmethod
     def date_validate(cls, v):  # pylint: disable=E0213
         """Return the datetime object from the date string"""
+        if isinstance(v, dateType):
+            return v
         if v:
             try:
                 return datetime.strptime(v, "%Y-%m-%d").date()
@@ -342,4 +348,4 @@ class TmxEquityQuoteFetcher(
         symbol_to_index = {symbol: index for index, symbol in enumerate(symbols)}
         data = sorted(data, key=lambda d: symbol_to_index[d["symbol"]])
 
-        return [TmxEquityQuoteData.model_validate(d) for d in data]
+        return validate_models(TmxEquityQuoteData, data)
@@ -7,7 +7,14 @@ from openbb_core.provider.standard_models.etf_countries import (
     EtfCountriesData,
     EtfCountriesQueryParams,
 )
-from openbb_tmx.utils.helpers import get_all_etfs
+from openbb_tmx.utils.etf_index import (
+    get_etf_exposures,
+    get_etf_tables,
+    look_through_etf_exposure,
+    lookup_etf_rows,
+    parse_portfolio,
+)
+from openbb_tmx.utils.helpers import get_etf_universe
 from pandas import DataFrame
 from pydantic import Field
 
@@ -20,6 +27,11 @@ class TmxEtfCountriesQueryParams(EtfCountriesQueryParams):
         description="Whether to use a cached request. All ETF data comes from a single JSON file that is updated daily."
         + " To bypass, set to False. If True, the data will be cached for 4 hours.",
     )
+    weights: Optional[str] = Field(
+        default=None,
+        description="Comma separated weights of each symbol in a portfolio, in the same order as the symbols."
+        + " When supplied, the look-through exposure of the portfolio is included as 'portfolio'.",
+    )
 
 
 class TmxEtfCountriesData(EtfCountriesData):
@@ -47,40 +59,20 @@ class TmxEtfCountriesFetcher(
     ) -> List[Dict]:
         """Return the raw data from the TMX endpoint."""
 
-        symbols = (
-            query.symbol.split(",") if "," in query.symbol else [query.symbol.upper()]
-        )
-
-        _data = DataFrame(await get_all_etfs(use_cache=query.use_cache))
-        results = {}
-        for symbol in symbols:
-            data = {}
-            if ".TO" in symbol:
-                symbol = symbol.replace(".TO", "")  # noqa
-            _target = _data[_data["symbol"] == symbol]["regions"]
-            target = DataFrame()
-            if len(_target) > 0:
-                target = DataFrame.from_records(_target.iloc[0]).rename(
-                    columns={"name": "country", "percent": "weight"}
-                )
-                if not target.empty:
-                    target = target.set_index("country")
-                for i in target.index:
-                    data.update({i: target.loc[i]["weight"]})
-                if data != {}:
-                    results.update({symbol: data})
-
-        output = (
-            DataFrame(results)
-            .transpose()
-            .reset_index()
-            .rename(columns={"index": "symbol"})
-        ).transpose()
-        output.columns = output.loc["symbol"].to_list()
-        output.drop("symbol", axis=0, inplace=True)
-        return (
-            output.reset_index().rename(columns={"index": "country"}).to_dict("records")
-        )
+        symbols = query.symbol.split(",")
+        tables = get_etf_tables(await get_etf_universe(use_cache=query.use_cache))
+        rows = lookup_etf_rows(tables, symbols)
+        # Countries are columns of the exposures, and are returned as rows.
+        output = get_etf_exposures(tables, "regions", rows).dropna(how="all").T
+        if query.weights:
+            portfolio = parse_portfolio(symbols, query.weights)
+            output["portfolio"] = look_through_etf_exposure(
+                tables, "regions", portfolio
+            )
+        if output.empty:
+            return []
+        output.columns.name = None
+        return output.reset_index().to_dict("records")
 
     @staticmethod
     def transform_data(
@@ -0,0 +1,97 @@
+"""TMX ETF Holders fetcher."""
+
+from typing import Any, Dict, List, Optional, Union
+
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.abstract.query_params import QueryParams
+from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_tmx.utils.etf_index import get_etf_tables, lookup_etf_holders
+from openbb_tmx.utils.helpers import get_etf_universe, validate_models
+from pydantic import Field, field_validator
+
+
+class TmxEtfHoldersQueryParams(QueryParams):
+    """TMX ETF Holders query.
+
+    Source: https://www.tmx.com/
+    """
+
+    symbol: str = Field(
+        description="The symbol, or name, of the security held."
+        + " Multiple comma separated items allowed.",
+    )
+    use_cache: bool = Field(
+        default=True,
+        description="Whether to use a cached request. All ETF data comes from a single JSON file that is updated daily."
+        + " To bypass, set to False. If True, the data will be cached for 4 hours.",
+    )
+
+
+class TmxEtfHoldersData(Data):
+    """TMX ETF Holders Data."""
+
+    security: str = Field(description="The symbol, or name, of the security searched.")
+    etf_symbol: str = Field(description="The symbol of the ETF holding the security.")
+    etf_name: Optional[str] = Field(
+        description="The name of the ETF holding the security.", default=None
+    )
+    symbol: Optional[str] = Field(
+        description="The ticker symbol of the holding.", default=None
+    )
+    name: Optional[str] = Field(description="The name of the holding.", default=None)
+    weight: Optional[float] = Field(
+        description="The weight of the holding in the ETF, as a normalized percentage.",
+        default=None,
+    )
+    shares: Optional[Union[int, str]] = Field(
+        description="The number of shares held by the ETF.",
+        alias="number_of_shares",
+        default=None,
+    )
+    market_value: Optional[Union[float, str]] = Field(
+        description="The market value of the holding.", default=None
+    )
+    currency: Optional[str] = Field(
+        description="The currency of the holding.", default=None
+    )
+
+    @field_validator("weight", mode="before", check_fields=False)
+    @classmethod
+    def normalize_percent(cls, v):
+        """Return percents as normalized percentage points."""
+        return round(float(v) / 100, 6) if v else None
+
+
+class TmxEtfHoldersFetcher(
+    Fetcher[
+        TmxEtfHoldersQueryParams,
+        List[TmxEtfHoldersData],
+    ]
+):
+    """Transform the query, extract and transform the data from the TMX endpoints."""
+
+    @staticmethod
+    def transform_query(params: Dict[str, Any]) -> TmxEtfHoldersQueryParams:
+        """Transform the query."""
+        return TmxEtfHoldersQueryParams(**params)
+
+    @staticmethod
+    async def aextract_data(
+        query: TmxEtfHoldersQueryParams,
+        credentials: Optional[Dict[str, str]],
+        **kwargs: Any,
+    ) -> List[Dict]:
+        """Return the raw data from the TMX endpoint."""
+        tables = get_etf_tables(await get_etf_universe(use_cache=query.use_cache))
+        holders = lookup_etf_holders(tables, query.symbol.split(","))
+        if holders.empty:
+            raise EmptyDataError(f"No ETFs were found holding: {query.symbol}")
+        return (holders.fillna("N/A").replace("NA", None).replace("N/A", None)).to_dict(
+            "records"
+        )
+
+    @staticmethod
+    def transform_data(data: List[Dict], **kwargs: Any) -> List[TmxEtfHoldersData]:
+        """Transform the data to the standard format."""
+        return validate_models(TmxEtfHoldersData, data)
@@ -2,13 +2,17 @@
 
 from typing import Any, Dict, List, Optional, Union
 
-import pandas as pd
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.etf_holdings import (
     EtfHoldingsData,
     EtfHoldingsQueryParams,
 )
-from openbb_tmx.utils.helpers import get_all_etfs
+from openbb_tmx.utils.etf_index import (
+    get_etf_tables,
+    lookup_etf_rows,
+    take_etf_children,
+)
+from openbb_tmx.utils.helpers import get_etf_universe
 from pydantic import Field, field_validator
 
 
@@ -92,33 +96,16 @@ class TmxEtfHoldingsFetcher(
         **kwargs: Any,
     ) -> List[Dict]:
         """Return the raw data from the TMX endpoint."""
-        query.symbol = query.symbol.upper()
-        if ".TO" in query.symbol:
-            query.symbol = query.symbol.replace(".TO", "")
         results = []
-        etf = pd.DataFrame()
-        etfs = pd.DataFrame(await get_all_etfs(use_cache=query.use_cache))
-        etf = etfs[etfs["symbol"] == query.symbol]
-
-        if len(etf) == 1:
-            top_holdings = pd.DataFrame(etf["holdings_top10"].iloc[0])
-            top_holdings = top_holdings.dropna(axis=1, how="all")
-            _columns = {
-                "numberofshares": "number_of_shares",
-                "symbol": "symbol",
-                "country": "country",
-                "fundid": "fund_id",
-                "excode": "exchange",
-                "securityname": "name",
-                "currency": "currency",
-                "marketvalue": "market_value",
-                "detailholdingtypeid": "type_id",
-                "weighting": "weight",
-                "sharepercentage": "share_percentage",
-                "sharechange": "share_change",
-                "shareChange": "share_change",
-            }
-            top_holdings.rename(columns=_columns, inplace=True)
+        universe = await get_etf_universe(use_cache=query.use_cache)
+        tables = get_etf_tables(universe)
+        rows = lookup_etf_rows(tables, [query.symbol])
+
+        if len(rows) == 1:
+            top_holdings = take_etf_children(tables, "holdings", rows)
+            top_holdings = top_holdings.drop(columns=["fund"]).dropna(
+                axis=1, how="all"
+            )
             results = (
                 top_holdings.fillna("N/A")
                 .replace("NA", None)
@@ -2,13 +2,13 @@
 
 from typing import Any, Dict, List, Optional
 
-import pandas as pd
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.etf_info import (
     EtfInfoData,
     EtfInfoQueryParams,
 )
-from openbb_tmx.utils.helpers import get_all_etfs
+from openbb_tmx.utils.etf_index import get_etf_tables, lookup_etf_rows
+from openbb_tmx.utils.helpers import get_etf_universe
 from pydantic import Field, field_validator
 
 
@@ -148,11 +148,8 @@ class TmxEtfInfoFetcher(
     ) -> List[Dict]:
         """Return the raw data from the TMX endpoint."""
 
-        results = []
-        symbols = (
-            query.symbol.split(",") if "," in query.symbol else [query.symbol.upper()]
-        )
-        _data = pd.DataFrame(await get_all_etfs(use_cache=query.use_cache))
+        symbols = query.symbol.split(",")
+        tables = get_etf_tables(await get_etf_universe(use_cache=query.use_cache))
         COLUMNS = [
             "symbol",
             "inception_date",
@@ -185,16 +182,9 @@ class TmxEtfInfoFetcher(
             "investment_objectives",
         ]
 
-        for symbol in symbols:
-            result = {}
-            target = pd.DataFrame()
-            symbol = symbol.replace(".TO", "").replace(".TSX", "").replace("-", ".")
-            target = _data[_data["symbol"] == symbol][COLUMNS]
-            target = target.fillna("N/A").replace("N/A", None)
-            if len(target) > 0:
-                result = target.reset_index(drop=True).transpose().to_dict()[0]
-                results.append(result)
-        return results
+        rows = lookup_etf_rows(tables, symbols)
+        target = tables["funds"].iloc[rows][COLUMNS]
+        return target.fillna("N/A").replace("N/A", None).to_dict("records")
 
     @staticmethod
     def transform_data(data: List[Dict], **kwargs: Any) -> List[TmxEtfInfoData]:
@@ -1,16 +1,91 @@
 """TMX ETF Search fetcher."""
 
-from typing import Any, Dict, List, Literal, Optional
+import re
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.etf_search import (
     EtfSearchData,
     EtfSearchQueryParams,
 )
-from openbb_tmx.utils.helpers import get_all_etfs
+from openbb_tmx.utils.etf_index import (
+    get_etf_search_index,
+    get_etf_tables,
+    screen_etfs,
+    search_etf_index,
+)
+from openbb_tmx.utils.helpers import get_etf_universe, validate_models
 from pydantic import Field, field_validator
 
+# Columns returned as percents, normalized in bulk before validation.
+PERCENT_COLUMNS = [
+    "distribution_yield",
+    "return_1m",
+    "return_3m",
+    "return_6m",
+    "return_ytd",
+    "return_1y",
+    "return_3y",
+    "return_5y",
+    "return_10y",
+    "return_from_inception",
+    "mer",
+    "management_fee",
+]
+
+# Numeric columns that can be screened, and sorted, by.
+SCREEN_COLUMNS = [
+    "nav",
+    "close",
+    "unit_price",
+    "return_1m",
+    "return_3m",
+    "return_6m",
+    "return_ytd",
+    "return_1y",
+    "return_3y",
+    "return_5y",
+    "return_10y",
+    "return_from_inception",
+    "beta_1y",
+    "beta_3y",
+    "beta_5y",
+    "beta_10y",
+    "beta_15y",
+    "aum",
+    "volume_avg_daily",
+    "volume_avg_30d",
+    "management_fee",
+    "mer",
+    "distribution_yield",
+    "pb_ratio",
+    "pe_ratio",
+]
+
+SCREEN_PATTERN = re.compile(r"^\s*(\w+)\s*(<=|>=|<|>|=)\s*(-?[\d.]+(?:e-?\d+)?)\s*$")
+
+
+def parse_screen(screen: str) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+    """Parses range conditions into the (minimum, maximum) of each column, in the units of the source."""
+    filters: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+    for condition in screen.split(","):
+        match = SCREEN_PATTERN.match(condition)
+        if match is None or match.group(1) not in SCREEN_COLUMNS:
+            raise ValueError(f"Invalid screen condition: {condition.strip()}")
+        column, operator, value = match.groups()
+        number = float(value) * (100 if column in PERCENT_COLUMNS else 1)
+        lower, upper = filters.get(column, (None, None))
+        if operator in (">", ">=", "="):
+            bound = np.nextafter(number, np.inf) if operator == ">" else number
+            lower = bound if lower is None else max(lower, bound)
+        if operator in ("<", "<=", "="):
+            bound = np.nextafter(number, -np.inf) if operator == "<" else number
+            upper = bound if upper is None else min(upper, bound)
+        filters[column] = (lower, upper)
+    return filters
+
 
 class TmxEtfSearchQueryParams(EtfSearchQueryParams):
     """TMX ETF Search query.
@@ -22,23 +97,43 @@ class TmxEtfSearchQueryParams(EtfSearchQueryParams):
         description="The dividend payment frequency.", default=None
     )
 
-    sort_by: Optional[
-        Literal[
-            "nav",
-            "return_1m",
-            "return_3m",
-            "return_6m",
-            "return_1y",
-            "return_3y",
-            "return_ytd",
-            "beta_1y",
-            "volume_avg_daily",
-            "management_fee",
-            "distribution_yield",
-            "pb_ratio",
-            "pe_ratio",
-        ]
-    ] = Field(description="The column to sort by.", default=None)
+    screen: Optional[str] = Field(
+        default=None,
+        description="Comma separated range conditions on the numeric columns, combined with AND."
+        + " For example: 'mer<=0.005,aum>=1000000000,return_1y>0.1'. Operators: <, <=, >, >=, =."
+        + " Percents are normalized, as in the results. Columns: "
+        + ", ".join(SCREEN_COLUMNS),
+    )
+    sort_by: Optional[str] = Field(
+        default=None,
+        description="Comma separated columns to sort by, in descending order."
+        + " Append ':asc' to a column to sort it in ascending order. For example: 'return_1y,mer:asc'.",
+    )
+    limit: Optional[int] = Field(
+        default=None, ge=1, description="The number of results to return, from the top."
+    )
+
+    @field_validator("sort_by", mode="before", check_fields=False)
+    @classmethod
+    def validate_sort_by(cls, v):
+        """Check the columns to sort by."""
+        if v:
+            for item in v.split(","):
+                column = item.strip().split(":")[0]
+                if column not in SCREEN_COLUMNS:
+                    raise ValueError(
+                        f"Invalid column to sort by: {column}. Choose from: "
+                        + ", ".join(SCREEN_COLUMNS)
+                    )
+        return v
+
+    @field_validator("screen", mode="before", check_fields=False)
+    @classmethod
+    def validate_screen(cls, v):
+        """Check the screen conditions."""
+        if v:
+            parse_screen(v)
+        return v
 
     use_cache: bool = Field(
         default=True,
@@ -145,29 +240,6 @@ class TmxEtfSearchData(EtfSearchData):
         description="The dividend payment frequency of the ETF.", default=None
     )
 
-    @field_validator(
-        "distribution_yield",
-        "return_1m",
-        "return_3m",
-        "return_6m",
-        "return_ytd",
-        "return_1y",
-        "return_3y",
-        "return_5y",
-        "return_10y",
-        "return_from_inception",
-        "mer",
-        "management_fee",
-        mode="before",
-        check_fields=False,
-    )
-    @classmethod
-    def normalize_percent(cls, v):
-        """Return percents as normalized percentage points."""
-        if v:
-            return float(v) / 100
-        return None
-
 
 class TmxEtfSearchFetcher(
     Fetcher[
@@ -190,26 +262,59 @@ class TmxEtfSearchFetcher(
     ) -> List[Dict]:
         """Return the raw data from the TMX endpoint."""
 
-        etfs = pd.DataFrame(await get_all_etfs(use_cache=query.use_cache))
-
+        universe = await get_etf_universe(use_cache=query.use_cache)
+        tables = get_etf_tables(universe)
+        rows = None
+        # Results of a search are ranked by relevance, see `search_etf_index`.
         if query.query:
-            etfs = etfs[
-                etfs["name"].str.contains(query.query, case=False)
-                | etfs["short_name"].str.contains(query.query, case=False)
-                | etfs["investment_style"].str.contains(query.query, case=False)
-                | etfs["investment_objectives"].str.contains(query.query, case=False)
-                | etfs["symbol"].str.contains(query.query, case=False)
+            index = get_etf_search_index(universe)
+            rows = np.array(
+                [row for row, _ in search_etf_index(index, query.query)],
+                dtype="int64",
+            )
+        if query.div_freq:
+            rows = np.arange(len(tables["funds"])) if rows is None else rows
+            frequency = tables["funds"]["dividend_frequency"].to_numpy()[rows]
+            rows = rows[frequency == query.div_freq.capitalize()]
+
+        sort_by = (
+            [
+                (item.strip().split(":")[0], not item.strip().endswith(":asc"))
+                for item in query.sort_by.split(",")
             ]
+            if query.sort_by
+            else None
+        )
+        rows = screen_etfs(
+            tables,
+            filters=parse_screen(query.screen) if query.screen else None,
+            sort_by=sort_by,
+            limit=query.limit,
+            rows=rows,
+        )
+        if len(rows) == 0:
+            return []
 
-        data = etfs.copy()
+        # Funds are validated once for each refresh of the universe, and returned as validated from then on.
+        validated = universe.setdefault("search_models", {})
+        missing = [int(row) for row in rows if int(row) not in validated]
+        if missing:
+            validated.update(_validate_funds(tables["funds"], missing))
 
-        if query.div_freq:
-            data = data[data["dividend_frequency"] == query.div_freq.capitalize()]
+        return [validated[int(row)] for row in rows if int(row) in validated]
+
+    @staticmethod
+    def transform_data(data: List[Dict], **kwargs: Any) -> List[TmxEtfSearchData]:
+        """Transform the data to the standard format."""
+        return validate_models(TmxEtfSearchData, data, trusted=True)
 
-        if query.sort_by:
-            data = data.sort_values(by=query.sort_by, ascending=False)
 
-        data.drop(
+def _validate_funds(funds: pd.DataFrame, rows: List[int]) -> Dict[int, Dict]:
+    """Validates rows of the funds table, and returns the `model_dump()` of each, by row."""
+    data = (
+        funds.iloc[rows]
+        .set_axis(rows)
+        .drop(
             columns=[
                 "sectors",
                 "regions",
@@ -220,12 +325,14 @@ class TmxEtfSearchFetcher(
                 "asset_class_id",
                 "investment_objectives",
             ],
-            inplace=True,
+            errors="ignore",
         )
-        data = data.dropna(how="all")
-        return data.fillna("N/A").replace("N/A", None).to_dict("records")
-
-    @staticmethod
-    def transform_data(data: List[Dict], **kwargs: Any) -> List[TmxEtfSearchData]:
-        """Transform the data to the standard format."""
-        return [TmxEtfSearchData.model_validate(d) for d in data]
+    )
+    data = data.dropna(how="all")
+    # Percents are normalized here as columns, instead of by a validator on each row.
+    percents = data[PERCENT_COLUMNS].apply(pd.to_numeric, errors="coerce") / 100
+    data[PERCENT_COLUMNS] = percents.where(percents != 0)
+    models = validate_models(
+        TmxEtfSearchData, data.fillna("N/A").replace("N/A", None).to_dict("records")
+    )
+    return {row: model.model_dump() for row, model in zip(data.index, models)}
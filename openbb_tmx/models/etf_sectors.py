@@ -7,12 +7,17 @@ from openbb_core.provider.standard_models.etf_sectors import (
     EtfSectorsData,
     EtfSectorsQueryParams,
 )
-from openbb_tmx.utils.helpers import get_all_etfs
+from openbb_tmx.utils.etf_index import (
+    get_etf_exposures,
+    get_etf_tables,
+    look_through_etf_exposure,
+    lookup_etf_rows,
+    parse_portfolio,
+    take_etf_children,
+)
+from openbb_tmx.utils.helpers import get_etf_universe
 from pandas import DataFrame
 from pydantic import Field
-import warnings
-
-_warn = warnings.warn
 
 
 class TmxEtfSectorsQueryParams(EtfSectorsQueryParams):
@@ -23,11 +28,21 @@ class TmxEtfSectorsQueryParams(EtfSectorsQueryParams):
         description="Whether to use a cached request. All ETF data comes from a single JSON file that is updated daily."
         + " To bypass, set to False. If True, the data will be cached for 4 hours.",
     )
+    weights: Optional[str] = Field(
+        default=None,
+        description="Comma separated weights of each symbol in a portfolio, in the same order as the symbols."
+        + " When supplied, the look-through exposure of the portfolio is included as 'portfolio'.",
+    )
 
 
 class TmxEtfSectorsData(EtfSectorsData):
     """TMX ETF Sectors Data."""
 
+    symbol: Optional[str] = Field(
+        default=None,
+        description="The symbol of the ETF, or 'portfolio', when multiple symbols are requested.",
+    )
+
 
 class TmxEtfSectorsFetcher(
     Fetcher[
@@ -52,21 +67,27 @@ class TmxEtfSectorsFetcher(
 
         symbols = query.symbol.split(",")
         target = DataFrame()
-        _data = DataFrame(await get_all_etfs(use_cache=query.use_cache))
-        symbol = symbols[0]
-        if len(symbols) > 1:
-            _warn(
-                "Multiple symbols provided, but are not allowed, using the first one: "
-                + symbol
-            )
-        if ".TO" in symbol:
-            symbol = symbol.replace(".TO", "")  # noqa
-        _target = _data[_data["symbol"] == symbol]["sectors"]
-        if len(_target) > 0:
-            target = DataFrame.from_records(_target.iloc[0]).rename(
-                columns={"name": "sector", "percent": "weight"}
+        tables = get_etf_tables(await get_etf_universe(use_cache=query.use_cache))
+        rows = lookup_etf_rows(tables, symbols)
+        if len(symbols) == 1 and not query.weights:
+            if len(rows) > 0:
+                target = take_etf_children(tables, "sectors", rows).drop(
+                    columns=["fund"]
+                )
+            return target.to_dict(orient="records")
+
+        # Each fund, and the portfolio, has a row for each of its sectors.
+        exposures = get_etf_exposures(tables, "sectors", rows)
+        if query.weights:
+            portfolio = parse_portfolio(symbols, query.weights)
+            exposures.loc["portfolio"] = look_through_etf_exposure(
+                tables, "sectors", portfolio
             )
-        return target.to_dict(orient="records")
+        target = exposures.stack().rename("weight").reset_index()
+        target = target[target["weight"].notna()]
+        if target.empty:
+            return []
+        return target[["sector", "weight", "symbol"]].to_dict(orient="records")
 
     @staticmethod
     def transform_data(data: List[Dict], **kwargs: Any) -> List[TmxEtfSectorsData]:
@@ -8,7 +8,7 @@ from openbb_core.provider.standard_models.index_constituents import (
     IndexConstituentsQueryParams,
 )
 from openbb_core.provider.utils.errors import EmptyDataError
-from openbb_tmx.utils.helpers import get_data_from_url, tmx_indices_backend
+from openbb_tmx.utils.indices import get_index_children, get_indices_model
 from pydantic import Field, field_validator
 
 
@@ -62,35 +62,23 @@ class TmxIndexConstituentsFetcher(
         query: TmxIndexConstituentsQueryParams,
         credentials: Optional[Dict[str, str]],
         **kwargs: Any,
-    ) -> Dict:
+    ) -> List[Dict]:
         """Return the raw data from the TMX endpoint."""
 
-        url = "https://tmxinfoservices.com/files/indices/sptsx-indices.json"
-
-        data = await get_data_from_url(
-            url,
-            use_cache=query.use_cache,
-            backend=tmx_indices_backend,
-        )
+        model = await get_indices_model(use_cache=query.use_cache)
+        if not model:
+            raise EmptyDataError
+        if query.index not in model["symbols"]:
+            raise ValueError(f"Index {query.index} was not found.  Check the symbol.")
+        results = get_index_children(model, "constituents", query.index)
+        if not results:
+            raise ValueError(f"No constituents found for index, {query.index}")
 
-        return data
+        return results
 
     @staticmethod
     def transform_data(
-        query: TmxIndexConstituentsQueryParams, data: Dict, **kwargs
+        query: TmxIndexConstituentsQueryParams, data: List[Dict], **kwargs
     ) -> List[TmxIndexConstituentsData]:
         """Return the transformed data."""
-        results = []
-        data = data.copy()
-        if data == {}:
-            raise EmptyDataError
-        if query.index not in data.get("indices"):  # type: ignore
-            raise ValueError(f"Index {query.index} was not found.  Check the symbol.")
-        index_data = data["indices"][query.index]
-        if (
-            index_data.get("nb_constituents") == 0
-            or index_data.get("constituents") is None
-        ):
-            raise ValueError(f"No constituents found for index, {query.index}")
-        results = index_data["constituents"]
-        return [TmxIndexConstituentsData.model_validate(d) for d in results]
+        return [TmxIndexConstituentsData.model_validate(d) for d in data]
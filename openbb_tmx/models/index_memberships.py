@@ -0,0 +1,98 @@
+"""TMX Index Memberships fetcher."""
+
+from typing import Any, Dict, List, Optional
+
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.abstract.query_params import QueryParams
+from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_tmx.utils.helpers import validate_models
+from openbb_tmx.utils.indices import get_indices_model, lookup_index_memberships
+from pydantic import Field, field_validator
+
+
+class TmxIndexMembershipsQueryParams(QueryParams):
+    """TMX Index Memberships query.
+
+    Source: https://www.tmx.com/
+    """
+
+    symbol: str = Field(
+        description="The ticker symbol of the constituent. Multiple comma separated items allowed.",
+    )
+    use_cache: bool = Field(
+        default=True,
+        description="Whether to use a cached request."
+        + " Index data is from a single JSON file, updated each day after close."
+        + " It is cached for one day. To bypass, set to False.",
+    )
+
+
+class TmxIndexMembershipsData(Data):
+    """TMX Index Memberships Data."""
+
+    __alias_dict__ = {
+        "market_value": "quotedmarketvalue",
+    }
+
+    security: str = Field(description="The ticker symbol searched.")
+    index: str = Field(description="The ticker symbol of the index.")
+    index_name: Optional[str] = Field(
+        description="The name of the index.", default=None
+    )
+    symbol: Optional[str] = Field(
+        description="The ticker symbol of the constituent.", default=None
+    )
+    name: Optional[str] = Field(
+        description="The name of the constituent.", default=None
+    )
+    weight: Optional[float] = Field(
+        default=None,
+        description="The weight of the constituent in the index, as a normalized percentage.",
+    )
+    market_value: Optional[float] = Field(
+        default=None,
+        description="The quoted market value of the constituent.",
+    )
+
+    @field_validator("weight", mode="before", check_fields=False)
+    @classmethod
+    def normalize_percent(cls, v):
+        """Return percents as normalized percentage points."""
+        return round(float(v) / 100, 6) if v else None
+
+
+class TmxIndexMembershipsFetcher(
+    Fetcher[
+        TmxIndexMembershipsQueryParams,
+        List[TmxIndexMembershipsData],
+    ]
+):
+    """Transform the query, extract and transform the data from the TMX endpoints."""
+
+    @staticmethod
+    def transform_query(params: Dict[str, Any]) -> TmxIndexMembershipsQueryParams:
+        """Transform the query."""
+        return TmxIndexMembershipsQueryParams(**params)
+
+    @staticmethod
+    async def aextract_data(
+        query: TmxIndexMembershipsQueryParams,
+        credentials: Optional[Dict[str, str]],
+        **kwargs: Any,
+    ) -> List[Dict]:
+        """Return the raw data from the TMX endpoint."""
+        model = await get_indices_model(use_cache=query.use_cache)
+        if not model:
+            raise EmptyDataError
+        members = lookup_index_memberships(model, query.symbol.split(","))
+        if members.empty:
+            raise EmptyDataError(f"No indices were found with: {query.symbol}")
+        return members.astype(object).where(members.notna(), None).to_dict("records")
+
+    @staticmethod
+    def transform_data(
+        data: List[Dict], **kwargs: Any
+    ) -> List[TmxIndexMembershipsData]:
+        """Transform the data to the standard format."""
+        return validate_models(TmxIndexMembershipsData, data)
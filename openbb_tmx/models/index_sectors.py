@@ -8,7 +8,7 @@ from openbb_core.provider.standard_models.index_sectors import (
     IndexSectorsQueryParams,
 )
 from openbb_core.provider.utils.errors import EmptyDataError
-from openbb_tmx.utils.helpers import get_data_from_url, tmx_indices_backend
+from openbb_tmx.utils.indices import get_index_children, get_indices_model
 from pydantic import Field, field_validator
 
 
@@ -52,40 +52,18 @@ class TmxIndexSectorsFetcher(
         query: TmxIndexSectorsQueryParams,
         credentials: Optional[Dict[str, str]],
         **kwargs: Any,
-    ) -> Dict:
+    ) -> List[Dict]:
         """Return the raw data from the TMX endpoint."""
 
-        url = "https://tmxinfoservices.com/files/indices/sptsx-indices.json"
-
-        data = await get_data_from_url(
-            url,
-            use_cache=query.use_cache,
-            backend=tmx_indices_backend,
-        )
+        model = await get_indices_model(use_cache=query.use_cache)
+        if not model:
+            raise EmptyDataError
 
-        return data
+        return get_index_children(model, "sectors", query.symbol)
 
     @staticmethod
     def transform_data(
-        query: TmxIndexSectorsQueryParams, data: Dict, **kwargs: Any
+        query: TmxIndexSectorsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[TmxIndexSectorsData]:
         """Return the transformed data."""
-        results = []
-        data = data.copy()
-        if data == {}:
-            raise EmptyDataError
-        if (
-            query.symbol in data["indices"]
-            and "sectors" in data["indices"][query.symbol]
-        ):
-            temp = data["indices"][query.symbol].get("sectors")
-            results = [
-                {
-                    "sector": d.get("name").lower().replace(" ", "_"),
-                    "weight": d.get("weight"),
-                }
-                for d in temp
-                if temp is not None
-            ]
-
-        return [TmxIndexSectorsData.model_validate(d) for d in results]
+        return [TmxIndexSectorsData.model_validate(d) for d in data]
@@ -1,5 +1,5 @@
 """TMX Index Snapshots Model"""
-import json
+
 from typing import Any, Dict, List, Literal, Optional
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -8,13 +8,7 @@ from openbb_core.provider.standard_models.index_snapshots import (
     IndexSnapshotsQueryParams,
 )
 from openbb_core.provider.utils.errors import EmptyDataError
-from openbb_tmx.utils import gql
-from openbb_tmx.utils.helpers import (
-    get_data_from_url,
-    tmx_indices_backend,
-    get_data_from_gql,
-    get_random_agent,
-)
+from openbb_tmx.utils.indices import get_index_snapshots
 from pydantic import Field, field_validator
 
 
@@ -133,69 +127,9 @@ class TmxIndexSnapshotsFetcher(
         **kwargs: Any,
     ) -> List[Dict]:
         """Return the raw data from the TMX endpoint."""
-        url = "https://tmxinfoservices.com/files/indices/sptsx-indices.json"
-        user_agent = get_random_agent()
-        data = await get_data_from_url(
-            url,
-            use_cache=query.use_cache,
-            backend=tmx_indices_backend,
-        )
-        results = []
-        if not data:
+        results = await get_index_snapshots(use_cache=query.use_cache)
+        if not results:
             raise EmptyDataError
-        symbols = []
-
-        for symbol in data["indices"]:
-            symbols.append(symbol)
-            new_data = {}
-            performance = data["indices"][symbol].get("performance", {})
-            market_value = data["indices"][symbol].get("quotedmarketvalue", {})
-            new_data.update(
-                {
-                    "symbol": symbol,
-                    "name": data["indices"][symbol].get("name_en", None),
-                    "currency": "USD"
-                    if "(USD)" in data["indices"][symbol]["name_en"]
-                    else "CAD",
-                    **performance,
-                    **market_value,
-                }
-            )
-            results.append(new_data)
-
-        # Get current levels for each index.
-
-        payload = gql.get_quote_for_symbols_payload.copy()
-        payload["variables"]["symbols"] = symbols
-
-        url = "https://app-money.tmx.com/graphql"
-        response = await get_data_from_gql(
-            method="POST",
-            url=url,
-            data=json.dumps(payload),
-            headers={
-                "authority": "app-money.tmx.com",
-                "referer": f"https://money.tmx.com/en/quote/{symbol}",  # type: ignore
-                "locale": "en",
-                "Content-Type": "application/json",
-                "User-Agent": user_agent,
-                "Accept": "*/*",
-            },
-            timeout=5,
-        )
-        if response.get("data") and response["data"].get("getQuoteForSymbols"):
-            quote_data = response["data"]["getQuoteForSymbols"]
-            [d.pop("percentChange") for d in quote_data]
-            merged_list = [
-                {
-                    **d1,
-                    **next(
-                        (d2 for d2 in quote_data if d2["symbol"] == d1["symbol"]), {}
-                    ),
-                }
-                for d1 in results
-            ]
-            results = merged_list
 
         return results
 
@@ -0,0 +1,113 @@
+"""TMX News Search fetcher."""
+
+from datetime import (
+    date as dateType,
+    datetime,
+)
+from typing import Any, Dict, List, Optional
+
+import pytz
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.abstract.query_params import QueryParams
+from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
+from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_tmx.utils.helpers import run_parser, validate_models
+from openbb_tmx.utils.news import search_news_index
+from pydantic import Field, field_validator
+
+
+class TmxNewsSearchQueryParams(QueryParams):
+    """TMX News Search query.
+
+    Searches the news already fetched by the company news fetcher, stored in a local index.
+    """
+
+    query: Optional[str] = Field(
+        default=None,
+        description="The words to search for in the headlines. Every word must match."
+        + " End a word with '*' to match it as a prefix.",
+    )
+    symbol: Optional[str] = Field(
+        default=None,
+        description="The ticker symbol of the news. Multiple comma separated items allowed."
+        + " Default is all symbols.",
+    )
+    start_date: Optional[dateType] = Field(
+        default=None, description=QUERY_DESCRIPTIONS.get("start_date", "")
+    )
+    end_date: Optional[dateType] = Field(
+        default=None, description=QUERY_DESCRIPTIONS.get("end_date", "")
+    )
+    limit: Optional[int] = Field(
+        default=100, description="The maximum number of items to return."
+    )
+
+
+class TmxNewsSearchData(Data):
+    """TMX News Search Data."""
+
+    __alias_dict__ = {
+        "date": "datetime",
+        "title": "headline",
+    }
+
+    date: datetime = Field(description="The date of the news.")
+    title: str = Field(description="The headline of the news.")
+    source: Optional[str] = Field(description="Source of the news.", default=None)
+    symbols: Optional[str] = Field(
+        description="The ticker symbols of the news, comma separated.", default=None
+    )
+    url: Optional[str] = Field(description="The URL of the news.", default=None)
+
+    @field_validator("date", mode="before", check_fields=False)
+    @classmethod
+    def date_validate(cls, v):  # pylint: disable=E0213
+        """Validate the datetime format."""
+        dt = datetime.strptime(v, "%Y-%m-%dT%H:%M:%S%z")
+        return dt.astimezone(pytz.timezone("America/New_York"))
+
+
+class TmxNewsSearchFetcher(
+    Fetcher[
+        TmxNewsSearchQueryParams,
+        List[TmxNewsSearchData],
+    ]
+):
+    """Transform the query, extract and transform the data from the local news index."""
+
+    @staticmethod
+    def transform_query(params: Dict[str, Any]) -> TmxNewsSearchQueryParams:
+        """Transform the query."""
+        return TmxNewsSearchQueryParams(**params)
+
+    @staticmethod
+    async def aextract_data(
+        query: TmxNewsSearchQueryParams,
+        credentials: Optional[Dict[str, str]],
+        **kwargs: Any,
+    ) -> List[Dict]:
+        """Return the raw data from the local news index."""
+        news = await run_parser(
+            search_news_index,
+            query.query,
+            query.symbol.split(",") if query.symbol else None,
+            query.start_date,
+            query.end_date,
+            query.limit,
+        )
+        if not news:
+            raise EmptyDataError(
+                "No news was found. The index only has the news fetched with the company news fetcher."
+            )
+        for item in news:
+            symbol = (item.get("symbols") or "").split(",")[0]
+            item["url"] = (
+                f"https://money.tmx.com/quote/{symbol}/news/{item.pop('newsid')}"
+            )
+        return news
+
+    @staticmethod
+    def transform_data(data: List[Dict], **kwargs: Any) -> List[TmxNewsSearchData]:
+        """Transform the data to the standard format."""
+        return validate_models(TmxNewsSearchData, data)
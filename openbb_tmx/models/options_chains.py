@@ -6,7 +6,14 @@ from datetime import (
 )
 from typing import Any, Dict, List, Optional
 
-from openbb_tmx.utils.helpers import download_eod_chains, get_current_options
+from openbb_tmx.utils.black_scholes import GREEKS_COLUMNS, add_greeks
+from openbb_tmx.utils.helpers import (
+    download_eod_chains,
+    get_current_options,
+    get_options_chains_table,
+    parse_unique_dates,
+    validate_models,
+)
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.options_chains import (
     OptionsChainsData,
@@ -24,6 +31,11 @@ class TmxOptionsChainsQueryParams(OptionsChainsQueryParams):
     Source: https://www.Tmx.com/
     """
 
+    symbol: str = Field(
+        description=QUERY_DESCRIPTIONS.get("symbol", "")
+        + " Multiple comma separated items allowed, or 'all' for every listing on the Montréal Exchange."
+    )
+
     date: Optional[dateType] = Field(
         description=QUERY_DESCRIPTIONS.get("date", ""),
         default=None,
@@ -33,11 +45,34 @@ class TmxOptionsChainsQueryParams(OptionsChainsQueryParams):
         description="Caching is used to validate the supplied ticker symbol, or if a historical EOD chain is requested."
         + " To bypass, set to False.",
     )
+    greeks: bool = Field(
+        default=False,
+        description="Calculate the implied volatility and greeks with the Black-Scholes model."
+        + " The implied volatility of historical EOD chains is from the exchange, when available.",
+    )
+    risk_free_rate: float = Field(
+        default=0.0,
+        description="The annualized risk-free rate, as a normalized percent, used to calculate the greeks.",
+    )
+    dividend_yield: float = Field(
+        default=0.0,
+        description="The annualized dividend yield of the underlying, as a normalized percent, used to calculate the greeks.",
+    )
 
 
 class TmxOptionsChainsData(OptionsChainsData):
     """TMX Options Chains Data."""
 
+    underlying_symbol: Optional[str] = Field(
+        description="Symbol of the underlying, when the chains of multiple underlyings are requested.",
+        default=None,
+    )
+
+    exchange_symbol: Optional[str] = Field(
+        description="The exchange's own symbol for the contract, in historical EOD chains."
+        + " The contract symbol is encoded in the same OCC format as the current chains.",
+        default=None,
+    )
     transactions: Optional[int] = Field(
         description="Number of transactions for the contract.", default=None
     )
@@ -58,6 +93,8 @@ class TmxOptionsChainsData(OptionsChainsData):
     @classmethod
     def date_validate(cls, v):  # pylint: disable=E0213
         """Return the datetime object from the date string"""
+        if isinstance(v, (datetime, dateType)):
+            return v
         return datetime.strptime(v, "%Y-%m-%d")
 
 
@@ -82,11 +119,27 @@ class TmxOptionsChainsFetcher(
     ) -> List[Dict]:
         """Return the data."""
         results = []
-        if query.date is not None:
+        if "," in query.symbol or query.symbol.lower() == "all":
+            chains = await get_options_chains_table(
+                query.symbol, date=query.date, use_cache=query.use_cache
+            )
+        elif query.date is not None:
             chains = await download_eod_chains(symbol=query.symbol, date=query.date, use_cache=query.use_cache)  # type: ignore
         else:
             chains = await get_current_options(query.symbol, use_cache=query.use_cache)
 
+        if not chains.empty and query.greeks is True:
+            chains = add_greeks(
+                chains,
+                risk_free_rate=query.risk_free_rate,
+                dividend_yield=query.dividend_yield,
+            )
+            chains[GREEKS_COLUMNS] = (
+                chains[GREEKS_COLUMNS]
+                .astype(object)
+                .where(chains[GREEKS_COLUMNS].notna(), None)
+            )
+
         if not chains.empty:
             results = chains.to_dict(orient="records")
 
@@ -95,8 +148,10 @@ class TmxOptionsChainsFetcher(
     @staticmethod
     def transform_data(
         query: TmxOptionsChainsQueryParams,
-        data: dict,
+        data: List[Dict],
         **kwargs: Any,
     ) -> List[TmxOptionsChainsData]:
         """Transform the data and validate the model."""
-        return [TmxOptionsChainsData.model_validate(d) for d in data]
+        # A chain only has a handful of expirations, so each is parsed once.
+        parse_unique_dates(data, "expiration")
+        return validate_models(TmxOptionsChainsData, data)
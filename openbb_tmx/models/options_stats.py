@@ -0,0 +1,264 @@
+"""TMX Options Statistics Model."""
+
+import asyncio
+import shutil
+from datetime import (
+    date as dateType,
+    datetime,
+)
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.abstract.query_params import QueryParams
+from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
+from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_core.provider.utils.helpers import to_snake_case
+from openbb_tmx.utils.helpers import (
+    cache_dir,
+    get_data_from_url,
+    run_parser,
+    validate_models,
+)
+from openpyxl import load_workbook
+from pydantic import Field
+
+# Monthly Options Volume and Open Interest Stats, by the year and month as YYMM.
+OPTIONS_STATS_URL = "https://www.m-x.ca/f_stat_en/{month}_stats_en.xlsx"
+
+# The number of rows at the top of a worksheet searched for the header row.
+HEADER_SEARCH_ROWS = 20
+
+
+class TmxOptionsStatsQueryParams(QueryParams):
+    """TMX Options Statistics Query Params."""
+
+    start_date: Optional[dateType] = Field(
+        default=None,
+        description=QUERY_DESCRIPTIONS.get("start_date", "")
+        + " Statistics are monthly. Default is the previous month.",
+    )
+    end_date: Optional[dateType] = Field(
+        default=None,
+        description=QUERY_DESCRIPTIONS.get("end_date", "")
+        + " Default is the previous month.",
+    )
+    sheet: Optional[str] = Field(
+        default=None,
+        description="The name of the worksheet to return, in snake case. Default is all worksheets.",
+    )
+
+
+class TmxOptionsStatsData(Data):
+    """TMX Options Statistics Data.
+
+    The columns of each worksheet are returned as additional fields.
+    """
+
+    date: dateType = Field(description="The first day of the month of the statistics.")
+    sheet: str = Field(description="The name of the worksheet, in snake case.")
+
+
+def get_options_stats_archive() -> Path:
+    """Gets the directory of the local options statistics archive.
+
+    Each month is stored as a directory, `{archive}/{YYYY-MM}/`, with a file for each worksheet.
+    Published months do not change, so they are never downloaded again.
+    """
+    return Path(cache_dir).joinpath("tmx", "options_stats")
+
+
+def _find_header(rows: List[tuple]) -> int:
+    """Return the position of the header row, the widest row of labels near the top of the sheet."""
+    best, width = 0, 0
+    for i, row in enumerate(rows):
+        labels = [c for c in row if isinstance(c, str) and c.strip()]
+        if len(labels) > width and len(labels) * 2 >= len([c for c in row if c]):
+            best, width = i, len(labels)
+    return best
+
+
+def _column_names(header: tuple) -> List[str]:
+    """Return unique, snake case, column names."""
+    names: List[str] = []
+    for i, label in enumerate(header):
+        name = to_snake_case(str(label).strip()) if label not in (None, "") else ""
+        name = name or f"column_{i}"
+        names.append(name if name not in names else f"{name}_{i}")
+    return names
+
+
+def parse_options_stats(content: bytes) -> Dict[str, pd.DataFrame]:
+    """Parses the monthly statistics workbook, streaming the rows of each worksheet.
+
+    Parameters
+    ----------
+    content: bytes
+        The XLSX file.
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        Dictionary of the table in each worksheet, by the worksheet name in snake case.
+    """
+    workbook = load_workbook(BytesIO(content), read_only=True, data_only=True)
+    tables: Dict[str, pd.DataFrame] = {}
+    try:
+        for worksheet in workbook.worksheets:
+            rows = worksheet.iter_rows(values_only=True)
+            top: List[tuple] = []
+            for row in rows:
+                top.append(row)
+                if len(top) == HEADER_SEARCH_ROWS:
+                    break
+            if not top:
+                continue
+            position = _find_header(top)
+            header = top[position]
+            columns = _column_names(header)
+            records = []
+            for row in [*top[position + 1 :], *rows]:
+                if not any(c not in (None, "") for c in row) or row == header:
+                    continue
+                records.append(row[: len(columns)])
+            if records:
+                name = to_snake_case(worksheet.title.strip()) or worksheet.title
+                table = pd.DataFrame.from_records(records, columns=columns)
+                # Unlabelled columns are formatting, unless they have values.
+                empty = [
+                    c
+                    for c in table.columns
+                    if c.startswith("column_") and table[c].isna().all()
+                ]
+                tables[name] = table.drop(columns=empty)
+    finally:
+        workbook.close()
+
+    return tables
+
+
+def _write_month(archive: Path, month: str, tables: Dict[str, pd.DataFrame]) -> None:
+    """Saves the tables of a month to the archive, replacing the month as a whole."""
+    target = archive.joinpath(month)
+    temp = archive.joinpath(f".{month}.tmp")
+    shutil.rmtree(temp, ignore_errors=True)
+    temp.mkdir(parents=True)
+    for name, table in tables.items():
+        table.to_csv(temp.joinpath(f"{name}.csv.gz"), index=False)
+    shutil.rmtree(target, ignore_errors=True)
+    temp.rename(target)
+
+
+def read_options_stats_archive(
+    archive: Path, months: List[str], sheet: Optional[str] = None
+) -> pd.DataFrame:
+    """Reads the archived statistics for a list of months, as YYYY-MM strings."""
+    tables = []
+    for month in months:
+        for file in sorted(archive.joinpath(month).glob("*.csv.gz")):
+            name = file.name[: -len(".csv.gz")]
+            if sheet is not None and name != sheet:
+                continue
+            table = pd.read_csv(file)
+            table.insert(0, "sheet", name)
+            table.insert(0, "date", f"{month}-01")
+            tables.append(table)
+
+    return pd.concat(tables, ignore_index=True) if tables else pd.DataFrame()
+
+
+async def get_options_stats(
+    start_date: Optional[dateType] = None,
+    end_date: Optional[dateType] = None,
+    sheet: Optional[str] = None,
+) -> pd.DataFrame:
+    """Gets the monthly options volume and open interest statistics.
+
+    Months already in the local archive are read from disk, and only the missing months are downloaded.
+
+    Parameters
+    ----------
+    start_date: Optional[date]
+        Any date in the first month. Default is the previous month.
+    end_date: Optional[date]
+        Any date in the last month. Default is the previous month.
+    sheet: Optional[str]
+        The name of the worksheet, in snake case. Default is all worksheets.
+
+    Returns
+    -------
+    pd.DataFrame
+        The statistics of each month, with "date" and "sheet" columns.
+    """
+    last_month = (pd.Timestamp.now().to_period("M") - 1).to_timestamp()
+    end = pd.Timestamp(end_date or last_month).to_period("M")
+    start = pd.Timestamp(start_date or end.to_timestamp()).to_period("M")
+    # The statistics of the current month are not published until it is complete.
+    end = min(end, last_month.to_period("M"))
+    months = [p.strftime("%Y-%m") for p in pd.period_range(start, end, freq="M")]
+    archive = get_options_stats_archive()
+
+    async def create_task(month: str) -> None:
+        """Download and archive a single month."""
+        url = OPTIONS_STATS_URL.format(
+            month=datetime.strptime(month, "%Y-%m").strftime("%y%m")
+        )
+        content = await get_data_from_url(url, use_cache=False)
+        # A month that is not published returns an HTML page instead of the workbook.
+        if not isinstance(content, bytes) or not content.startswith(b"PK"):
+            return
+        tables = await run_parser(parse_options_stats, content)
+        if tables:
+            await run_parser(_write_month, archive, month, tables)
+
+    missing = [month for month in months if not archive.joinpath(month).exists()]
+    await asyncio.gather(*[create_task(month) for month in missing])
+
+    return await run_parser(read_options_stats_archive, archive, months, sheet)
+
+
+class TmxOptionsStatsFetcher(
+    Fetcher[
+        TmxOptionsStatsQueryParams,
+        List[TmxOptionsStatsData],
+    ]
+):
+    """Transform the query, extract and transform the data from the TMX endpoints."""
+
+    @staticmethod
+    def transform_query(params: Dict[str, Any]) -> TmxOptionsStatsQueryParams:
+        """Transform the query."""
+        return TmxOptionsStatsQueryParams(**params)
+
+    @staticmethod
+    async def aextract_data(
+        query: TmxOptionsStatsQueryParams,
+        credentials: Optional[Dict[str, str]],
+        **kwargs: Any,
+    ) -> List[Dict]:
+        """Return the raw data from the TMX endpoint."""
+        data = await get_options_stats(
+            start_date=query.start_date, end_date=query.end_date, sheet=query.sheet
+        )
+        if data.empty:
+            raise EmptyDataError()
+        results: List[Dict] = []
+        # Each worksheet has its own columns.
+        for _, table in data.groupby(["date", "sheet"], sort=False):
+            table = table.dropna(axis=1, how="all")
+            results.extend(
+                table.astype(object).where(table.notna(), None).to_dict("records")
+            )
+        return results
+
+    @staticmethod
+    def transform_data(
+        query: TmxOptionsStatsQueryParams,
+        data: List[Dict],
+        **kwargs: Any,
+    ) -> List[TmxOptionsStatsData]:
+        """Return the transformed data."""
+        return validate_models(TmxOptionsStatsData, data)
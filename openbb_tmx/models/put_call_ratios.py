@@ -1,26 +1,292 @@
-import requests
-from pandas import read_csv
-from io import BytesIO
+"""TMX Put/Call Ratios Model."""
 
+import json
+import warnings
+from datetime import (
+    date as dateType,
+    datetime,
+)
+from io import StringIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
-def get_pcr(index: bool = False):
-    """Gets historical equity and index put-call ratios from TMX."""
+import pandas as pd
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.abstract.query_params import QueryParams
+from openbb_core.provider.utils.descriptions import (
+    DATA_DESCRIPTIONS,
+    QUERY_DESCRIPTIONS,
+)
+from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_core.provider.utils.helpers import run_async, to_snake_case
+from openbb_tmx.utils.helpers import (
+    cache_dir,
+    get_data_from_url,
+    run_parser,
+    validate_models,
+)
+from pydantic import Field
 
-    url = (
-        "https://www.m-x.ca/files/ratio-sxo.csv"
-        if index is True
-        else "https://www.m-x.ca/files/ratio-equity.csv"
+PCR_URLS = {
+    "equity": "https://www.m-x.ca/files/ratio-equity.csv",
+    "index": "https://www.m-x.ca/files/ratio-sxo.csv",
+}
+
+
+class TmxPutCallRatiosQueryParams(QueryParams):
+    """TMX Put/Call Ratios Query Params."""
+
+    index: bool = Field(
+        default=False,
+        description="Get the ratios for S&P/TSX 60 index options (SXO), instead of all equity options.",
+    )
+    start_date: Optional[dateType] = Field(
+        default=None, description=QUERY_DESCRIPTIONS.get("start_date", "")
+    )
+    end_date: Optional[dateType] = Field(
+        default=None, description=QUERY_DESCRIPTIONS.get("end_date", "")
+    )
+    use_cache: bool = Field(
+        default=True,
+        description="The history is stored locally, and only the rows newer than the last stored date are added."
+        + " To download the complete history again, set to False.",
+    )
+
+
+class TmxPutCallRatiosData(Data):
+    """TMX Put/Call Ratios Data."""
+
+    date: dateType = Field(description=DATA_DESCRIPTIONS.get("date", ""))
+    call_volume: Optional[int] = Field(
+        default=None, description="The volume of call options traded."
+    )
+    put_volume: Optional[int] = Field(
+        default=None, description="The volume of put options traded."
     )
-    r = requests.get(url, timeout=5)
+    total_volume: Optional[int] = Field(
+        default=None, description="The total volume of options traded."
+    )
+    put_call_ratio: Optional[float] = Field(
+        default=None, description="The ratio of put volume to call volume."
+    )
+
+
+def _rename_column(column: str) -> str:
+    """Return the standardized name of a column in the ratios file."""
+    name = column.strip().lower()
+    if "ratio" in name:
+        return "put_call_ratio"
+    if "date" in name:
+        return "date"
+    if "total" in name:
+        return "total_volume"
+    if "call" in name:
+        return "call_volume"
+    if "put" in name:
+        return "put_volume"
+    return to_snake_case(name)
+
+
+def _line_date(line: str) -> Optional[str]:
+    """Return the date of a single line of the ratios file, as YYYY-MM-DD."""
+    date = pd.to_datetime(line.split(";")[0].strip(), errors="coerce")
+    return None if pd.isna(date) else date.strftime("%Y-%m-%d")
 
-    if r.status_code != 200:
-        raise RuntimeError(r.status_code)
-    data = read_csv(BytesIO(r.content), delimiter=";").iloc[:, :5]
 
-    data.columns = [d.lower() for d in data.columns.tolist()]
+def get_new_lines(lines: List[str], last_date: Optional[str]) -> List[str]:
+    """Return the lines of the ratios file dated after the last stored date.
 
+    Lines are read from the newest end of the file, stopping at the first line already stored.
+    """
+    lines = [line for line in lines if line.strip()]
+    if not lines or last_date is None:
+        return lines
+    first, last = _line_date(lines[0]), _line_date(lines[-1])
+    ascending = first is None or last is None or first <= last
+    new_lines = []
+    for line in reversed(lines) if ascending else lines:
+        date = _line_date(line)
+        if date is None:
+            continue
+        if date <= last_date:
+            break
+        new_lines.append(line)
+    return new_lines
+
+
+def _is_ascending(lines: List[str]) -> bool:
+    """Return True when the lines of the ratios file are in ascending date order."""
+    dates = [_line_date(lines[0]), _line_date(lines[-1])] if lines else []
+    return len(dates) == 2 and None not in dates and dates[0] <= dates[1]  # type: ignore
+
+
+def parse_put_call_ratios(header: str, lines: List[str]) -> pd.DataFrame:
+    """Parses lines of the ratios file."""
+    data = pd.read_csv(StringIO("\n".join([header, *lines])), delimiter=";").iloc[:, :5]
+    data.columns = [_rename_column(c) for c in data.columns.tolist()]
+    data["date"] = pd.to_datetime(data["date"], errors="coerce")
+    data = data.dropna(subset=["date"])
+    data["date"] = data["date"].dt.strftime("%Y-%m-%d")
     return data
 
 
-# Monthly Options Volume and Open Interest Stats
-# https://www.m-x.ca/f_stat_en/1907_stats_en.xlsx
+def _last_line(content: bytes) -> bytes:
+    """Return the last line of the content, with its line ending."""
+    return content[content.rfind(b"\n", 0, len(content) - 1) + 1 :]
+
+
+async def _status_callback(response, _: Any) -> Tuple[int, bytes]:
+    """Return the status code with the content of the response."""
+    return response.status, await response.read()
+
+
+async def get_put_call_ratios(
+    index: bool = False, use_cache: bool = True
+) -> pd.DataFrame:
+    """Gets the historical put/call ratios for equity or index options.
+
+    The history is kept as a local file. When the stored copy is current up to the end of the remote file,
+    only the bytes added since are requested, starting from the last stored line.
+    When that line no longer matches, the remote file was rewritten, and it is downloaded again.
+
+    Parameters
+    ----------
+    index: bool
+        Get the ratios for S&P/TSX 60 index options, instead of all equity options.
+    use_cache: bool
+        Set as False to download, and store, the complete history again.
+
+    Returns
+    -------
+    pd.DataFrame
+        The put/call ratio history, sorted by date.
+    """
+    name = "index" if index is True else "equity"
+    url = PCR_URLS[name]
+    store = Path(cache_dir).joinpath("tmx", "put_call_ratios")
+    data_file = store.joinpath(f"{name}.csv")
+    state_file = store.joinpath(f"{name}.json")
+    state: Dict[str, Any] = (
+        json.loads(state_file.read_text())
+        if use_cache is True and state_file.exists() and data_file.exists()
+        else {}
+    )
+    history = pd.read_csv(data_file) if state else pd.DataFrame()
+
+    text: Optional[str] = None
+    content: Optional[bytes] = None
+    header: str = state.get("header", "")
+    size: int = state.get("size", 0)
+    tail: bytes = state.get("tail", "").encode("utf-8")
+    # New rows are appended to the end of the file, so only the bytes after the stored copy are requested,
+    # with the last stored line as an overlap, to check that the file was not rewritten since.
+    # A server without range support answers with the whole file, which is used as is.
+    if state.get("ascending") is True and tail and size >= len(tail):
+        status, partial = await get_data_from_url(
+            url,
+            use_cache=False,
+            callback=_status_callback,
+            headers={"Range": f"bytes={size - len(tail)}-"},
+        )
+        if status == 206 and partial.startswith(tail):
+            text = partial[len(tail) :].decode("utf-8", errors="replace")
+            size += len(partial) - len(tail)
+            tail = _last_line(partial)
+        elif status == 200:
+            content = partial
+    if text is None:
+        if content is None:
+            status, content = await get_data_from_url(
+                url, use_cache=False, callback=_status_callback
+            )
+            if status != 200:
+                raise RuntimeError(f"Error with the request: {status}")
+        size = len(content)  # type: ignore
+        tail = _last_line(content)  # type: ignore
+        header, text = (
+            content.decode("utf-8", errors="replace").split("\n", 1) + [""]  # type: ignore
+        )[:2]
+        header = header.strip()
+
+    # The rows of a complete file take precedence over the stored rows, in case they were revised.
+    lines = get_new_lines(
+        text.splitlines(), state.get("last_date") if content is None else None
+    )
+    if lines:
+        new = await run_parser(parse_put_call_ratios, header, lines)
+        history = (
+            pd.concat([history, new])
+            .drop_duplicates(subset=["date"], keep="last")
+            .sort_values("date")
+            .reset_index(drop=True)
+        )
+        store.mkdir(parents=True, exist_ok=True)
+        history.to_csv(data_file, index=False)
+
+    if not history.empty:
+        dates = history["date"].astype(str)
+        state = {
+            "size": size,
+            "tail": tail.decode("utf-8", errors="replace"),
+            "header": header,
+            "last_date": dates.iloc[-1],
+            "ascending": state.get("ascending", _is_ascending(lines)),
+            "updated": datetime.now().isoformat(),
+        }
+        store.mkdir(parents=True, exist_ok=True)
+        state_file.write_text(json.dumps(state))
+
+    return history
+
+
+def get_pcr(index: bool = False) -> pd.DataFrame:
+    """Gets historical equity and index put-call ratios from TMX.
+
+    Deprecated, use `get_put_call_ratios`. The columns are those of `TmxPutCallRatiosData`.
+    """
+    warnings.warn(
+        "get_pcr is deprecated, use get_put_call_ratios instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    return run_async(get_put_call_ratios, index, False)
+
+
+class TmxPutCallRatiosFetcher(
+    Fetcher[
+        TmxPutCallRatiosQueryParams,
+        List[TmxPutCallRatiosData],
+    ]
+):
+    """Transform the query, extract and transform the data from the TMX endpoints."""
+
+    @staticmethod
+    def transform_query(params: Dict[str, Any]) -> TmxPutCallRatiosQueryParams:
+        """Transform the query."""
+        return TmxPutCallRatiosQueryParams(**params)
+
+    @staticmethod
+    async def aextract_data(
+        query: TmxPutCallRatiosQueryParams,
+        credentials: Optional[Dict[str, str]],
+        **kwargs: Any,
+    ) -> List[Dict]:
+        """Return the raw data from the TMX endpoint."""
+        data = await get_put_call_ratios(index=query.index, use_cache=query.use_cache)
+        if data.empty:
+            raise EmptyDataError()
+        if query.start_date is not None:
+            data = data[data["date"] >= query.start_date.strftime("%Y-%m-%d")]
+        if query.end_date is not None:
+            data = data[data["date"] <= query.end_date.strftime("%Y-%m-%d")]
+        return data.astype(object).where(data.notna(), None).to_dict("records")
+
+    @staticmethod
+    def transform_data(
+        query: TmxPutCallRatiosQueryParams,
+        data: List[Dict],
+        **kwargs: Any,
+    ) -> List[TmxPutCallRatiosData]:
+        """Return the transformed data."""
+        return validate_models(TmxPutCallRatiosData, data)
@@ -0,0 +1,355 @@
+"""TMX Black-Scholes Module.
+
+Vectorized implied volatility and greeks for complete options chains.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# The columns added to an options chain by `add_greeks`.
+GREEKS_COLUMNS = ["implied_volatility", "delta", "gamma", "theta", "vega", "rho"]
+
+
+def norm_pdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal probability density function."""
+    return np.exp(-0.5 * x * x) / np.sqrt(2 * np.pi)
+
+
+# Coefficients of the Chebyshev approximation of erfc, from the highest order.
+ERFC_COEFFICIENTS = [
+    0.17087277,
+    -0.82215223,
+    1.48851587,
+    -1.13520398,
+    0.27886807,
+    -0.18628806,
+    0.09678418,
+    0.37409196,
+    1.00002368,
+    -1.26551223,
+]
+
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal cumulative distribution function.
+
+    Uses the Chebyshev approximation of the complementary error function,
+    with a fractional error less than 1.2e-7 everywhere.
+    """
+    z = np.abs(x) / np.sqrt(2)
+    t = 1 / (1 + 0.5 * z)
+    poly = np.zeros_like(t)
+    for c in ERFC_COEFFICIENTS:
+        poly = c + t * poly
+    erfc = t * np.exp(-z * z + poly)
+    return np.where(x >= 0, 1 - 0.5 * erfc, 0.5 * erfc)
+
+
+def _d1_d2(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    q: np.ndarray,
+    sigma: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the d1 and d2 terms of the Black-Scholes formula."""
+    vol = sigma * np.sqrt(T)
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / vol
+    return d1, d1 - vol
+
+
+def black_scholes_price(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    sigma: np.ndarray,
+    is_call: np.ndarray,
+    r: float = 0.0,
+    q: float = 0.0,
+) -> np.ndarray:
+    """Black-Scholes price of European options.
+
+    Parameters
+    ----------
+    S: np.ndarray
+        The price of the underlying asset.
+    K: np.ndarray
+        The strike price.
+    T: np.ndarray
+        The time to expiration, in years.
+    sigma: np.ndarray
+        The annualized volatility, as a normalized percent.
+    is_call: np.ndarray
+        True for calls, False for puts.
+    r: float
+        The annualized risk-free rate, as a normalized percent.
+    q: float
+        The annualized dividend yield, as a normalized percent.
+
+    Returns
+    -------
+    np.ndarray
+        The option prices.
+    """
+    d1, d2 = _d1_d2(S, K, T, r, q, sigma)  # type: ignore
+    spot = S * np.exp(-q * T)
+    strike = K * np.exp(-r * T)
+    call = spot * norm_cdf(d1) - strike * norm_cdf(d2)
+    put = strike * norm_cdf(-d2) - spot * norm_cdf(-d1)
+    return np.where(is_call, call, put)
+
+
+def implied_volatility(
+    price: np.ndarray,
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    is_call: np.ndarray,
+    r: float = 0.0,
+    q: float = 0.0,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    lower: float = 1e-4,
+    upper: float = 5.0,
+) -> np.ndarray:
+    """Solve for the implied volatility of a batch of options at once.
+
+    Each contract takes a Newton step when it stays inside the contract's bracket,
+    and a bisection step otherwise. Contracts are removed from the batch as they converge.
+
+    Parameters
+    ----------
+    price: np.ndarray
+        The market price of the option.
+    S: np.ndarray
+        The price of the underlying asset.
+    K: np.ndarray
+        The strike price.
+    T: np.ndarray
+        The time to expiration, in years.
+    is_call: np.ndarray
+        True for calls, False for puts.
+    r: float
+        The annualized risk-free rate, as a normalized percent.
+    q: float
+        The annualized dividend yield, as a normalized percent.
+    tol: float
+        The price tolerance for convergence.
+    max_iter: int
+        The maximum number of iterations.
+    lower: float
+        The lowest volatility considered.
+    upper: float
+        The highest volatility considered.
+
+    Returns
+    -------
+    np.ndarray
+        The implied volatility, as a normalized percent. NaN where there is no solution.
+    """
+    price, S, K, T, is_call = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (price, S, K, T)),
+        np.asarray(is_call, dtype=bool),
+    )
+    price, S, K, T = (a.astype(float).copy() for a in (price, S, K, T))
+
+    # The price must be inside the no-arbitrage bounds to have a solution.
+    spot = S * np.exp(-q * T)
+    strike = K * np.exp(-r * T)
+    with np.errstate(invalid="ignore"):
+        intrinsic = np.where(
+            is_call, np.maximum(spot - strike, 0), np.maximum(strike - spot, 0)
+        )
+        bound = np.where(is_call, spot, strike)
+        valid = (
+            np.isfinite(price)
+            & np.isfinite(S)
+            & np.isfinite(K)
+            & np.isfinite(T)
+            & (S > 0)
+            & (K > 0)
+            & (T > 0)
+            & (price > intrinsic)
+            & (price < bound)
+        )
+
+    n = price.shape[0] if price.ndim else 1
+    price, S, K, T, is_call, valid = (
+        a.reshape(n) for a in (price, S, K, T, is_call, valid)
+    )
+    sigma = np.full(n, np.nan)
+    converged = np.zeros(n, dtype=bool)
+    active = np.flatnonzero(valid)
+    if active.size == 0:
+        return sigma
+
+    # Brenner-Subrahmanyam approximation as the starting point.
+    sigma[active] = np.clip(
+        np.sqrt(2 * np.pi / T[active]) * price[active] / S[active], 0.05, 2.0
+    )
+    lo = np.full(n, lower)
+    hi = np.full(n, upper)
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        _S, _K, _T, _s = S[active], K[active], T[active], sigma[active]
+        diff = (
+            black_scholes_price(_S, _K, _T, _s, is_call[active], r=r, q=q)
+            - price[active]
+        )
+        done = np.abs(diff) < tol
+        converged[active[done]] = True
+        # The price increases with volatility, so the bracket is narrowed on each side.
+        hi[active] = np.where(diff > 0, _s, hi[active])
+        lo[active] = np.where(diff < 0, _s, lo[active])
+        d1, _ = _d1_d2(_S, _K, _T, r, q, _s)  # type: ignore
+        vega = _S * np.exp(-q * _T) * norm_pdf(d1) * np.sqrt(_T)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            newton = _s - diff / vega
+        bisect = (
+            ~np.isfinite(newton)
+            | (vega < 1e-10)
+            | (newton <= lo[active])
+            | (newton >= hi[active])
+        )
+        sigma[active] = np.where(
+            done, _s, np.where(bisect, 0.5 * (lo[active] + hi[active]), newton)
+        )
+        active = active[~done]
+
+    return np.where(converged, sigma, np.nan)
+
+
+def calculate_greeks(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    sigma: np.ndarray,
+    is_call: np.ndarray,
+    r: float = 0.0,
+    q: float = 0.0,
+) -> pd.DataFrame:
+    """Calculate the Black-Scholes greeks of a batch of options.
+
+    Theta is the change per calendar day, and vega and rho are the changes for a one point move.
+
+    Parameters
+    ----------
+    S: np.ndarray
+        The price of the underlying asset.
+    K: np.ndarray
+        The strike price.
+    T: np.ndarray
+        The time to expiration, in years.
+    sigma: np.ndarray
+        The annualized volatility, as a normalized percent.
+    is_call: np.ndarray
+        True for calls, False for puts.
+    r: float
+        The annualized risk-free rate, as a normalized percent.
+    q: float
+        The annualized dividend yield, as a normalized percent.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with columns: delta, gamma, theta, vega, rho.
+    """
+    S, K, T, sigma = (np.asarray(a, dtype=float) for a in (S, K, T, sigma))
+    is_call = np.asarray(is_call, dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1, d2 = _d1_d2(S, K, T, r, q, sigma)  # type: ignore
+        sqrt_t = np.sqrt(T)
+        spot = S * np.exp(-q * T)
+        strike = K * np.exp(-r * T)
+        pdf = norm_pdf(d1)
+        delta = np.where(
+            is_call, np.exp(-q * T) * norm_cdf(d1), -np.exp(-q * T) * norm_cdf(-d1)
+        )
+        gamma = np.exp(-q * T) * pdf / (S * sigma * sqrt_t)
+        decay = -spot * pdf * sigma / (2 * sqrt_t)
+        theta = np.where(
+            is_call,
+            decay - r * strike * norm_cdf(d2) + q * spot * norm_cdf(d1),
+            decay + r * strike * norm_cdf(-d2) - q * spot * norm_cdf(-d1),
+        )
+        vega = spot * pdf * sqrt_t
+        rho = np.where(is_call, strike * T * norm_cdf(d2), -strike * T * norm_cdf(-d2))
+
+    return pd.DataFrame(
+        {
+            "delta": delta,
+            "gamma": gamma,
+            "theta": theta / 365,
+            "vega": vega / 100,
+            "rho": rho / 100,
+        }
+    )
+
+
+def add_greeks(
+    chains: pd.DataFrame,
+    risk_free_rate: float = 0.0,
+    dividend_yield: float = 0.0,
+    price: Optional[pd.Series] = None,
+) -> pd.DataFrame:
+    """Add the implied volatility and greeks to an options chain.
+
+    The chain must have the "strike", "option_type", "dte" and "underlying_price" columns.
+    Implied volatility is solved from the mid price when there is a bid and ask, or the last price.
+    Where the chain already has an implied volatility, it is kept and only the missing values are solved.
+
+    Parameters
+    ----------
+    chains: pd.DataFrame
+        The options chain, from `get_current_options` or `download_eod_chains`.
+    risk_free_rate: float
+        The annualized risk-free rate, as a normalized percent.
+    dividend_yield: float
+        The annualized dividend yield of the underlying asset, as a normalized percent.
+    price: Optional[pd.Series]
+        The option prices to solve the implied volatility from, instead of the mid or last price.
+
+    Returns
+    -------
+    pd.DataFrame
+        The chain with columns added, or updated, for: implied_volatility, delta, gamma, theta, vega, rho.
+    """
+    chains = chains.copy()
+    if chains.empty:
+        return chains
+
+    if price is None:
+        bid = chains["bid"] if "bid" in chains.columns else chains["close_bid"]
+        ask = chains["ask"] if "ask" in chains.columns else chains["close_ask"]
+        price = ((bid + ask) / 2).where(
+            (bid > 0) & (ask > 0), chains["last_trade_price"]
+        )
+        price = price.where(price > 0)
+
+    S = pd.to_numeric(chains["underlying_price"], errors="coerce").to_numpy(float)
+    K = chains["strike"].to_numpy(float)
+    T = pd.to_numeric(chains["dte"], errors="coerce").to_numpy(float) / 365
+    is_call = (chains["option_type"] == "call").to_numpy()
+
+    sigma = implied_volatility(
+        price.to_numpy(float), S, K, T, is_call, r=risk_free_rate, q=dividend_yield
+    )
+    if "implied_volatility" in chains.columns:
+        existing = pd.to_numeric(
+            chains["implied_volatility"], errors="coerce"
+        ).to_numpy(float)
+        sigma = np.where(existing > 0, existing, sigma)
+
+    greeks = calculate_greeks(
+        S, K, T, sigma, is_call, r=risk_free_rate, q=dividend_yield
+    )
+    chains["implied_volatility"] = sigma
+    for column in greeks.columns:
+        chains[column] = greeks[column].to_numpy()
+
+    return chains
@@ -0,0 +1,253 @@
+"""TMX Earnings Module.
+
+Keep a local archive of the earnings calendar, with a separate file for each date.
+A file written at least `EARNINGS_SETTLE_DAYS` after its date is settled, and is not requested again.
+Other files, for upcoming dates and the last few days, are requested again once older than `EARNINGS_UPCOMING_TTL`.
+"""
+
+import asyncio
+import json
+import warnings
+from datetime import (
+    date as dateType,
+    datetime,
+    timedelta,
+)
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from openbb_tmx.utils import gql
+from openbb_tmx.utils.helpers import (
+    cache_dir,
+    get_data_from_gql,
+    get_random_agent,
+    run_parser,
+)
+
+# The number of days after a date that its reports are settled, and a file written since is stored permanently.
+# Actual EPS are sometimes published a day or two after the announcement.
+EARNINGS_SETTLE_DAYS = 3
+
+# The time after which the file of a date that is not settled is requested again.
+EARNINGS_UPCOMING_TTL = timedelta(hours=4)
+
+# The number of dates requested at the same time, and the time to wait for each, in seconds.
+# A date that times out is not archived, and is requested again by the next query.
+EARNINGS_MAX_CONCURRENT = 10
+EARNINGS_REQUEST_TIMEOUT = 3
+
+# The number of weeks ahead requested by `prewarm_earnings_calendar`.
+EARNINGS_PREWARM_WEEKS = 4
+
+# Running pre-warm tasks, keyed by the number of weeks, see `schedule_earnings_prewarm`.
+_earnings_prewarm: Dict[int, asyncio.Task] = {}
+
+
+def get_earnings_archive() -> Path:
+    """Gets the directory of the local earnings archive.
+
+    Each date is stored as a separate file, `{archive}/{YYYY-MM-DD}.json`, with the list of reports.
+    """
+    return Path(cache_dir).joinpath("tmx", "earnings")
+
+
+def get_earnings_dates(
+    start_date: Union[str, dateType], end_date: Union[str, dateType]
+) -> List[str]:
+    """Gets the weekdays between two dates, inclusive, as YYYY-MM-DD strings."""
+    start = dateType.fromisoformat(str(start_date)[:10])
+    end = dateType.fromisoformat(str(end_date)[:10])
+    return [
+        (start + timedelta(days=i)).isoformat()
+        for i in range((end - start).days + 1)
+        if (start + timedelta(days=i)).weekday() < 5
+    ]
+
+
+def is_earnings_date_settled(date: str, written: datetime) -> bool:
+    """Checks if the reports of a date, archived at the time `written`, are settled and no longer need to be requested.
+
+    A file written while the date was upcoming, or in the days after, is not settled even once the date is old.
+    """
+    settled = dateType.fromisoformat(date) + timedelta(days=EARNINGS_SETTLE_DAYS)
+    return written.date() > settled
+
+
+def get_stale_earnings_dates(dates: List[str]) -> List[str]:
+    """Gets the dates that are missing from the archive, or not settled and older than `EARNINGS_UPCOMING_TTL`."""
+    archive = get_earnings_archive()
+    expired = datetime.now() - EARNINGS_UPCOMING_TTL
+    stale = []
+    for date in dates:
+        file = archive.joinpath(f"{date}.json")
+        if not file.exists():
+            stale.append(date)
+            continue
+        written = datetime.fromtimestamp(file.stat().st_mtime)
+        if not is_earnings_date_settled(date, written) and written < expired:
+            stale.append(date)
+
+    return stale
+
+
+def write_earnings_archive(reports: Dict[str, List[Dict]]) -> None:
+    """Writes the reports of each date to the archive, replacing the existing files."""
+    archive = get_earnings_archive()
+    archive.mkdir(parents=True, exist_ok=True)
+    for date, data in reports.items():
+        file = archive.joinpath(f"{date}.json")
+        temp = file.with_suffix(".json.tmp")
+        temp.write_text(json.dumps(data), encoding="utf-8")
+        temp.replace(file)
+
+
+def read_earnings_archive(dates: List[str]) -> List[Dict]:
+    """Reads the archived reports for a list of dates, with the date of each report as "report_date"."""
+    archive = get_earnings_archive()
+    results = []
+    for date in dates:
+        file = archive.joinpath(f"{date}.json")
+        if not file.exists():
+            continue
+        try:
+            data = json.loads(file.read_text(encoding="utf-8"))
+        except ValueError:
+            continue
+        results.extend({"report_date": date, **d} for d in data)
+
+    return results
+
+
+async def get_earnings_for_date(date: str) -> Optional[List[Dict]]:
+    """Gets the earnings reports for a single date, waiting up to `EARNINGS_REQUEST_TIMEOUT` seconds.
+
+    Returns None when the response has no data, so that the date is not archived.
+    """
+    payload = {**gql.get_earnings_date_payload, "variables": {"date": date}}
+    response = await asyncio.wait_for(
+        get_data_from_gql(
+            url="https://app-money.tmx.com/graphql",
+            data=json.dumps(payload),
+            headers={
+                "Host": "app-money.tmx.com",
+                "Referer": "https://money.tmx.com/",
+                "locale": "en",
+                "Content-Type": "application/json",
+                "User-Agent": get_random_agent(),
+                "Accept": "*/*",
+            },
+        ),
+        timeout=EARNINGS_REQUEST_TIMEOUT,
+    )
+    if not isinstance(response, dict):
+        return None
+    data = (response.get("data") or {}).get("getEnhancedEarningsForDate")
+
+    return [d for d in data if d] if data is not None else None
+
+
+async def download_earnings_dates(
+    dates: List[str], max_concurrent: int = EARNINGS_MAX_CONCURRENT
+) -> Dict[str, List[Dict]]:
+    """Downloads the earnings reports for a list of dates, and saves them to the archive.
+
+    Returns
+    -------
+    Dict[str, List[Dict]]
+        Dictionary of the reports for each date. Dates that fail are omitted, not archived, and counted in a warning.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    results: Dict[str, List[Dict]] = {}
+
+    async def create_task(date: str) -> None:
+        """Download a single date."""
+        async with semaphore:
+            try:
+                data = await get_earnings_for_date(date)
+            except Exception:  # pylint: disable=broad-except
+                return None
+            if data is not None:
+                results[date] = data
+
+    await asyncio.gather(*[create_task(date) for date in dates])
+    failed = len(dates) - len(results)
+    if failed:
+        warnings.warn(
+            f"{failed} of {len(dates)} dates of earnings could not be downloaded,"
+            + " the calendar is incomplete."
+        )
+    if results:
+        await run_parser(write_earnings_archive, results)
+
+    return results
+
+
+async def get_earnings_calendar(
+    start_date: Union[str, dateType],
+    end_date: Union[str, dateType],
+    use_cache: bool = True,
+) -> List[Dict]:
+    """Gets the earnings calendar over a range of dates.
+
+    Dates in the local archive are read from disk, and only the missing, or stale, dates are requested.
+
+    Parameters
+    ----------
+    start_date: Union[str, date]
+        The first date of the range.
+    end_date: Union[str, date]
+        The last date of the range.
+    use_cache: bool
+        Set as False to request every date in the range again, replacing the archived files.
+
+    Returns
+    -------
+    List[Dict]
+        The reports for every weekday in the range, sorted by "report_date".
+    """
+    dates = get_earnings_dates(start_date, end_date)
+    if not dates:
+        return []
+    stale = (
+        await run_parser(get_stale_earnings_dates, dates)
+        if use_cache is True
+        else dates
+    )
+    downloaded = await download_earnings_dates(stale) if stale else {}
+    if use_cache is not True:
+        # Only the downloaded dates are returned, a date that fails is not read from an older file.
+        return [
+            {"report_date": date, **d}
+            for date in dates
+            for d in downloaded.get(date, [])
+        ]
+
+    return await run_parser(read_earnings_archive, dates)
+
+
+async def prewarm_earnings_calendar(weeks: int = EARNINGS_PREWARM_WEEKS) -> int:
+    """Requests the stale dates of the next number of weeks, so that upcoming calendar queries are read from disk.
+
+    Returns
+    -------
+    int
+        The number of dates downloaded.
+    """
+    today = datetime.now().date()
+    dates = get_earnings_dates(today, today + timedelta(weeks=weeks))
+    stale = await run_parser(get_stale_earnings_dates, dates)
+
+    return len(await download_earnings_dates(stale)) if stale else 0
+
+
+def schedule_earnings_prewarm(weeks: int = EARNINGS_PREWARM_WEEKS) -> asyncio.Task:
+    """Runs `prewarm_earnings_calendar` in the background, on the running event loop.
+
+    A pre-warm that is still running for the same number of weeks is returned instead of starting another.
+    """
+    task = _earnings_prewarm.get(weeks)
+    if task is None or task.done():
+        task = asyncio.get_running_loop().create_task(prewarm_earnings_calendar(weeks))
+        _earnings_prewarm[weeks] = task
+
+    return task
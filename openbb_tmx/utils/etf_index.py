@@ -0,0 +1,504 @@
+"""TMX ETF Index Module.
+
+Indexes built from the ETF universe, stored with it by `get_etf_universe`.
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from openbb_tmx.utils.helpers import ETF_CHILD_TABLES, get_etf_universe
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# The fields of the ETF universe that are searched, and the weight of a match in each field.
+SEARCH_FIELDS = {
+    "symbol": 8.0,
+    "short_name": 4.0,
+    "name": 4.0,
+    "investment_style": 2.0,
+    "investment_objectives": 1.0,
+}
+
+# A term matching only the start of a word counts for less than a whole word.
+PREFIX_WEIGHT = 0.5
+
+
+def tokenize(text: Any) -> List[str]:
+    """Splits text into lowercase words, without accents."""
+    if not isinstance(text, str):
+        return []
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return TOKEN_PATTERN.findall(text)
+
+
+def build_etf_search_index(etfs: List[Dict]) -> Dict[str, Any]:
+    """Builds the inverted index of the searched fields of the ETF universe.
+
+    Parameters
+    ----------
+    etfs: List[Dict]
+        The ETF universe, from `get_all_etfs`.
+
+    Returns
+    -------
+    Dict
+        "postings": Dictionary of each word to the weight of the word for each row of the universe.
+        "terms": Sorted list of every word, for prefix matching.
+    """
+    postings: Dict[str, Dict[int, float]] = {}
+    for row, etf in enumerate(etfs):
+        for field, weight in SEARCH_FIELDS.items():
+            for token in tokenize(etf.get(field)):
+                rows = postings.setdefault(token, {})
+                rows[row] = rows.get(row, 0.0) + weight
+
+    return {"postings": postings, "terms": sorted(postings)}
+
+
+def search_etf_index(index: Dict[str, Any], query: str) -> List[Tuple[int, float]]:
+    """Searches the inverted index of the ETF universe.
+
+    Every word of the query must match the start of a word in one of the searched fields.
+    Rows are ranked by the sum of the weights of the matches, with whole words counting more than prefixes.
+
+    Parameters
+    ----------
+    index: Dict
+        The index, from `build_etf_search_index`.
+    query: str
+        The search terms.
+
+    Returns
+    -------
+    List[Tuple[int, float]]
+        The rows of the ETF universe that match, with their scores, from the best match.
+    """
+    postings, terms = index["postings"], index["terms"]
+    scores: Dict[int, float] = {}
+    for position, term in enumerate(dict.fromkeys(tokenize(query))):
+        matches: Dict[int, float] = {}
+        start = bisect_left(terms, term)
+        for word in terms[start:]:
+            if not word.startswith(term):
+                break
+            factor = 1.0 if word == term else PREFIX_WEIGHT
+            for row, weight in postings[word].items():
+                matches[row] = matches.get(row, 0.0) + weight * factor
+        if position == 0:
+            scores = matches
+        else:
+            scores = {
+                row: score + matches[row]
+                for row, score in scores.items()
+                if row in matches
+            }
+        if not scores:
+            return []
+
+    return sorted(scores.items(), key=lambda item: -item[1])
+
+
+def get_etf_search_index(universe: Dict[str, Any]) -> Dict[str, Any]:
+    """Gets the inverted index of the ETF universe, built once for each refresh of the universe."""
+    if "search_index" not in universe:
+        universe["search_index"] = build_etf_search_index(universe["etfs"])
+    return universe["search_index"]
+
+
+async def search_etfs(query: str, use_cache: bool = True) -> List[Dict]:
+    """Searches the ETF universe by symbol, name, investment style and objectives.
+
+    See `search_etf_index` for how results are matched and ranked.
+    """
+    universe = await get_etf_universe(use_cache=use_cache)
+    index = get_etf_search_index(universe)
+    etfs = universe["etfs"]
+    return [etfs[row] for row, _ in search_etf_index(index, query)]
+
+
+def normalize_etf_symbol(symbol: str) -> str:
+    """Returns the symbol as it is in the ETF universe."""
+    return (
+        symbol.strip().upper().replace(".TO", "").replace(".TSX", "").replace("-", ".")
+    )
+
+
+def build_etf_tables(etfs: List[Dict]) -> Dict[str, Any]:
+    """Builds the columnar tables of the ETF universe, with an index of each symbol.
+
+    Parameters
+    ----------
+    etfs: List[Dict]
+        The ETF universe, from `get_all_etfs`.
+
+    Returns
+    -------
+    Dict
+        "funds": DataFrame of the ETF universe, without the nested lists, in the order of the universe.
+        "symbols": Dictionary of each symbol to its row in "funds".
+        "sectors", "regions" and "holdings": DataFrames of the nested lists of each fund,
+        with a "fund" column of the row in "funds", sorted by fund.
+        "bounds": Dictionary of each child table to the position of the first row of each fund,
+        with the end of the table last.
+    """
+    nested = [column for column, _ in ETF_CHILD_TABLES.values()]
+    funds = pd.DataFrame(etfs)
+    funds = funds.drop(columns=[c for c in nested if c in funds.columns])
+    symbols = {symbol: row for row, symbol in enumerate(funds["symbol"])}
+
+    tables: Dict[str, Any] = {"funds": funds, "symbols": symbols, "bounds": {}}
+    for name, (column, columns) in ETF_CHILD_TABLES.items():
+        records = [
+            {"fund": row, **{columns.get(k, k): v for k, v in item.items()}}
+            for row, etf in enumerate(etfs)
+            for item in (etf.get(column) or [])
+            if isinstance(item, dict)
+        ]
+        table = pd.DataFrame.from_records(records)
+        if table.empty:
+            table = pd.DataFrame(columns=["fund", *dict.fromkeys(columns.values())])
+        tables[name] = table
+        tables["bounds"][name] = np.searchsorted(
+            table["fund"].to_numpy(dtype="int64"), np.arange(len(funds) + 1)
+        )
+
+    return tables
+
+
+def get_etf_tables(universe: Dict[str, Any]) -> Dict[str, Any]:
+    """Gets the columnar tables of the ETF universe, built once for each refresh of the universe."""
+    if "tables" not in universe:
+        universe["tables"] = build_etf_tables(universe["etfs"])
+    return universe["tables"]
+
+
+def lookup_etf_rows(tables: Dict[str, Any], symbols: List[str]) -> np.ndarray:
+    """Returns the rows of the ETF universe for a list of symbols, in the same order.
+
+    Symbols that are not in the universe are omitted.
+    """
+    index = tables["symbols"]
+    rows = [index.get(normalize_etf_symbol(symbol)) for symbol in symbols]
+    return np.array([row for row in rows if row is not None], dtype="int64")
+
+
+def _child_positions(
+    bounds: np.ndarray, rows: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the positions of the child rows of each fund, and the position of the fund in `rows`."""
+    starts, ends = bounds[rows], bounds[rows + 1]
+    lengths = ends - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    positions = offsets + np.arange(lengths.sum())
+    return positions, np.repeat(np.arange(len(rows)), lengths)
+
+
+def take_etf_children(
+    tables: Dict[str, Any], name: str, rows: np.ndarray
+) -> pd.DataFrame:
+    """Returns the rows of a child table for a list of funds, in the order of the funds.
+
+    Parameters
+    ----------
+    tables: Dict
+        The tables, from `get_etf_tables`.
+    name: str
+        The name of the child table: "sectors", "regions" or "holdings".
+    rows: np.ndarray
+        The rows of the funds, from `lookup_etf_rows`.
+
+    Returns
+    -------
+    pd.DataFrame
+        The child table rows of each fund, with the "fund" column.
+    """
+    positions, _ = _child_positions(tables["bounds"][name], rows)
+    return tables[name].iloc[positions].reset_index(drop=True)
+
+
+# The child tables of weights, and the name of their category column.
+EXPOSURE_CATEGORIES = {"sectors": "sector", "regions": "country"}
+
+
+def get_exposure_matrix(tables: Dict[str, Any], name: str) -> Dict[str, np.ndarray]:
+    """Gets the sparse fund by category weight matrix of a child table, built once for each refresh.
+
+    The matrix is stored by row, with the same layout as the child table.
+
+    Parameters
+    ----------
+    tables: Dict
+        The tables, from `get_etf_tables`.
+    name: str
+        The name of the child table: "sectors" or "regions".
+
+    Returns
+    -------
+    Dict
+        "indptr": The position of the first weight of each fund, with the number of weights last.
+        "indices": The category of each weight, as a position in "labels". -1 when there is no category.
+        "data": The weights, as a percent.
+        "labels": The name of each category.
+    """
+    matrices = tables.setdefault("matrices", {})
+    if name not in matrices:
+        table = tables[name]
+        codes, labels = pd.factorize(table[EXPOSURE_CATEGORIES[name]])
+        matrices[name] = {
+            "indptr": tables["bounds"][name],
+            "indices": codes.astype("int64"),
+            "data": pd.to_numeric(table["weight"], errors="coerce")
+            .fillna(0)
+            .to_numpy(dtype=float),
+            "labels": np.asarray(labels, dtype=object),
+        }
+    return matrices[name]
+
+
+def get_etf_exposures(
+    tables: Dict[str, Any], name: str, rows: np.ndarray
+) -> pd.DataFrame:
+    """Gets the weights of each category for a list of funds.
+
+    Parameters
+    ----------
+    tables: Dict
+        The tables, from `get_etf_tables`.
+    name: str
+        The name of the child table: "sectors" or "regions".
+    rows: np.ndarray
+        The rows of the funds, from `lookup_etf_rows`. Use `np.arange(len(tables["funds"]))` for every fund.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame of the weights, as a percent, with a row for each fund indexed by symbol,
+        and a column for each category held by any of the funds, in the order they first appear.
+        Categories not held by a fund are NaN.
+    """
+    matrix = get_exposure_matrix(tables, name)
+    positions, owners = _child_positions(matrix["indptr"], rows)
+    codes = matrix["indices"][positions]
+    valid = codes >= 0
+    codes, owners = codes[valid], owners[valid]
+    dense = np.full((len(rows), len(matrix["labels"])), np.nan)
+    dense[owners, codes] = matrix["data"][positions][valid]
+    used = pd.unique(codes)
+
+    return pd.DataFrame(
+        dense[:, used],
+        index=pd.Index(tables["funds"]["symbol"].to_numpy()[rows], name="symbol"),
+        columns=pd.Index(matrix["labels"][used], name=EXPOSURE_CATEGORIES[name]),
+    )
+
+
+def parse_portfolio(symbols: List[str], weights: str) -> Dict[str, float]:
+    """Pairs a list of symbols with a comma separated string of their portfolio weights."""
+    values = [float(w) for w in weights.split(",")]
+    if len(values) != len(symbols):
+        raise ValueError(
+            f"The number of weights, {len(values)}, does not match the number of symbols, {len(symbols)}."
+        )
+    return dict(zip(symbols, values))
+
+
+def look_through_etf_exposure(
+    tables: Dict[str, Any], name: str, portfolio: Dict[str, float]
+) -> pd.Series:
+    """Gets the exposure of a portfolio of funds to each category, the sum of the fund weights by portfolio weight.
+
+    Parameters
+    ----------
+    tables: Dict
+        The tables, from `get_etf_tables`.
+    name: str
+        The name of the child table: "sectors" or "regions".
+    portfolio: Dict[str, float]
+        Dictionary of each symbol to its weight in the portfolio. Symbols not in the universe are ignored.
+
+    Returns
+    -------
+    pd.Series
+        The exposure to each category, as a percent when the portfolio weights sum to one.
+    """
+    matrix = get_exposure_matrix(tables, name)
+    index = tables["symbols"]
+    held = [
+        (index[normalize_etf_symbol(symbol)], weight)
+        for symbol, weight in portfolio.items()
+        if normalize_etf_symbol(symbol) in index
+    ]
+    rows = np.array([row for row, _ in held], dtype="int64")
+    weights = np.array([weight for _, weight in held], dtype=float)
+    positions, owners = _child_positions(matrix["indptr"], rows)
+    codes = matrix["indices"][positions]
+    valid = codes >= 0
+    totals = np.bincount(
+        codes[valid],
+        weights=(matrix["data"][positions] * weights[owners])[valid],
+        minlength=len(matrix["labels"]),
+    )
+    used = pd.unique(codes[valid])
+
+    return pd.Series(
+        totals[used],
+        index=pd.Index(matrix["labels"][used], name=EXPOSURE_CATEGORIES[name]),
+        name="portfolio",
+    )
+
+
+def get_holdings_index(tables: Dict[str, Any]) -> Dict[str, Dict[str, np.ndarray]]:
+    """Gets the reverse index of the top holdings of every fund, built once for each refresh.
+
+    Returns
+    -------
+    Dict
+        "symbols": Dictionary of each holding symbol, in upper case, to its rows in the holdings table.
+        "names": Dictionary of each holding name, in lower case, to its rows in the holdings table.
+    """
+    if "holdings_index" not in tables:
+        holdings = tables["holdings"]
+        index: Dict[str, Dict[str, np.ndarray]] = {}
+        for key, column, case in [
+            ("symbols", "symbol", str.upper),
+            ("names", "name", str.lower),
+        ]:
+            values = (
+                holdings[column].map(case, na_action="ignore")
+                if column in holdings.columns
+                else pd.Series(dtype=object)
+            )
+            index[key] = values.reset_index(drop=True).groupby(values.values).indices
+        tables["holdings_index"] = index
+    return tables["holdings_index"]
+
+
+def lookup_etf_holders(tables: Dict[str, Any], securities: List[str]) -> pd.DataFrame:
+    """Gets the funds holding each of a list of securities, among their top holdings.
+
+    Each security is matched by its symbol, or by its name when there is no match for the symbol.
+
+    Parameters
+    ----------
+    tables: Dict
+        The tables, from `get_etf_tables`.
+    securities: List[str]
+        The symbols, or names, of the securities.
+
+    Returns
+    -------
+    pd.DataFrame
+        The holdings table rows of every match, with the "security" that was searched,
+        and the "etf_symbol" and "etf_name" of the fund. Sorted by security, then by weight.
+    """
+    index = get_holdings_index(tables)
+    securities = [security.strip() for security in securities]
+    positions = []
+    for security in securities:
+        rows = index["symbols"].get(security.upper().replace(".TO", ""))
+        if rows is None:
+            rows = index["names"].get(security.lower(), np.array([], dtype="int64"))
+        positions.append(rows)
+    # The position of the security searched, for each match.
+    owners = np.repeat(np.arange(len(securities)), [len(p) for p in positions])
+
+    holders = tables["holdings"].iloc[
+        np.concatenate(positions) if positions else np.array([], dtype="int64")
+    ]
+    holders = holders.reset_index(drop=True)
+    funds = holders.pop("fund").to_numpy()
+    holders.insert(0, "security", np.array(securities, dtype=object)[owners])
+    holders.insert(1, "etf_symbol", tables["funds"]["symbol"].to_numpy()[funds])
+    holders.insert(2, "etf_name", tables["funds"]["name"].to_numpy()[funds])
+    weights = (
+        pd.to_numeric(holders["weight"], errors="coerce").fillna(0).to_numpy()
+        if "weight" in holders.columns
+        else np.zeros(len(holders))
+    )
+
+    return holders.iloc[np.lexsort((-weights, owners))].reset_index(drop=True)
+
+
+def get_etf_column(tables: Dict[str, Any], column: str) -> np.ndarray:
+    """Gets a numeric column of the ETF universe as a contiguous array, built once for each refresh.
+
+    Values that are not numbers are NaN.
+    """
+    arrays = tables.setdefault("arrays", {})
+    if column not in arrays:
+        if column not in tables["funds"].columns:
+            raise ValueError(f"The column, {column}, is not in the ETF universe.")
+        arrays[column] = np.ascontiguousarray(
+            pd.to_numeric(tables["funds"][column], errors="coerce").to_numpy(
+                dtype=float
+            )
+        )
+    return arrays[column]
+
+
+def _sort_key(values: np.ndarray, descending: bool) -> np.ndarray:
+    """Returns the values as an ascending sort key, with NaN last."""
+    key = -values if descending else values.copy()
+    key[np.isnan(key)] = np.inf
+    return key
+
+
+def screen_etfs(
+    tables: Dict[str, Any],
+    filters: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+    sort_by: Optional[List[Tuple[str, bool]]] = None,
+    limit: Optional[int] = None,
+    rows: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Screens the ETF universe by ranges of its numeric columns.
+
+    Parameters
+    ----------
+    tables: Dict
+        The tables, from `get_etf_tables`.
+    filters: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]]
+        Dictionary of each column to its (minimum, maximum) values, inclusive. None is unbounded.
+        Funds without a value for a filtered column are excluded.
+    sort_by: Optional[List[Tuple[str, bool]]]
+        The columns to sort by, from the first key, with True for descending order. NaN values are last.
+    limit: Optional[int]
+        The number of funds to return, from the top of the sort order. Must be at least 1.
+    rows: Optional[np.ndarray]
+        The rows of the funds to screen, in their order. Default is every fund, in the order of the universe.
+
+    Returns
+    -------
+    np.ndarray
+        The rows of the funds that pass the screen, in the sort order.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"The limit must be at least 1, got {limit}.")
+    rows = np.arange(len(tables["funds"])) if rows is None else np.asarray(rows)
+    mask = np.ones(len(rows), dtype=bool)
+    for column, (lower, upper) in (filters or {}).items():
+        values = get_etf_column(tables, column)[rows]
+        with np.errstate(invalid="ignore"):
+            if lower is not None:
+                mask &= values >= lower
+            if upper is not None:
+                mask &= values <= upper
+    rows = rows[mask]
+
+    if not sort_by:
+        return rows[:limit] if limit is not None else rows
+
+    keys = [_sort_key(get_etf_column(tables, c)[rows], d) for c, d in sort_by]
+    if limit is not None and limit < len(rows):
+        # Only the funds tied with, or ahead of, the last place on the first key are fully sorted.
+        threshold = keys[0][np.argpartition(keys[0], limit - 1)[limit - 1]]
+        selected = np.flatnonzero(keys[0] <= threshold)
+        rows, keys = rows[selected], [key[selected] for key in keys]
+    # The first key is the last in the lexsort, and the original order breaks ties.
+    order = np.lexsort([np.arange(len(rows)), *keys[::-1]])
+
+    return rows[order][:limit] if limit is not None else rows[order]
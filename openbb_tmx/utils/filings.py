@@ -0,0 +1,323 @@
+"""TMX Filings Module.
+
+Keep a local store of company filings, and the range of dates already downloaded for each symbol.
+Published filings do not change, so only the dates outside that range are requested.
+"""
+
+import asyncio
+import sqlite3
+import warnings
+from datetime import (
+    date as dateType,
+    datetime,
+    timedelta,
+)
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from openbb_tmx.utils.helpers import (
+    cache_dir,
+    download_company_filings,
+    run_parser,
+)
+
+# The schema of the local filings store, see `get_filings_store`.
+FILINGS_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS filings (
+    symbol TEXT NOT NULL,
+    filingDate TEXT NOT NULL,
+    key TEXT NOT NULL,
+    urlToPdf TEXT,
+    name TEXT,
+    description TEXT,
+    size TEXT,
+    PRIMARY KEY (symbol, filingDate, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sync (
+    symbol TEXT PRIMARY KEY,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    updated TEXT NOT NULL
+);
+"""
+
+# The version of the schema. A store with another version is created again, and synced from the start.
+FILINGS_STORE_VERSION = 1
+
+# The columns of a filing, as returned by the endpoint.
+FILINGS_COLUMNS = ["filingDate", "name", "description", "size", "urlToPdf"]
+
+# The number of days before the end of the stored range that are requested again,
+# for filings that are indexed some time after their filing date.
+FILINGS_SYNC_OVERLAP_DAYS = 7
+
+# The first date synced for a symbol without a stored range, in days before today.
+FILINGS_SYNC_DAYS = 112
+
+
+def get_filings_store_path() -> Path:
+    """Gets the path of the local filings store, a SQLite database."""
+    return Path(cache_dir).joinpath("tmx", "filings.db")
+
+
+def get_filings_store() -> sqlite3.Connection:
+    """Opens the local filings store, creating it when it does not exist."""
+    path = get_filings_store_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30)
+    connection.row_factory = sqlite3.Row
+    if connection.execute("PRAGMA user_version").fetchone()[0] != FILINGS_STORE_VERSION:
+        connection.executescript(
+            "DROP TABLE IF EXISTS filings; DROP TABLE IF EXISTS sync;"
+            + f" PRAGMA user_version = {FILINGS_STORE_VERSION};"
+        )
+    connection.executescript(FILINGS_STORE_SCHEMA)
+    return connection
+
+
+def _filing_key(filing: Dict) -> str:
+    """Returns the key of a filing within its date, the URL of the document, or its other fields without one."""
+    return filing.get("urlToPdf") or "|".join(
+        str(filing.get(field) or "") for field in ["name", "description", "size"]
+    )
+
+
+def _normalize_symbol(symbol: str) -> str:
+    """Returns the symbol as it is used by the endpoint."""
+    return symbol.upper().replace("-", ".").replace(".TO", "").replace(".TSX", "")
+
+
+def get_filings_sync_state(symbol: str) -> Optional[Dict[str, str]]:
+    """Gets the range of dates stored for a symbol, with: start_date, end_date, updated."""
+    if not get_filings_store_path().exists():
+        return None
+    connection = get_filings_store()
+    try:
+        row = connection.execute(
+            "SELECT start_date, end_date, updated FROM sync WHERE symbol = ?",
+            (_normalize_symbol(symbol),),
+        ).fetchone()
+    finally:
+        connection.close()
+
+    return dict(row) if row else None
+
+
+def write_filings_store(
+    symbol: str,
+    filings: List[Dict],
+    start_date: Optional[dateType] = None,
+    end_date: Optional[dateType] = None,
+) -> int:
+    """Adds filings to the local filings store, and extends the range of dates stored for the symbol.
+
+    Parameters
+    ----------
+    symbol: str
+        The ticker symbol of the company.
+    filings: List[Dict]
+        The filings, as returned by the endpoint.
+    start_date: Optional[date]
+        The first date of the range that was completely downloaded.
+    end_date: Optional[date]
+        The last date of the range that was completely downloaded.
+        The range must overlap, or be adjacent to, the range already stored.
+
+    Returns
+    -------
+    int
+        The number of filings added.
+    """
+    symbol = _normalize_symbol(symbol)
+    connection = get_filings_store()
+    try:
+        with connection:
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO filings"
+                + " (symbol, filingDate, key, urlToPdf, name, description, size)"
+                + " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        symbol,
+                        d["filingDate"],
+                        _filing_key(d),
+                        d.get("urlToPdf"),
+                        d.get("name"),
+                        d.get("description"),
+                        d.get("size"),
+                    )
+                    for d in filings
+                    if d.get("filingDate")
+                ],
+            )
+            added = connection.total_changes - before
+            if start_date is not None and end_date is not None:
+                connection.execute(
+                    "INSERT INTO sync (symbol, start_date, end_date, updated)"
+                    + " VALUES (?, ?, ?, ?) ON CONFLICT (symbol) DO UPDATE SET"
+                    + " start_date = min(start_date, excluded.start_date),"
+                    + " end_date = max(end_date, excluded.end_date),"
+                    + " updated = excluded.updated",
+                    (
+                        symbol,
+                        start_date.isoformat(),
+                        end_date.isoformat(),
+                        datetime.now().isoformat(timespec="seconds"),
+                    ),
+                )
+    finally:
+        connection.close()
+
+    return added
+
+
+def read_filings_store(
+    symbol: str, start_date: dateType, end_date: dateType
+) -> List[Dict]:
+    """Reads the filings of a company from the local filings store, newest first."""
+    if not get_filings_store_path().exists():
+        return []
+    connection = get_filings_store()
+    try:
+        rows = connection.execute(
+            f"SELECT {', '.join(FILINGS_COLUMNS)} FROM filings"
+            + " WHERE symbol = ? AND substr(filingDate, 1, 10) BETWEEN ? AND ?"
+            + " ORDER BY filingDate DESC",
+            (_normalize_symbol(symbol), start_date.isoformat(), end_date.isoformat()),
+        ).fetchall()
+    finally:
+        connection.close()
+
+    return [dict(row) for row in rows]
+
+
+async def sync_company_filings(
+    symbol: str,
+    start_date: Optional[dateType] = None,
+    end_date: Optional[dateType] = None,
+) -> Dict[str, int]:
+    """Downloads the filings of a company that are not in the local filings store.
+
+    Only the dates before the stored range, and after its end, less `FILINGS_SYNC_OVERLAP_DAYS`, are requested.
+    The stored range is only extended when every window of the download succeeded,
+    and never beyond today.
+
+    Parameters
+    ----------
+    symbol: str
+        The ticker symbol of the company.
+    start_date: Optional[date]
+        The first date to sync. Default is the start of the stored range,
+        or `FILINGS_SYNC_DAYS` before today.
+    end_date: Optional[date]
+        The last date to sync. Default is today.
+
+    Returns
+    -------
+    Dict[str, int]
+        "added", the number of filings added, and the requests made by the sync,
+        summed over the ranges downloaded, see `download_company_filings`.
+    """
+    symbol = _normalize_symbol(symbol)
+    today = datetime.now().date()
+    end_date = min(end_date or today, today)
+    state = await run_parser(get_filings_sync_state, symbol)
+    if start_date is None:
+        start_date = (
+            dateType.fromisoformat(state["start_date"])
+            if state
+            else today - timedelta(days=FILINGS_SYNC_DAYS)
+        )
+    gaps = [(start_date, end_date)]
+    contiguous = True
+    if state:
+        stored_start = dateType.fromisoformat(state["start_date"])
+        stored_end = dateType.fromisoformat(state["end_date"])
+        # A range apart from the stored range is downloaded, but the stored range is not extended.
+        contiguous = start_date <= stored_end + timedelta(
+            days=1
+        ) and end_date >= stored_start - timedelta(days=1)
+        if contiguous:
+            tail = max(
+                stored_start, stored_end - timedelta(days=FILINGS_SYNC_OVERLAP_DAYS)
+            )
+            gaps = [
+                (start_date, stored_start - timedelta(days=1)),
+                (max(start_date, tail), end_date),
+            ]
+    results = {
+        "added": 0,
+        "requests": 0,
+        "windows": 0,
+        "splits": 0,
+        "saturated": 0,
+        "failed": 0,
+    }
+    for start, end in gaps:
+        if start > end:
+            continue
+        filings, stats = await download_company_filings(symbol, start, end)
+        for key, value in stats.items():
+            results[key] += value
+        complete = contiguous and stats["failed"] == 0
+        results["added"] += await run_parser(
+            write_filings_store,
+            symbol,
+            filings,
+            start if complete else None,
+            end if complete else None,
+        )
+
+    return results
+
+
+async def get_stored_company_filings(
+    symbol: str, start_date: dateType, end_date: dateType
+) -> List[Dict]:
+    """Gets the filings of a company from the local filings store, after syncing the missing dates.
+
+    When the sync fails, the filings already stored are returned, with a warning.
+    See `sync_company_filings` for the parameters.
+    """
+    try:
+        await sync_company_filings(symbol, start_date, end_date)
+    except Exception as e:  # pylint: disable=broad-except
+        warnings.warn(
+            f"The filings of {symbol} could not be synced, only the stored filings are returned -> {e}"
+        )
+
+    return await run_parser(read_filings_store, symbol, start_date, end_date)
+
+
+async def sync_watchlist_filings(
+    symbols: List[str],
+    start_date: Optional[dateType] = None,
+    end_date: Optional[dateType] = None,
+    max_concurrent: int = 4,
+) -> Dict[str, Dict[str, int]]:
+    """Syncs the filings of many companies concurrently.
+
+    See `sync_company_filings` for the parameters.
+
+    Returns
+    -------
+    Dict[str, Dict[str, int]]
+        Dictionary of the results of `sync_company_filings` for each symbol. Symbols that fail are omitted.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    results: Dict[str, Dict[str, int]] = {}
+
+    async def create_task(symbol: str) -> None:
+        """Sync a single symbol."""
+        async with semaphore:
+            try:
+                results[symbol] = await sync_company_filings(
+                    symbol, start_date, end_date
+                )
+            except Exception:  # pylint: disable=broad-except
+                return None
+
+    await asyncio.gather(*[create_task(symbol) for symbol in symbols])
+
+    return results
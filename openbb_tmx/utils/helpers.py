@@ -4,10 +4,32 @@ from aiohttp_client_cache import SQLiteBackend
 from aiohttp_client_cache.session import CachedSession
 from openbb_core.provider.utils.helpers import amake_request, to_snake_case
 from dateutil import rrule
+import html
+import gzip
 import json
+import re
+import warnings
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from io import StringIO
 from datetime import datetime, timedelta, date as dateType, time
-from typing import Any, Dict, List, Literal, Optional
+from pathlib import Path
+from time import perf_counter
+from urllib.parse import urlparse
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import pandas as pd
 import pandas_market_calendars as mcal
@@ -15,10 +37,14 @@ import pytz
 from pandas.tseries.holiday import next_workday
 from random_user_agent.user_agent import UserAgent
 from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.abstract.data import Data
 from openbb_tmx.utils import gql
+from pydantic import TypeAdapter
 
 cache_dir = get_user_cache_directory()
 
+D = TypeVar("D", bound=Data)
+
 
 def get_random_agent() -> str:
     """Get a random user agent."""
@@ -42,6 +68,38 @@ tmx_etfs_backend = SQLiteBackend(
     f"{cache_dir}/http/tmx_etfs", expire_after=timedelta(hours=4)
 )
 
+# The parsed options directory is kept in memory and refreshed after this period.
+OPTIONS_DIRECTORY_TTL = timedelta(hours=12)
+_options_directory: Dict[str, Any] = {}
+
+# The parsed ETF universe is kept in memory for as long as the cached request.
+ETF_UNIVERSE_TTL = timedelta(hours=4)
+_etf_universe: Dict[str, Any] = {}
+
+# The nested lists of each fund, flattened into child tables, and the names of their columns.
+ETF_CHILD_TABLES = {
+    "sectors": ("sectors", {"name": "sector", "percent": "weight"}),
+    "regions": ("regions", {"name": "country", "percent": "weight"}),
+    "holdings": (
+        "holdings_top10",
+        {
+            "numberofshares": "number_of_shares",
+            "symbol": "symbol",
+            "country": "country",
+            "fundid": "fund_id",
+            "excode": "exchange",
+            "securityname": "name",
+            "currency": "currency",
+            "marketvalue": "market_value",
+            "detailholdingtypeid": "type_id",
+            "weighting": "weight",
+            "sharepercentage": "share_percentage",
+            "sharechange": "share_change",
+            "shareChange": "share_change",
+        },
+    ),
+}
+
 # Column map for ETFs.
 COLUMNS_DICT = {
     "symbol": "symbol",
@@ -112,22 +170,54 @@ async def response_callback(response, _: Any):
     return await response.read()
 
 
+async def read_response(response, _: Any) -> bytes:
+    """Callback for HTTP Client Response, returning the body as bytes."""
+    return await response.read()
+
+
+# The maximum number of concurrent requests to a host, see `get_host_limiter`.
+HOST_MAX_CONCURRENT = {"www.m-x.ca": 4}
+DEFAULT_HOST_MAX_CONCURRENT = 10
+
+# Semaphores are bound to an event loop, so they are kept for each running loop.
+_host_limiters: "weakref.WeakKeyDictionary[Any, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_host_limiter(url: str) -> asyncio.Semaphore:
+    """Gets the semaphore limiting the concurrent requests to the host of a URL."""
+    host = urlparse(url).netloc
+    limiters = _host_limiters.setdefault(asyncio.get_running_loop(), {})
+    if host not in limiters:
+        limiters[host] = asyncio.Semaphore(
+            HOST_MAX_CONCURRENT.get(host, DEFAULT_HOST_MAX_CONCURRENT)
+        )
+    return limiters[host]
+
+
 async def get_data_from_url(
     url: str,
     use_cache: bool = True,
     backend: Optional[SQLiteBackend] = None,
+    callback: Optional[Callable] = None,
     **kwargs: Any,
 ) -> Any:
-    """Make an asynchronous HTTP request to a static file."""
-    if use_cache is True:
-        async with CachedSession(cache=backend) as cached_session:
-            try:
-                response = await cached_session.get(url, timeout=10, **kwargs)
-                data = await response_callback(response, None)
-            finally:
-                await cached_session.close()
-    else:
-        data = await amake_request(url, response_callback=response_callback)
+    """Make an asynchronous HTTP request to a static file.
+
+    The response is decoded by `callback`, which defaults to `response_callback`.
+    """
+    callback = callback or response_callback
+    async with get_host_limiter(url):
+        if use_cache is True:
+            async with CachedSession(cache=backend) as cached_session:
+                try:
+                    response = await cached_session.get(url, timeout=10, **kwargs)
+                    data = await callback(response, None)
+                finally:
+                    await cached_session.close()
+        else:
+            data = await amake_request(url, response_callback=callback, **kwargs)
 
     return data
 
@@ -147,6 +237,159 @@ async def get_data_from_gql(url: str, headers, data, **kwargs: Any) -> Any:
     return response
 
 
+# The number of symbols in each request for quotes, and the number of requests at the same time.
+QUOTES_BATCH_SIZE = 50
+QUOTES_MAX_CONCURRENT = 4
+
+
+async def get_quotes_for_symbols(
+    symbols: List[str],
+    batch_size: int = QUOTES_BATCH_SIZE,
+    max_concurrent: int = QUOTES_MAX_CONCURRENT,
+) -> Dict[str, Dict]:
+    """Gets the current price of many symbols, in concurrent batches.
+
+    Parameters
+    ----------
+    symbols: List[str]
+        The ticker symbols.
+    batch_size: int
+        The maximum number of symbols in each request.
+    max_concurrent: int
+        The maximum number of requests at the same time.
+
+    Returns
+    -------
+    Dict[str, Dict]
+        Dictionary of each symbol to its quote, with: symbol, price, prevClose, priceChange.
+        Symbols without a quote, or in a batch that fails, are omitted. Failed batches are counted in a warning.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    quotes: Dict[str, Dict] = {}
+    failed: List[str] = []
+    batches = [
+        symbols[i : i + batch_size] for i in range(0, len(symbols), batch_size)
+    ]
+
+    async def create_task(batch: List[str]) -> None:
+        """Get the quotes for a single batch."""
+        payload = {
+            **gql.get_quote_for_symbols_payload,
+            "variables": {"symbols": batch},
+        }
+        async with semaphore:
+            try:
+                response = await get_data_from_gql(
+                    url="https://app-money.tmx.com/graphql",
+                    data=json.dumps(payload),
+                    headers={
+                        "authority": "app-money.tmx.com",
+                        "referer": f"https://money.tmx.com/en/quote/{batch[0]}",
+                        "locale": "en",
+                        "Content-Type": "application/json",
+                        "User-Agent": get_random_agent(),
+                        "Accept": "*/*",
+                    },
+                )
+            except Exception:  # pylint: disable=broad-except
+                response = None
+        if not isinstance(response, dict):
+            failed.extend(batch)
+            return None
+        data = (response.get("data") or {}).get("getQuoteForSymbols") or []
+        for quote in data:
+            if quote and quote.get("symbol"):
+                quote.pop("percentChange", None)
+                quotes[quote["symbol"]] = quote
+
+    await asyncio.gather(*[create_task(batch) for batch in batches])
+    if failed:
+        warnings.warn(
+            f"{len(failed)} of {len(symbols)} quotes could not be downloaded -> {', '.join(failed[:10])}"
+            + (", ..." if len(failed) > 10 else "")
+        )
+
+    return quotes
+
+
+# Where downloaded files are parsed, see `set_parser_executor`.
+_parser_executor: Dict[str, Any] = {"kind": "thread", "executor": None}
+
+# Time spent by each parser, see `get_parser_stats`.
+_parser_stats: Dict[str, Dict[str, float]] = {}
+
+
+def set_parser_executor(
+    kind: Literal["thread", "process", "inline"] = "thread",
+    max_workers: Optional[int] = None,
+) -> None:
+    """Set where the HTML and CSV files are parsed.
+
+    Parameters
+    ----------
+    kind: Literal["thread", "process", "inline"]
+        "thread" and "process" parse in a pool of workers, keeping the event loop free.
+        "inline" parses on the event loop thread, blocking it for the duration.
+    max_workers: Optional[int]
+        The number of workers in the pool. Defaults to the executor's own default.
+    """
+    previous = _parser_executor.get("executor")
+    if previous is not None:
+        previous.shutdown(wait=False)
+    executor: Optional[Executor] = None
+    if kind == "thread":
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    elif kind == "process":
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    _parser_executor.update({"kind": kind, "executor": executor})
+
+
+def get_parser_stats() -> Dict[str, Dict[str, float]]:
+    """Get the time spent by each parser, in seconds.
+
+    "calls" is the number of times the parser ran, "parse_time" the total time spent parsing,
+    and "blocked_time" and "max_blocked_time" the time the event loop was blocked by the parser.
+    """
+    return {k: v.copy() for k, v in _parser_stats.items()}
+
+
+def _timed_call(func: Callable, *args: Any) -> Tuple[Any, float]:
+    """Call a function, returning the result and the time it took."""
+    start = perf_counter()
+    result = func(*args)
+    return result, perf_counter() - start
+
+
+async def run_parser(func: Callable, *args: Any) -> Any:
+    """Run a CPU-heavy parser in the configured executor, recording the time spent.
+
+    Parsers running in a process pool must be top-level functions, with picklable arguments.
+    """
+    start = perf_counter()
+    if _parser_executor["kind"] == "inline":
+        result, elapsed = _timed_call(func, *args)
+        blocked = perf_counter() - start
+    else:
+        if _parser_executor["executor"] is None:
+            set_parser_executor(_parser_executor["kind"])
+        future = asyncio.get_running_loop().run_in_executor(
+            _parser_executor["executor"], _timed_call, func, *args
+        )
+        blocked = perf_counter() - start
+        result, elapsed = await future
+
+    stats = _parser_stats.setdefault(
+        func.__name__,
+        {"calls": 0, "parse_time": 0.0, "blocked_time": 0.0, "max_blocked_time": 0.0},
+    )
+    stats["calls"] += 1
+    stats["parse_time"] += elapsed
+    stats["blocked_time"] += blocked
+    stats["max_blocked_time"] = max(stats["max_blocked_time"], blocked)
+
+    return result
+
+
 def replace_values_in_list_of_dicts(data):
     """Helper function to replace "NA" and "-" with None in a list of dictionaries."""
     for d in data:
@@ -166,6 +409,52 @@ def replace_values_in_list_of_dicts(data):
     return data
 
 
+@lru_cache(maxsize=None)
+def get_list_adapter(model: Type[D]) -> TypeAdapter:
+    """Get the precompiled list-level validator for a Data model.
+
+    The core schema is built once per model and reused for every call.
+    """
+    return TypeAdapter(List[model])  # type: ignore
+
+
+def validate_models(
+    model: Type[D], data: List[Dict], trusted: bool = False
+) -> List[D]:
+    """Validate a list of records as models in a single pass.
+
+    Parameters
+    ----------
+    model: Type[Data]
+        The Data model to validate against.
+    data: List[Dict]
+        The records to validate.
+    trusted: bool
+        Set as True when the records were already validated once, i.e. the `model_dump()` output of cached results.
+        The models are then constructed directly, without running any validators.
+
+    Returns
+    -------
+    List[Data]
+        The list of validated models.
+    """
+    if trusted is True:
+        construct = model.model_construct
+        return [construct(**d) for d in data]
+    return get_list_adapter(model).validate_python(data)
+
+
+def parse_unique_dates(data: List[Dict], key: str, fmt: str = "%Y-%m-%d") -> None:
+    """Parse a date string field in place, parsing each distinct value only once."""
+    parsed: Dict[Any, Any] = {}
+    for d in data:
+        v = d.get(key)
+        if isinstance(v, str):
+            if v not in parsed:
+                parsed[v] = datetime.strptime(v, fmt).date()
+            d[key] = parsed[v]
+
+
 def check_weekday(date) -> str:
     """Helper function to check if the input date is a weekday, and if not, returns the next weekday.
 
@@ -195,6 +484,54 @@ async def get_all_etfs(use_cache: bool = True) -> List[Dict]:
         Dictionary with all TMX-listed ETFs.
     """
 
+    universe = await get_etf_universe(use_cache=use_cache)
+
+    return universe["etfs"]
+
+
+async def get_etf_universe(use_cache: bool = True) -> Dict[str, Any]:
+    """Gets the parsed ETF universe, with the indexes built from it.
+
+    The universe is parsed once and kept in memory until `ETF_UNIVERSE_TTL` has elapsed.
+    Indexes are built on first use and stored with the universe, so they are replaced when it is refreshed.
+
+    Parameters
+    ----------
+    use_cache: bool
+        Set as False to refresh the universe from the source.
+
+    Returns
+    -------
+    Dict
+        "etfs": List of all TMX-listed ETFs.
+        "updated": The time the universe was parsed.
+        Any indexes built from the universe, see `openbb_tmx.utils.etf_index`.
+    """
+    updated = _etf_universe.get("updated")
+    if (
+        use_cache is True
+        and updated is not None
+        and datetime.now() - updated < ETF_UNIVERSE_TTL
+    ):
+        return _etf_universe
+
+    etfs = await download_all_etfs(use_cache=use_cache)
+    _etf_universe.clear()
+    _etf_universe.update({"etfs": etfs, "updated": datetime.now()})
+    # The archive is a side effect of the refresh, and never fails the request.
+    # An empty universe is not archived, it would record every fund as delisted.
+    try:
+        if etfs:
+            await run_parser(write_etf_snapshot, etfs)
+    except Exception as e:  # pylint: disable=broad-except
+        warnings.warn(f"The ETF snapshot could not be archived -> {e}")
+
+    return _etf_universe
+
+
+async def download_all_etfs(use_cache: bool = True) -> List[Dict]:
+    """Downloads and parses the JSON file of the TMX ETF universe."""
+
     url = "https://dgr53wu9i7rmp.cloudfront.net/etfs/etfs.json"
 
     response = await get_data_from_url(
@@ -238,6 +575,257 @@ async def get_all_etfs(use_cache: bool = True) -> List[Dict]:
     return etfs.to_dict(orient="records")
 
 
+def get_etf_snapshots_archive() -> Path:
+    """Gets the directory of the local ETF snapshots archive.
+
+    Each day is stored as `{archive}/{YYYY-MM-DD}.csv.gz`, with the funds that changed,
+    and `{archive}/{YYYY-MM-DD}.holdings.csv.gz`, with the top holdings of the funds whose holdings changed.
+    The last state of every fund is kept in `latest.csv.gz` and `latest.holdings.csv.gz`.
+    """
+    return Path(cache_dir).joinpath("tmx", "etf_snapshots")
+
+
+def _etf_snapshot_tables(etfs: List[Dict]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Splits the ETF universe into a table of the scalar fields, and a table of the top holdings."""
+    funds = pd.DataFrame(etfs)
+    nested = [
+        c
+        for c in funds.columns
+        if funds[c].map(lambda v: isinstance(v, (dict, list))).any()
+    ]
+    funds = funds.drop(columns=nested)
+    column, columns = ETF_CHILD_TABLES["holdings"]
+    holdings = pd.DataFrame.from_records(
+        [
+            {"fund": etf["symbol"], **{columns.get(k, k): v for k, v in item.items()}}
+            for etf in etfs
+            for item in (etf.get(column) or [])
+            if isinstance(item, dict)
+        ]
+    )
+    # The types are those of the stored files, so values compare equal after a round trip.
+    return (
+        pd.read_csv(StringIO(funds.to_csv(index=False))),
+        (
+            pd.read_csv(StringIO(holdings.to_csv(index=False)))
+            if not holdings.empty
+            else pd.DataFrame(columns=["fund"])
+        ),
+    )
+
+
+def _append_csv(file: Path, data: pd.DataFrame) -> None:
+    """Appends rows to a compressed file, as a new gzip member, in the columns of the existing header."""
+    header = not file.exists()
+    if data.empty and not header:
+        return
+    if not header:
+        with gzip.open(file, "rt", encoding="utf-8") as f:
+            columns = pd.read_csv(f, nrows=0).columns
+        data = data.reindex(columns=columns)
+    with gzip.open(file, "at", encoding="utf-8") as f:
+        data.to_csv(f, index=False, header=header)
+
+
+def get_etf_snapshot_dates(
+    end_date: Optional[Union[str, dateType]] = None, holdings: bool = False
+) -> Dict[str, Path]:
+    """Gets the files of the ETF snapshots archive, by date, up to a date."""
+    end = str(end_date) if end_date else "9999-12-31"
+    suffix = ".holdings.csv.gz" if holdings else ".csv.gz"
+    files = {
+        file.name[:10]: file
+        for file in get_etf_snapshots_archive().glob(f"*{suffix}")
+        if file.name[0].isdigit() and file.name[10:] == suffix
+    }
+    return {date: files[date] for date in sorted(files) if date <= end}
+
+
+def _read_latest_snapshot(file: Path) -> Optional[pd.DataFrame]:
+    """Reads the last snapshot written, or None when it is missing or cannot be read."""
+    if not file.exists():
+        return None
+    try:
+        return pd.read_csv(file)
+    except (OSError, EOFError, ValueError) as e:
+        warnings.warn(
+            f"The last ETF snapshot could not be read, and is replaced -> {e}"
+        )
+        return None
+
+
+def write_etf_snapshot(etfs: List[Dict], date: Optional[str] = None) -> Dict[str, int]:
+    """Archives the funds, and top holdings, that changed since the last snapshot.
+
+    Funds that are no longer in the universe are archived once, with only "delisted" set to 1.
+
+    Parameters
+    ----------
+    etfs: List[Dict]
+        The ETF universe, from `download_all_etfs`.
+    date: Optional[str]
+        The date of the snapshot, as YYYY-MM-DD. Default is today.
+
+    Returns
+    -------
+    Dict[str, int]
+        The number of funds, and of funds with new holdings, that were archived, and the number of funds delisted.
+    """
+    archive = get_etf_snapshots_archive()
+    archive.mkdir(parents=True, exist_ok=True)
+    date = date or datetime.now().strftime("%Y-%m-%d")
+    funds, holdings = _etf_snapshot_tables(etfs)
+
+    latest_file = archive.joinpath("latest.csv.gz")
+    changed = funds
+    delisted = pd.DataFrame(columns=["symbol"])
+    latest = _read_latest_snapshot(latest_file)
+    if latest is not None and "symbol" in latest.columns:
+        latest = latest.drop_duplicates("symbol", keep="last")
+        delisted = latest.loc[~latest["symbol"].isin(funds["symbol"]), ["symbol"]]
+        latest = latest.set_index("symbol").reindex(
+            index=funds["symbol"], columns=funds.columns.drop("symbol")
+        )
+        current = funds.set_index("symbol")
+        same = (current == latest) | (current.isna() & latest.isna())
+        changed = funds[~same.to_numpy().all(axis=1)]
+    # The file of the day is written even when nothing changed, to record the snapshot.
+    rows = pd.concat(
+        [changed.assign(delisted=0), delisted.assign(delisted=1)], ignore_index=True
+    )
+    _append_csv(archive.joinpath(f"{date}.csv.gz"), rows.assign(date=date))
+    if not rows.empty or latest is None:
+        funds.to_csv(latest_file, index=False)
+
+    # The holdings of a fund are archived again when any of them change.
+    latest_holdings_file = archive.joinpath("latest.holdings.csv.gz")
+    signatures = (
+        holdings.astype(str).groupby("fund").agg("|".join).apply("|".join, axis=1)
+    )
+    changed_funds = signatures.index
+    latest_holdings = _read_latest_snapshot(latest_holdings_file)
+    if latest_holdings is not None and "fund" in latest_holdings.columns:
+        if not latest_holdings.empty:
+            latest_signatures = (
+                latest_holdings.reindex(columns=holdings.columns)
+                .astype(str)
+                .groupby("fund")
+                .agg("|".join)
+                .apply("|".join, axis=1)
+            )
+            changed_funds = signatures.index[
+                signatures != latest_signatures.reindex(signatures.index)
+            ]
+    if len(changed_funds) > 0:
+        _append_csv(
+            archive.joinpath(f"{date}.holdings.csv.gz"),
+            holdings[holdings["fund"].isin(changed_funds)].assign(date=date),
+        )
+        holdings.to_csv(latest_holdings_file, index=False)
+
+    return {
+        "funds": len(changed),
+        "holdings": len(changed_funds),
+        "delisted": len(delisted),
+    }
+
+
+def read_etf_snapshots(
+    columns: Optional[List[str]] = None,
+    end_date: Optional[Union[str, dateType]] = None,
+    holdings: bool = False,
+) -> pd.DataFrame:
+    """Reads the archived changes of the ETF universe, up to a date.
+
+    Parameters
+    ----------
+    columns: Optional[List[str]]
+        The columns to read, in addition to "date" and the symbol. Default is all columns.
+    end_date: Optional[Union[str, date]]
+        The last date to read. Default is all dates.
+    holdings: bool
+        Read the top holdings instead of the funds. The symbol of the fund is the "fund" column.
+
+    Returns
+    -------
+    pd.DataFrame
+        The changed rows of every snapshot, sorted by date.
+    """
+    key = "fund" if holdings else "symbol"
+    usecols = (
+        None if columns is None else (lambda c: c in {"date", key, *columns})  # type: ignore
+    )
+    files = get_etf_snapshot_dates(end_date, holdings).values()
+    snapshots = [pd.read_csv(file, usecols=usecols) for file in files]
+    snapshots = [s for s in snapshots if not s.empty]
+
+    return (
+        pd.concat(snapshots, ignore_index=True)
+        if snapshots
+        else pd.DataFrame(columns=["date", key, *(columns or [])])
+    )
+
+
+def get_etf_history(
+    symbols: List[str],
+    columns: Optional[List[str]] = None,
+    start_date: Optional[Union[str, dateType]] = None,
+    end_date: Optional[Union[str, dateType]] = None,
+) -> pd.DataFrame:
+    """Gets the daily time series of ETFs from the snapshots archive.
+
+    Only the requested columns are read, and the last value of each fund is carried forward
+    through the snapshots where it did not change. A fund has no rows from the snapshot where it was delisted,
+    until it is listed again.
+
+    Parameters
+    ----------
+    symbols: List[str]
+        The symbols of the ETFs.
+    columns: Optional[List[str]]
+        The columns of the time series. Default is ["aum", "unit_price", "close", "distribution_yield"].
+    start_date: Optional[Union[str, date]]
+        The first date of the series. Default is the first snapshot.
+    end_date: Optional[Union[str, date]]
+        The last date of the series. Default is the last snapshot.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with columns: date, symbol, and the requested columns. Sorted by symbol, then date.
+    """
+    columns = columns or ["aum", "unit_price", "close", "distribution_yield"]
+    symbols = [s.upper().replace(".TO", "").replace("-", ".") for s in symbols]
+    dates = list(get_etf_snapshot_dates(end_date))
+    snapshots = read_etf_snapshots(columns=[*columns, "delisted"], end_date=end_date)
+    snapshots = snapshots[snapshots["symbol"].isin(symbols)]
+    if snapshots.empty:
+        return pd.DataFrame(columns=["date", "symbol", *columns])
+
+    snapshots = snapshots.drop_duplicates(subset=["date", "symbol"], keep="last")
+    # Snapshots written before delistings were recorded have no "delisted" column.
+    snapshots = snapshots.reindex(columns=["date", "symbol", *columns, "delisted"])
+    snapshots["delisted"] = snapshots["delisted"].fillna(0)
+    # Every symbol has a row for every snapshot, with the last value that was archived.
+    grid = pd.MultiIndex.from_product(
+        [snapshots["symbol"].unique(), dates], names=["symbol", "date"]
+    )
+    history = (
+        snapshots.set_index(["symbol", "date"])
+        .reindex(index=grid, columns=[*columns, "delisted"])
+        .groupby(level="symbol")
+        .ffill()
+    )
+    history = history[history["delisted"] != 1].drop(columns="delisted")
+    history = history.dropna(how="all").reset_index()
+    if start_date:
+        history = history[history["date"] >= str(start_date)]
+
+    return history.sort_values(["symbol", "date"]).reset_index(drop=True)[
+        ["date", "symbol", *columns]
+    ]
+
+
 async def get_tmx_tickers(
     exchange: Literal["tsx", "tsxv"] = "tsx", use_cache: bool = True
 ) -> Dict:
@@ -277,7 +865,13 @@ async def get_all_options_tickers(use_cache: bool = True) -> pd.DataFrame:
     if r is None:
         raise RuntimeError(f"Error with the request:  {r.status_code}")
 
-    options_listings = pd.read_html(StringIO(r))
+    return await run_parser(parse_options_list, r)
+
+
+def parse_options_list(text: str) -> pd.DataFrame:
+    """Parses the HTML tables of the options list page."""
+
+    options_listings = pd.read_html(StringIO(text))
     listings = pd.concat(options_listings)
     listings = listings.set_index("Option Symbol").drop_duplicates().sort_index()
     symbols = listings[:-1]
@@ -293,29 +887,220 @@ async def get_all_options_tickers(use_cache: bool = True) -> pd.DataFrame:
     return symbols.set_index("option_symbol")
 
 
-async def get_current_options(symbol: str, use_cache: bool = True) -> pd.DataFrame:
-    """Gets the current quotes for the complete options chain."""
+async def get_options_directory(use_cache: bool = True) -> Dict[str, Any]:
+    """Gets the parsed options directory, indexed for symbol resolution.
+
+    The directory is parsed once and kept in memory until `OPTIONS_DIRECTORY_TTL` has elapsed.
 
-    SYMBOLS = await get_all_options_tickers(use_cache=use_cache)
-    data = pd.DataFrame()
-    symbol = symbol.upper()
+    Parameters
+    ----------
+    use_cache: bool
+        Set as False to refresh the directory from the source.
+
+    Returns
+    -------
+    Dict
+        "listings": DataFrame of all listings, indexed by the option root symbol.
+        "underlyings": Dictionary of underlying symbols to their option root symbols.
+        "roots": Dictionary of option root symbols to their listing details.
+        "updated": The time the directory was parsed.
+    """
+    updated = _options_directory.get("updated")
+    if (
+        use_cache is True
+        and updated is not None
+        and datetime.now() - updated < OPTIONS_DIRECTORY_TTL
+    ):
+        return _options_directory
+
+    listings = await get_all_options_tickers(use_cache=use_cache)
+    underlyings: Dict[str, List[str]] = {}
+    for root, underlying in zip(listings.index, listings["underlying_symbol"]):
+        if underlying and root not in underlyings.get(underlying, []):
+            underlyings.setdefault(underlying, []).append(root)
+    roots = dict(zip(listings.index, listings.to_dict(orient="records")))
+
+    _options_directory.update(
+        {
+            "listings": listings,
+            "underlyings": underlyings,
+            "roots": roots,
+            "updated": datetime.now(),
+        }
+    )
+
+    return _options_directory
+
+
+async def get_options_root(symbol: str, use_cache: bool = True) -> str:
+    """Resolves a ticker symbol to the root symbol used to lookup options."""
+
+    directory = await get_options_directory(use_cache=use_cache)
+
+    return resolve_options_root(directory, symbol)
 
-    # Remove exchange  identifiers from the symbol.
-    if ".TO" in symbol:
-        symbol = symbol.replace(".TO", "")
-    if ".TSX" in symbol:
-        symbol = symbol.replace(".TSX", "")
+
+def resolve_options_root(directory: Dict[str, Any], symbol: str) -> str:
+    """Resolves a ticker symbol to its option root symbol, with an options directory already loaded."""
+
+    symbol = symbol.upper().replace(".TO", "").replace(".TSX", "")
 
     # Underlying symbol may have a different ticker symbol than the ticker used to lookup options.
-    if len(SYMBOLS[SYMBOLS["underlying_symbol"].str.contains(symbol)]) == 1:
-        symbol = SYMBOLS[SYMBOLS["underlying_symbol"] == symbol].index.values[0]
+    roots = directory["underlyings"].get(symbol, [])
+    if len(roots) == 1:
+        return roots[0]
     # Check if the symbol has options trading.
-    if symbol not in SYMBOLS.index and not SYMBOLS.empty:
+    if symbol not in directory["roots"] and directory["roots"]:
         raise ValueError(
             f"The symbol, {symbol}, is not a valid listing or does not trade options."
         )
 
-    QUOTES_URL = f"https://www.m-x.ca/en/trading/data/quotes?symbol={symbol}"
+    return symbol
+
+
+def encode_contract_symbols(
+    root: Union[str, pd.Series],
+    expiration: pd.Series,
+    option_type: pd.Series,
+    strike: pd.Series,
+) -> pd.Series:
+    """Creates OCC-style contract symbols for a chain of options.
+
+    The symbol is the root, padded to six characters, followed by the expiration as YYMMDD,
+    the option type as C or P, and the strike price multiplied by 1000, padded to eight digits.
+    For example, "RY    240315C00120500".
+
+    Parameters
+    ----------
+    root: Union[str, pd.Series]
+        The option root symbol, or a Series of them.
+    expiration: pd.Series
+        The expiration dates, as date objects or YYYY-MM-DD strings.
+    option_type: pd.Series
+        The option types, as "call" and "put", or "C" and "P".
+    strike: pd.Series
+        The strike prices.
+
+    Returns
+    -------
+    pd.Series
+        The contract symbols, with the same index as the inputs.
+    """
+    expiration = pd.Series(expiration)
+    index = expiration.index
+    # There are only a few distinct expirations in a chain, so each is formatted once.
+    expirations = expiration.map(
+        {e: pd.Timestamp(e).strftime("%y%m%d") for e in expiration.unique()}
+    )
+    roots = (
+        pd.Series(root, index=index).str.ljust(6)
+        if isinstance(root, pd.Series)
+        else pd.Series(root.upper().ljust(6), index=index)
+    )
+    types = pd.Series(option_type, index=index).str[0].str.upper()
+    strikes = (
+        (pd.to_numeric(pd.Series(strike, index=index)) * 1000)
+        .round()
+        .astype("int64")
+        .astype(str)
+        .str.zfill(8)
+    )
+
+    return roots + expirations + types + strikes
+
+
+def decode_contract_symbols(contract_symbols: pd.Series) -> pd.DataFrame:
+    """Parses OCC-style contract symbols back into their components.
+
+    This is the inverse of `encode_contract_symbols`.
+
+    Parameters
+    ----------
+    contract_symbols: pd.Series
+        The contract symbols to parse.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with columns: root, expiration (YYYY-MM-DD), option_type ("call" or "put"), and strike.
+    """
+    symbols = pd.Series(contract_symbols).astype(str)
+    # Parse from the right, the root symbol can be longer than six characters.
+    dates = symbols.str[-15:-9]
+    expirations = dates.map(
+        {d: datetime.strptime(d, "%y%m%d").strftime("%Y-%m-%d") for d in dates.unique()}
+    )
+    return pd.DataFrame(
+        {
+            "root": symbols.str[:-15].str.rstrip(),
+            "expiration": expirations,
+            "option_type": symbols.str[-9].map({"C": "call", "P": "put"}),
+            "strike": symbols.str[-8:].astype("int64") / 1000,
+        },
+        index=symbols.index,
+    )
+
+
+# Each row of the quotes table has the details of both contracts in a JSON attribute.
+QUOTES_ROW_PATTERN = re.compile(r"data-row='([^']*)'")
+
+# The last price of the underlying asset, shown above the quotes table.
+UNDERLYING_PRICE_PATTERN = re.compile(r"Last price:\s*<b[^>]*>([\d.,]+)</b>")
+
+QUOTES_COLUMNS = {
+    "expiry_date": "expiration",
+    "strike_price": "strike",
+    "bid_price": "bid",
+    "ask_price": "ask",
+    "last_price": "lastTradePrice",
+    "net_change": "change",
+    "open_interest": "openInterest",
+    "volume": "volume",
+}
+
+
+def parse_quotes_table(text: str) -> pd.DataFrame:
+    """Parses the options chain from the HTML of the quotes page.
+
+    The JSON attribute of each row is read directly, falling back to the HTML table if it is not present.
+    """
+
+    rows = QUOTES_ROW_PATTERN.findall(text)
+    chains = _parse_quotes_html(text) if not rows else _parse_quotes_rows(rows)
+    underlying_price = UNDERLYING_PRICE_PATTERN.search(text)
+    chains["underlyingPrice"] = (
+        float(underlying_price.group(1).replace(",", "")) if underlying_price else None
+    )
+
+    return chains
+
+
+def _parse_quotes_rows(rows: List[str]) -> pd.DataFrame:
+    """Parses the options chain from the JSON attributes of the quotes table rows."""
+
+    records = []
+    for row in rows:
+        contracts = json.loads(html.unescape(row))
+        for option_type in ["call", "put"]:
+            contract = contracts.get(option_type)
+            if contract:
+                records.append(
+                    {
+                        **{v: contract.get(k) for k, v in QUOTES_COLUMNS.items()},
+                        "optionType": option_type,
+                    }
+                )
+
+    chains = pd.DataFrame.from_records(
+        records, columns=[*QUOTES_COLUMNS.values(), "optionType"]
+    )
+    chains["strike"] = chains["strike"].astype(float)
+
+    return _format_quotes_table(chains)
+
+
+def _parse_quotes_html(text: str) -> pd.DataFrame:
+    """Parses the options chain from the HTML table of the quotes page."""
 
     cols = [
         "expiration",
@@ -329,8 +1114,7 @@ async def get_current_options(symbol: str, use_cache: bool = True) -> pd.DataFra
         "optionType",
     ]
 
-    r = await get_data_from_url(QUOTES_URL, use_cache=False)
-    data = pd.read_html(StringIO(r))[0]
+    data = pd.read_html(StringIO(text))[0]
     data = data.iloc[:-1]
 
     expirations = (
@@ -350,15 +1134,19 @@ async def get_current_options(symbol: str, use_cache: bool = True) -> pd.DataFra
     calls["expiration"] = pd.DatetimeIndex(calls["expiration"]).astype(str)
     calls["optionType"] = "call"
     calls.columns = cols
-    calls = calls.set_index(["expiration", "strike", "optionType"])
 
     puts = pd.concat([expirations, strikes, data["Puts"]], axis=1)
     puts["expiration"] = pd.DatetimeIndex(puts["expiration"]).astype(str)
     puts["optionType"] = "put"
     puts.columns = cols
-    puts = puts.set_index(["expiration", "strike", "optionType"])
 
-    chains = pd.concat([calls, puts])
+    return _format_quotes_table(pd.concat([calls, puts]))
+
+
+def _format_quotes_table(chains: pd.DataFrame) -> pd.DataFrame:
+    """Sets the types and sort order of the parsed options chain."""
+
+    chains = chains.set_index(["expiration", "strike", "optionType"])
     chains["openInterest"] = chains["openInterest"].astype("int64")
     chains["volume"] = chains["volume"].astype("int64")
     chains["change"] = chains["change"].astype(float)
@@ -366,90 +1154,140 @@ async def get_current_options(symbol: str, use_cache: bool = True) -> pd.DataFra
     chains["bid"] = chains["bid"].astype(float)
     chains["ask"] = chains["ask"].astype(float)
     chains = chains.sort_index()
-    chains = chains.reset_index()
+
+    return chains.reset_index()
+
+
+async def get_current_options(symbol: str, use_cache: bool = True) -> pd.DataFrame:
+    """Gets the current quotes for the complete options chain."""
+
+    symbol = await get_options_root(symbol, use_cache=use_cache)
+
+    return await get_current_root_options(symbol)
+
+
+async def get_current_root_options(symbol: str) -> pd.DataFrame:
+    """Gets the current quotes for the complete options chain of an option root symbol."""
+
+    QUOTES_URL = f"https://www.m-x.ca/en/trading/data/quotes?symbol={symbol}"
+
+    r = await get_data_from_url(QUOTES_URL, use_cache=False)
+    chains = await run_parser(parse_quotes_table, r)
+
     now = datetime.now()
     temp = pd.DatetimeIndex(chains.expiration)
     temp_ = (temp - now).days + 1  # type: ignore
     chains["dte"] = temp_
 
     # Create the standardized contract symbol.
-    _strikes = chains["strike"]
-    strikes = []
-    for _strike in _strikes:
-        _strike = str(_strike).split(".")
-        front = "0" * (5 - len(_strike[0]))
-        back = "0" * (3 - len(_strike[1]))
-        strike = f"{front}{_strike[0]}{_strike[1]}{back}"
-        strikes.append(str(strike))
-
-    chains["strikes"] = strikes
-    chains["contract_symbol"] = (
-        symbol
-        + " " * (6 - len(symbol))
-        + pd.to_datetime(chains["expiration"]).dt.strftime("%y%m%d")
-        + (chains["optionType"].replace("call", "C").replace("put", "P"))
-        + chains["strikes"]
-    )
-    chains.drop(columns=["strikes"], inplace=True)
+    chains["contract_symbol"] = encode_contract_symbols(
+        symbol, chains["expiration"], chains["optionType"], chains["strike"]
+    )
 
     chains.columns = [to_snake_case(c) for c in chains.columns.to_list()]
 
     return chains
 
 
-async def download_eod_chains(
-    symbol: str, date: Optional[dateType] = None, use_cache: bool = False
-) -> pd.DataFrame:
-    """Downloads EOD chains data for a given symbol and date."""
+async def scan_options_chains(
+    symbols: Union[str, List[str]] = "all",
+    date: Optional[dateType] = None,
+    use_cache: bool = True,
+) -> AsyncIterator[Tuple[str, pd.DataFrame]]:
+    """Streams the options chains of many underlyings, in the order the downloads complete.
 
-    symbol = symbol.upper()
-    SYMBOLS = await get_all_options_tickers(use_cache=False)
-    # Remove echange  identifiers from the symbol.
-    if ".TO" in symbol:
-        symbol = symbol.replace(".TO", "")
-    if ".TSX" in symbol:
-        symbol = symbol.replace(".TSX", "")
+    Every chain is downloaded concurrently, limited by the host limiter, see `get_host_limiter`.
 
-    # Underlying symbol may have a different ticker symbol than the ticker used to lookup options.
-    if len(SYMBOLS[SYMBOLS["underlying_symbol"].str.contains(symbol)]) == 1:
-        symbol = SYMBOLS[SYMBOLS["underlying_symbol"] == symbol].index.values[0]
-    # Check if the symbol has options trading.
-    if symbol not in SYMBOLS.index and not SYMBOLS.empty:
-        raise ValueError(
-            f"The symbol, {symbol}, is not a valid listing or does not trade options."
-        )
+    Parameters
+    ----------
+    symbols: Union[str, List[str]]
+        The ticker symbols, or option root symbols. Enter "all" for every listing in the options directory.
+    date: Optional[date]
+        The EOD chains for a specific date. Default is the current quotes.
+    use_cache: bool
+        Set as False to refresh the options directory.
+
+    Yields
+    ------
+    Tuple[str, pd.DataFrame]
+        The option root symbol, and its chain with an "underlying_symbol" column.
+        Symbols that are not found, or fail to download, are omitted.
+    """
 
-    BASE_URL = "https://www.m-x.ca/en/trading/data/historical?symbol="
+    directory = await get_options_directory(use_cache=use_cache)
+    if isinstance(symbols, str) and symbols.lower() == "all":
+        roots = directory["listings"].index.unique().tolist()
+    else:
+        symbols = symbols.split(",") if isinstance(symbols, str) else symbols
+        roots = []
+        for symbol in symbols:
+            try:
+                root = resolve_options_root(directory, symbol)
+            except ValueError:
+                continue
+            if root not in roots:
+                roots.append(root)
+
+    async def create_task(root: str) -> Tuple[str, Optional[pd.DataFrame]]:
+        """Download the chain for a single root symbol."""
+        try:
+            chains = (
+                await download_eod_chains(root, date=date, use_cache=use_cache)
+                if date is not None
+                else await get_current_root_options(root)
+            )
+        except Exception:  # pylint: disable=broad-except
+            return root, None
+        underlying = directory["roots"].get(root, {}).get("underlying_symbol")
+        chains.insert(0, "underlying_symbol", underlying or root)
+        return root, chains
 
-    cal = mcal.get_calendar(name="TSX")
-    holidays = list(cal.regular_holidays.holidays().strftime("%Y-%m-%d"))  # type: ignore
+    tasks = [asyncio.ensure_future(create_task(root)) for root in roots]
+    try:
+        for task in asyncio.as_completed(tasks):
+            root, chains = await task
+            if chains is not None and not chains.empty:
+                yield root, chains
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def get_options_chains_table(
+    symbols: Union[str, List[str]] = "all",
+    date: Optional[dateType] = None,
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """Gets the options chains of many underlyings as a single table.
 
-    if date is None:
-        EOD_URL = BASE_URL + f"{symbol}" "&dnld=1#quotes"
-    if date is not None:
-        date = check_weekday(date)  # type: ignore
-        if date in holidays:
-            date = (pd.to_datetime(date) + timedelta(days=1)).strftime("%Y-%m-%d")  # type: ignore
-        date = check_weekday(date)  # type: ignore
-        if date in holidays:
-            date = (pd.to_datetime(date) + timedelta(days=1)).strftime("%Y-%m-%d")  # type: ignore
+    See `scan_options_chains` for the parameters. The table is sorted by underlying symbol,
+    and each chain keeps its own sort order.
+    """
 
-        EOD_URL = (
-            BASE_URL + f"{symbol}" "&from=" f"{date}" "&to=" f"{date}" "&dnld=1#quotes"
-        )
+    chains = [
+        chain async for _, chain in scan_options_chains(symbols, date, use_cache)
+    ]
+    if not chains:
+        return pd.DataFrame()
+
+    return (
+        pd.concat(chains, ignore_index=True)
+        .sort_values("underlying_symbol", kind="stable")
+        .reset_index(drop=True)
+    )
 
-    r = await get_data_from_url(EOD_URL, use_cache=use_cache)  # type: ignore
 
-    if r is None:
-        raise RuntimeError("Error with the request, no data was returned.")
+def parse_eod_chains(text: str) -> pd.DataFrame:
+    """Parses the EOD chains CSV file, which may contain more than one trade date."""
 
-    data = pd.read_csv(StringIO(r))
+    data = pd.read_csv(StringIO(text))
     if data.empty:
-        raise ValueError(
-            f"No data found for, {symbol}, on, {date}. The symbol may not have been listed, or traded options, before that date."
-        )
+        return data
 
-    data["contractSymbol"] = data["Symbol"]
+    # The root symbol is held here until the contract symbols are encoded.
+    data["contractSymbol"] = data["Root Symbol"]
+    # The exchange's own symbol for each contract is kept alongside the encoded one.
+    exchange_symbols = data["Symbol"].astype(str).str.strip()
 
     data["optionType"] = data["Call/Put"].replace(0, "call").replace(1, "put")
 
@@ -489,28 +1327,272 @@ async def download_eod_chains(
     ]
 
     data.columns = cols
+    data["exchangeSymbol"] = exchange_symbols
 
     data["expiration"] = pd.to_datetime(data["expiration"], format="%Y-%m-%d")
     data["date"] = pd.to_datetime(data["date"], format="%Y-%m-%d")
     data["impliedVolatility"] = 0.01 * data["impliedVolatility"]
-
-    date_ = data["date"]
-    temp = pd.DatetimeIndex(data.expiration)
-    temp_ = temp - date_  # type: ignore
-    data["dte"] = [pd.Timedelta(_temp_).days for _temp_ in temp_]
-    data = data.set_index(["expiration", "strike", "optionType"]).sort_index()
-    data["date"] = data["date"].astype(str)
-    underlying_price = data.iloc[-1]["lastTradePrice"]
-    data["underlyingPrice"] = underlying_price
-    data = data.reset_index()
-    data = data[data["strike"] != 0]
-    data["expiration"] = pd.to_datetime(data["expiration"]).dt.strftime("%Y-%m-%d")
+    data["dte"] = (data["expiration"] - data["date"]).dt.days
+    data = data.sort_values(["date", "expiration", "strike", "optionType"])
+    # The underlying is the last row of each trade date, sorted after the contracts.
+    data["underlyingPrice"] = data.groupby("date")["lastTradePrice"].transform("last")
+    data["date"] = data["date"].dt.strftime("%Y-%m-%d")
+    data = data.set_index(["expiration", "strike", "optionType"]).reset_index()
+    data = data[data["strike"] != 0].copy()
+    data["contractSymbol"] = encode_contract_symbols(
+        data["contractSymbol"], data["expiration"], data["optionType"], data["strike"]
+    )
+    data["expiration"] = data["expiration"].dt.strftime("%Y-%m-%d")
 
     data.columns = [to_snake_case(c) for c in data.columns.to_list()]
 
+    return data.reset_index(drop=True)
+
+
+# The columns that identify the header of the EOD chains file, see `parse_eod_chains`.
+EOD_CHAINS_HEADER = ["Symbol", "Root Symbol", "Call/Put"]
+
+
+def is_eod_chains_file(text: Any) -> bool:
+    """Checks if a response is the EOD chains CSV file, with its header, and not an error page or an empty body."""
+    if not isinstance(text, str) or not text.strip():
+        return False
+    header = [c.strip().strip('"') for c in text.lstrip().split("\n", 1)[0].split(",")]
+    return all(column in header for column in EOD_CHAINS_HEADER)
+
+
+async def download_eod_chains(
+    symbol: str, date: Optional[dateType] = None, use_cache: bool = False
+) -> pd.DataFrame:
+    """Downloads EOD chains data for a given symbol and date.
+
+    When a date is supplied, the chain is read from, or saved to, the local EOD chains archive.
+    """
+
+    symbol = await get_options_root(symbol)
+
+    BASE_URL = "https://www.m-x.ca/en/trading/data/historical?symbol="
+
+    cal = mcal.get_calendar(name="TSX")
+    holidays = list(cal.regular_holidays.holidays().strftime("%Y-%m-%d"))  # type: ignore
+
+    if date is None:
+        EOD_URL = BASE_URL + f"{symbol}" "&dnld=1#quotes"
+        r = await get_data_from_url(EOD_URL, use_cache=use_cache)  # type: ignore
+        if r is None:
+            raise RuntimeError("Error with the request, no data was returned.")
+        data = await run_parser(parse_eod_chains, r)
+
+    if date is not None:
+        date = check_weekday(date)  # type: ignore
+        if date in holidays:
+            date = (pd.to_datetime(date) + timedelta(days=1)).strftime("%Y-%m-%d")  # type: ignore
+        date = check_weekday(date)  # type: ignore
+        if date in holidays:
+            date = (pd.to_datetime(date) + timedelta(days=1)).strftime("%Y-%m-%d")  # type: ignore
+
+        data = await download_eod_chains_range(
+            symbol, start_date=date, end_date=date, use_cache=use_cache  # type: ignore
+        )
+
+    if data.empty:
+        raise ValueError(
+            f"No data found for, {symbol}, on, {date}. The symbol may not have been listed, or traded options, before that date."
+        )
+
     return data
 
 
+# The maximum number of trading days requested in a single EOD chains download.
+EOD_CHAINS_MAX_DAYS = 20
+
+
+def get_eod_chains_archive(symbol: str) -> Path:
+    """Gets the directory of the local EOD chains archive for an option root symbol.
+
+    Each trade date is stored as a separate file, `{archive}/{YYYY-MM-DD}.csv.gz`.
+    """
+    return Path(cache_dir).joinpath("tmx", "options_eod", symbol.upper())
+
+
+def get_options_trading_days(
+    start_date: Union[str, dateType], end_date: Union[str, dateType]
+) -> List[str]:
+    """Gets the TSX trading days between two dates, inclusive, as YYYY-MM-DD strings."""
+    cal = mcal.get_calendar(name="TSX")
+    days = cal.valid_days(start_date=start_date, end_date=end_date)
+    return days.strftime("%Y-%m-%d").to_list()
+
+
+async def download_eod_chains_range(
+    symbol: str,
+    start_date: Union[str, dateType],
+    end_date: Union[str, dateType],
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """Downloads EOD chains data for a given symbol over a range of dates.
+
+    Trade dates already in the local archive are read from disk, and only the missing dates are downloaded.
+    Consecutive missing dates are requested as a single range, and the results are split by trade date
+    into the archive.
+
+    Parameters
+    ----------
+    symbol: str
+        The ticker symbol, or option root symbol.
+    start_date: Union[str, date]
+        The first trade date of the range.
+    end_date: Union[str, date]
+        The last trade date of the range.
+    use_cache: bool
+        Set as False to download every date in the range again, replacing the archived files.
+
+    Returns
+    -------
+    pd.DataFrame
+        The EOD chains for every trade date in the range, sorted by date.
+    """
+
+    symbol = await get_options_root(symbol)
+    archive = get_eod_chains_archive(symbol)
+    days = get_options_trading_days(start_date, end_date)
+    if not days:
+        return pd.DataFrame()
+
+    missing = (
+        [day for day in days if not archive.joinpath(f"{day}.csv.gz").exists()]
+        if use_cache is True
+        else days
+    )
+
+    # Group the missing dates into runs of consecutive trading days.
+    positions = {day: i for i, day in enumerate(days)}
+    chunks: List[List[str]] = []
+    for day in missing:
+        if (
+            chunks
+            and positions[day] == positions[chunks[-1][-1]] + 1
+            and len(chunks[-1]) < EOD_CHAINS_MAX_DAYS
+        ):
+            chunks[-1].append(day)
+        else:
+            chunks.append([day])
+
+    today = datetime.now(pytz.timezone("America/Toronto")).strftime("%Y-%m-%d")
+
+    async def create_task(chunk: List[str]) -> None:
+        """Download a run of dates and save each trade date to the archive."""
+        url = (
+            "https://www.m-x.ca/en/trading/data/historical?symbol="
+            f"{symbol}&from={chunk[0]}&to={chunk[-1]}&dnld=1#quotes"
+        )
+        r = await get_data_from_url(url, use_cache=False)
+        if r is None:
+            raise RuntimeError("Error with the request, no data was returned.")
+        # An error page, or an empty body, is not archived, so the dates are requested again by the next call.
+        if not is_eod_chains_file(r):
+            warnings.warn(
+                f"The EOD chains of {symbol} from {chunk[0]} to {chunk[-1]}"
+                + " were not returned, and will be requested again."
+            )
+            return
+        data = await run_parser(parse_eod_chains, r)
+        archive.mkdir(parents=True, exist_ok=True)
+        saved = set()
+        if not data.empty:
+            for day, chain in data.groupby("date"):
+                chain.to_csv(archive.joinpath(f"{day}.csv.gz"), index=False)
+                saved.add(day)
+        # Settled dates without data in a valid file are saved empty so they are not requested again.
+        for day in chunk:
+            if day not in saved and day < today:
+                pd.DataFrame(columns=data.columns).to_csv(
+                    archive.joinpath(f"{day}.csv.gz"), index=False
+                )
+
+    await asyncio.gather(*[create_task(chunk) for chunk in chunks])
+
+    return await run_parser(read_eod_chains_archive, archive, days)
+
+
+def read_eod_chains_archive(archive: Path, days: List[str]) -> pd.DataFrame:
+    """Reads the archived EOD chains for a list of trade dates."""
+
+    chains = []
+    for day in days:
+        file = archive.joinpath(f"{day}.csv.gz")
+        if file.exists():
+            try:
+                chain = pd.read_csv(file)
+            except pd.errors.EmptyDataError:
+                continue
+            if not chain.empty:
+                chains.append(chain)
+
+    return pd.concat(chains, ignore_index=True) if chains else pd.DataFrame()
+
+
+async def download_eod_chains_bulk(
+    symbols: List[str],
+    start_date: Union[str, dateType],
+    end_date: Union[str, dateType],
+    use_cache: bool = True,
+    max_concurrent: int = 4,
+) -> Dict[str, pd.DataFrame]:
+    """Downloads, or catches up, the EOD chains archive for many symbols concurrently.
+
+    Parameters
+    ----------
+    symbols: List[str]
+        The ticker symbols, or option root symbols.
+    start_date: Union[str, date]
+        The first trade date of the range.
+    end_date: Union[str, date]
+        The last trade date of the range.
+    use_cache: bool
+        Set as False to download every date in the range again.
+    max_concurrent: int
+        The maximum number of symbols downloading at the same time.
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        Dictionary of the EOD chains for each symbol. Symbols that fail are omitted.
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+    results: Dict[str, pd.DataFrame] = {}
+
+    async def create_task(symbol: str) -> None:
+        """Download the range for a single symbol."""
+        async with semaphore:
+            try:
+                results[symbol] = await download_eod_chains_range(
+                    symbol, start_date, end_date, use_cache=use_cache
+                )
+            except Exception:  # pylint: disable=broad-except
+                return None
+
+    await asyncio.gather(*[create_task(symbol) for symbol in symbols])
+
+    return results
+
+
+def _company_filings_payload(
+    symbol: str, start_date: Optional[str], end_date: Optional[str], limit: int
+) -> Dict:
+    """Returns a new payload for the company filings query."""
+    return {
+        **gql.get_company_filings_payload,
+        "variables": {
+            "symbol": symbol,
+            "fromDate": start_date,
+            "toDate": end_date,
+            "limit": limit,
+        },
+    }
+
+
 async def get_company_filings(
     symbol: str,
     start_date: Optional[str] = (datetime.now() - timedelta(days=30)).strftime(
@@ -524,11 +1606,7 @@ async def get_company_filings(
     results: List[Dict] = []
     symbol = symbol.upper().replace("-", ".").replace(".TO", "").replace(".TSX", "")
 
-    payload = gql.get_company_filings_payload
-    payload["variables"]["symbol"] = symbol
-    payload["variables"]["fromDate"] = start_date
-    payload["variables"]["toDate"] = end_date
-    payload["variables"]["limit"] = limit
+    payload = _company_filings_payload(symbol, start_date, end_date, limit)
     url = "https://app-money.tmx.com/graphql"
     try:
         r = await get_data_from_gql(
@@ -563,6 +1641,160 @@ async def get_company_filings(
     return results
 
 
+# The maximum number of filings requested for each window, and the first width of the windows.
+# Windows that return the maximum are split in two, until they are a single day.
+FILINGS_WINDOW_LIMIT = 1000
+FILINGS_WINDOW_DAYS = 182
+
+# The number of times a failed window is requested again, and the delay before the first retry, in seconds.
+# The delay doubles with each retry.
+FILINGS_WINDOW_RETRIES = 2
+FILINGS_RETRY_BACKOFF = 1.0
+
+
+async def get_company_filings_window(
+    symbol: str,
+    start_date: dateType,
+    end_date: dateType,
+    limit: int = FILINGS_WINDOW_LIMIT,
+    retries: int = FILINGS_WINDOW_RETRIES,
+    backoff: float = FILINGS_RETRY_BACKOFF,
+) -> Tuple[Optional[List[Dict]], int]:
+    """Gets the filings of a company for a single window of dates.
+
+    A failed request is retried after `backoff` seconds, doubling with each retry.
+
+    Returns
+    -------
+    Tuple[Optional[List[Dict]], int]
+        The filings, or None when every attempt failed, and the number of requests made.
+    """
+    payload = _company_filings_payload(
+        symbol, start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"), limit
+    )
+    requests = 0
+    for attempt in range(retries + 1):
+        if attempt > 0:
+            await asyncio.sleep(backoff * 2 ** (attempt - 1))
+        requests += 1
+        try:
+            response = await get_data_from_gql(
+                url="https://app-money.tmx.com/graphql",
+                data=json.dumps(payload),
+                headers={
+                    "authority": "app-money.tmx.com",
+                    "referer": f"https://money.tmx.com/en/quote/{symbol}",
+                    "locale": "en",
+                    "Content-Type": "application/json",
+                    "User-Agent": get_random_agent(),
+                    "Accept": "*/*",
+                },
+            )
+        except Exception:  # pylint: disable=broad-except
+            continue
+        if isinstance(response, dict) and isinstance(response.get("data"), dict):
+            return response["data"].get("filings") or [], requests
+
+    return None, requests
+
+
+async def download_company_filings(
+    symbol: str,
+    start_date: dateType,
+    end_date: dateType,
+    limit: int = FILINGS_WINDOW_LIMIT,
+    window_days: int = FILINGS_WINDOW_DAYS,
+    max_concurrent: int = 4,
+) -> Tuple[List[Dict], Dict[str, int]]:
+    """Gets the filings of a company for a range of dates, splitting the range only where it is needed.
+
+    The range starts as windows of `window_days`. A window that returns `limit` filings
+    is split in two and each half is requested again. Companies with few filings need a single request,
+    and only the busy periods of large issuers are split.
+    A window that fails is retried with a backoff, and is not split.
+
+    Parameters
+    ----------
+    symbol: str
+        The ticker symbol of the company.
+    start_date: date
+        The first date of the range.
+    end_date: date
+        The last date of the range.
+    limit: int
+        The maximum number of filings requested for each window.
+    window_days: int
+        The number of days in each of the first windows.
+    max_concurrent: int
+        The maximum number of requests at the same time.
+
+    Returns
+    -------
+    Tuple[List[Dict], Dict[str, int]]
+        The filings, newest first, and the requests made by this query.
+        "requests" is the number of requests, including retries, "windows" the number of windows in the final plan,
+        "splits" the number of windows split in two, "saturated" the number of single days that still returned
+        the limit, and "failed" the number of windows that could not be downloaded.
+
+    Raises
+    ------
+    RuntimeError
+        When every window failed.
+    """
+    symbol = symbol.upper().replace("-", ".").replace(".TO", "").replace(".TSX", "")
+    semaphore = asyncio.Semaphore(max_concurrent)
+    stats = {"requests": 0, "windows": 0, "splits": 0, "saturated": 0, "failed": 0}
+    results: List[Dict] = []
+
+    async def create_task(start: dateType, end: dateType) -> None:
+        """Get a single window, and split it when it is saturated."""
+        async with semaphore:
+            filings, requests = await get_company_filings_window(
+                symbol, start, end, limit
+            )
+        stats["requests"] += requests
+        saturated = filings is not None and len(filings) >= limit
+        if saturated and end > start:
+            middle = start + (end - start) // 2
+            stats["splits"] += 1
+            await asyncio.gather(
+                create_task(start, middle),
+                create_task(middle + timedelta(days=1), end),
+            )
+            return
+        stats["windows"] += 1
+        if filings is None:
+            stats["failed"] += 1
+            return
+        if saturated:
+            stats["saturated"] += 1
+        results.extend(filings)
+
+    windows = []
+    start = start_date
+    while start <= end_date:
+        end = min(start + timedelta(days=window_days - 1), end_date)
+        windows.append((start, end))
+        start = end + timedelta(days=1)
+    await asyncio.gather(*[create_task(start, end) for start, end in windows])
+    if stats["failed"] and stats["failed"] == stats["windows"]:
+        raise RuntimeError(
+            f"Error with the request, no filings were returned for {symbol}."
+        )
+    if stats["failed"]:
+        warnings.warn(
+            f"{stats['failed']} of {stats['windows']} windows of filings for {symbol}"
+            + " could not be downloaded, the results are incomplete."
+        )
+    if stats["saturated"]:
+        warnings.warn(
+            f"{stats['saturated']} days of filings for {symbol} returned the limit of {limit},"
+            + " some filings of those days may be missing."
+        )
+
+    return sorted(results, key=lambda x: x["filingDate"], reverse=True), stats
+
+
 async def get_daily_price_history(
     symbol: str,
     start_date: Optional[dateType] = None,
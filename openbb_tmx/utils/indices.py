@@ -0,0 +1,494 @@
+"""TMX Indices Module.
+
+A model of the S&P/TSX indices file, parsed once and shared by the index fetchers.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from openbb_tmx.utils.helpers import (
+    get_data_from_url,
+    get_quotes_for_symbols,
+    read_response,
+    run_parser,
+    tmx_indices_backend,
+)
+
+# All index data is from a single JSON file, updated each day after close.
+INDICES_URL = "https://tmxinfoservices.com/files/indices/sptsx-indices.json"
+
+# HTML tags, and additional artifacts, removed from the overview of each index.
+OVERVIEW_PATTERNS = [re.compile("<.*?>"), re.compile("\r|\n|amp;")]
+
+# The model of the last indices file, see `get_indices_model`.
+_indices_model: Dict[str, Any] = {}
+
+
+def clean_overview(overview: Optional[str]) -> Optional[str]:
+    """Removes the HTML from the overview of an index."""
+    if not overview:
+        return overview
+    for pattern in OVERVIEW_PATTERNS:
+        overview = pattern.sub("", overview)
+    return overview
+
+
+def _child_table(indices: Dict, column: str) -> Dict[str, Any]:
+    """Flattens a list of each index into a table, with the rows of each index contiguous."""
+    records: List[Dict] = []
+    bounds: Dict[str, tuple] = {}
+    for symbol, index in indices.items():
+        items = index.get(column) or []
+        start = len(records)
+        records.extend({"index": symbol, **item} for item in items)
+        if items:
+            bounds[symbol] = (start, len(records))
+    return {"table": pd.DataFrame.from_records(records), "bounds": bounds}
+
+
+def build_indices_model(content: bytes) -> Dict[str, Any]:
+    """Parses the indices file into the tables used by the index fetchers.
+
+    Parameters
+    ----------
+    content: bytes
+        The JSON file.
+
+    Returns
+    -------
+    Dict
+        "updated": The time the file was published.
+        "symbols": Dictionary of each index to its position in "overviews" and "snapshots".
+        "categories": Dictionary of each index to its categories.
+        "overviews": List of the description of each index, with the HTML removed.
+        "snapshots": List of the performance and quoted market value of each index.
+        "constituents": The constituents of every index, with an "index" column,
+        and the (start, stop) rows of each index as "bounds".
+        "sectors": The sector weights of every index, in the same format as "constituents".
+    """
+    data = json.loads(content)
+    indices: Dict[str, Dict] = data.get("indices") or {}
+
+    categories: Dict[str, List[str]] = {}
+    for category, symbols in (data.get("groups") or {}).items():
+        for symbol in symbols:
+            categories.setdefault(symbol, []).append(category)
+
+    overviews = []
+    snapshots = []
+    for symbol, index in indices.items():
+        name = index.get("name_en")
+        currency = "USD" if "(USD)" in (name or "") else "CAD"
+        market_value = index.get("quotedmarketvalue") or {}
+        overviews.append(
+            {
+                "symbol": symbol,
+                "name": name,
+                "currency": currency,
+                "category": ", ".join(categories.get(symbol, [])) or None,
+                "market_value": market_value.get("total"),
+                "num_constituents": index.get("nb_constituents"),
+                "overview": clean_overview(index.get("overview_en")),
+                "methodology": index.get("methodology") or None,
+                "factsheet": index.get("factsheet") or None,
+            }
+        )
+        snapshots.append(
+            {
+                "symbol": symbol,
+                "name": name,
+                "currency": currency,
+                **(index.get("performance") or {}),
+                **market_value,
+            }
+        )
+
+    sectors = _child_table(indices, "sectors")
+    if not sectors["table"].empty:
+        sectors["table"]["name"] = (
+            sectors["table"]["name"].astype(str).str.lower().str.replace(" ", "_")
+        )
+        sectors["table"] = sectors["table"].rename(columns={"name": "sector"})
+
+    return {
+        "updated": data.get("updated"),
+        "symbols": {symbol: i for i, symbol in enumerate(indices)},
+        "categories": categories,
+        "overviews": overviews,
+        "snapshots": snapshots,
+        "constituents": _child_table(indices, "constituents"),
+        "sectors": sectors,
+    }
+
+
+async def get_indices_model(use_cache: bool = True) -> Dict[str, Any]:
+    """Gets the model of the indices file.
+
+    The model is rebuilt only when the content of the file changes,
+    so the cached file is not parsed again by each fetcher.
+
+    Parameters
+    ----------
+    use_cache: bool
+        Set as False to bypass the cached file.
+
+    Returns
+    -------
+    Dict
+        See `build_indices_model`. Empty if the file could not be downloaded.
+    """
+    content = await get_data_from_url(
+        INDICES_URL,
+        use_cache=use_cache,
+        backend=tmx_indices_backend,
+        callback=read_response,
+    )
+    if not content:
+        return {}
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    if _indices_model.get("digest") != digest:
+        model = await run_parser(build_indices_model, content)
+        _indices_model.clear()
+        _indices_model.update(model, digest=digest)
+
+    return _indices_model
+
+
+def get_index_children(model: Dict[str, Any], name: str, symbol: str) -> List[Dict]:
+    """Gets the rows of a child table, "constituents" or "sectors", for one index."""
+    child = model[name]
+    if symbol not in child["bounds"]:
+        return []
+    start, stop = child["bounds"][symbol]
+    rows = child["table"].iloc[start:stop].drop(columns=["index"])
+    return rows.astype(object).where(rows.notna(), None).to_dict("records")
+
+
+def get_membership_index(model: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """Gets the reverse index of the constituents of every index, built once for each version of the file.
+
+    Returns
+    -------
+    Dict
+        Dictionary of each constituent symbol, in upper case, to its rows in the constituents table.
+    """
+    if "membership" not in model:
+        table = model["constituents"]["table"]
+        symbols = (
+            table["symbol"].astype(str).str.upper()
+            if "symbol" in table.columns
+            else pd.Series(dtype=object)
+        )
+        model["membership"] = symbols.groupby(symbols.values).indices
+    return model["membership"]
+
+
+def lookup_index_memberships(model: Dict[str, Any], symbols: List[str]) -> pd.DataFrame:
+    """Gets the indices that each of a list of securities is a constituent of.
+
+    Parameters
+    ----------
+    model: Dict
+        The model of the indices file, from `get_indices_model`.
+    symbols: List[str]
+        The ticker symbols of the securities.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rows of the constituents table for each security, with the symbol searched as "security",
+        and the name of the index as "index_name".
+        Sorted by the order of the securities, then by weight, descending.
+    """
+    membership = get_membership_index(model)
+    table = model["constituents"]["table"]
+    searched = [
+        symbol.strip().upper().replace(".TO", "").replace(".TSX", "").replace("-", ".")
+        for symbol in symbols
+    ]
+    matches = [membership.get(symbol, np.empty(0, dtype=int)) for symbol in searched]
+    positions = np.concatenate(matches) if matches else np.empty(0, dtype=int)
+    if len(positions) == 0:
+        return pd.DataFrame()
+
+    members = table.iloc[positions].reset_index(drop=True)
+    members.insert(0, "security", np.repeat(searched, [len(m) for m in matches]))
+    names = {d["symbol"]: d["name"] for d in model["overviews"]}
+    members["index_name"] = members["index"].map(names)
+    order = np.repeat(np.arange(len(matches)), [len(m) for m in matches])
+    weights = members["weight"].astype(float).fillna(-np.inf).to_numpy()
+    members = members.iloc[np.lexsort((-weights, order))].reset_index(drop=True)
+
+    return members
+
+
+async def get_index_snapshots(use_cache: bool = True) -> List[Dict]:
+    """Gets the performance and quoted market value of every index, with its current level.
+
+    Parameters
+    ----------
+    use_cache: bool
+        Set as False to bypass the cached indices file. Levels are never cached.
+
+    Returns
+    -------
+    List[Dict]
+        The snapshot of each index, see `build_indices_model`,
+        merged with its quote: price, prevClose, priceChange.
+        Indices in a batch of quotes that fails have no price, and are counted in a warning.
+    """
+    model = await get_indices_model(use_cache=use_cache)
+    if not model:
+        return []
+    quotes = await get_quotes_for_symbols(list(model["symbols"]))
+
+    return [{**d, **quotes.get(d["symbol"], {})} for d in model["snapshots"]]
+
+
+async def poll_index_snapshots(
+    interval: float = 60,
+    use_cache: bool = True,
+    iterations: Optional[int] = None,
+) -> AsyncIterator[List[Dict]]:
+    """Polls the index snapshots at a fixed cadence, yielding only the indices whose level changed.
+
+    Parameters
+    ----------
+    interval: float
+        The number of seconds between the start of each poll.
+    use_cache: bool
+        Set as False to bypass the cached indices file on the first poll.
+    iterations: Optional[int]
+        The number of polls. Default is to poll until the generator is closed.
+
+    Yields
+    ------
+    List[Dict]
+        The snapshots of the indices whose price changed since the previous poll.
+        The first poll has every index with a price. Polls without changes are not yielded.
+    """
+    levels: Dict[str, Any] = {}
+    loop = asyncio.get_running_loop()
+    count = 0
+    while iterations is None or count < iterations:
+        started = loop.time()
+        snapshots = await get_index_snapshots(
+            use_cache=use_cache if count == 0 else True
+        )
+        changed = [
+            d
+            for d in snapshots
+            if d.get("price") is not None and levels.get(d["symbol"]) != d["price"]
+        ]
+        levels.update({d["symbol"]: d["price"] for d in changed})
+        count += 1
+        if changed:
+            yield changed
+        if iterations is None or count < iterations:
+            await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
+
+
+def build_nowcast_state(
+    model: Dict[str, Any], indices: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Builds the state used to estimate index levels from the quotes of their constituents.
+
+    The level of an index is estimated as its previous close, multiplied by the weighted sum of
+    the return of each constituent since its previous close.
+    Only the constituents that changed are applied to the estimate, see `update_nowcast`.
+
+    Parameters
+    ----------
+    model: Dict
+        The model of the indices file, from `get_indices_model`.
+    indices: Optional[List[str]]
+        The symbols of the indices. Default is every index with constituents.
+
+    Returns
+    -------
+    Dict
+        "members": Dictionary of each constituent symbol to its (index, normalized weight) pairs.
+        "base": The previous close of each constituent, set by its first quote.
+        "prices": The last price of each constituent.
+        "ratios": The weighted sum of the constituent returns of each index, starting at 1.
+        "coverage": The weight of the constituents of each index that have a quote.
+        "levels": The previous close of each index, set by its first quote.
+        "official": The last official level of each index.
+        "errors": The error of the estimate versus the official level of each index.
+    """
+    table = model["constituents"]["table"]
+    bounds = model["constituents"]["bounds"]
+    indices = [i for i in (indices or list(bounds)) if i in bounds]
+    members: Dict[str, List[tuple]] = {}
+    for index in indices:
+        start, stop = bounds[index]
+        rows = table.iloc[start:stop]
+        weights = rows["weight"].astype(float).fillna(0)
+        total = weights.sum()
+        if not total:
+            continue
+        for symbol, weight in zip(rows["symbol"], weights / total):
+            members.setdefault(symbol, []).append((index, weight))
+    indices = sorted({index for pairs in members.values() for index, _ in pairs})
+
+    return {
+        "members": members,
+        "base": {},
+        "prices": {},
+        "ratios": {index: 1.0 for index in indices},
+        "coverage": {index: 0.0 for index in indices},
+        "levels": {},
+        "official": {},
+        "errors": {},
+    }
+
+
+def update_nowcast(state: Dict[str, Any], quotes: Dict[str, Dict]) -> List[str]:
+    """Applies the quotes of constituents to the estimated index levels.
+
+    Each constituent whose price changed adds its weighted return to the indices it belongs to,
+    so the cost is proportional to the number of changed constituents, not the size of the indices.
+
+    Parameters
+    ----------
+    state: Dict
+        The state, from `build_nowcast_state`.
+    quotes: Dict[str, Dict]
+        Dictionary of each symbol to its quote, from `get_quotes_for_symbols`.
+
+    Returns
+    -------
+    List[str]
+        The symbols of the indices whose estimate changed.
+    """
+    changed = set()
+    for symbol, quote in quotes.items():
+        members = state["members"].get(symbol)
+        price = quote.get("price")
+        if not members or not price:
+            continue
+        base = state["base"].get(symbol)
+        if base is None:
+            base = quote.get("prevClose") or price
+            state["base"][symbol] = base
+            state["prices"][symbol] = base
+            for index, weight in members:
+                state["coverage"][index] += weight
+        previous = state["prices"][symbol]
+        if price == previous:
+            continue
+        state["prices"][symbol] = price
+        change = (price - previous) / base
+        for index, weight in members:
+            state["ratios"][index] += weight * change
+            changed.add(index)
+
+    return sorted(changed)
+
+
+def observe_index_levels(state: Dict[str, Any], quotes: Dict[str, Dict]) -> None:
+    """Records the official levels of the indices, and the error of their estimates.
+
+    The first quote of an index sets its previous close, the base of its estimate.
+    The errors are: "error", the estimate less the official level, "error_percent", as a normalized percentage,
+    and "mean_absolute_error_percent", over every official level observed.
+    """
+    for index in state["ratios"]:
+        quote = quotes.get(index)
+        if not quote or not quote.get("price"):
+            continue
+        if index not in state["levels"]:
+            state["levels"][index] = quote.get("prevClose") or quote["price"]
+        price = quote["price"]
+        if state["official"].get(index) == price:
+            continue
+        state["official"][index] = price
+        estimate = state["levels"][index] * state["ratios"][index]
+        errors = state["errors"].setdefault(index, {"count": 0, "total": 0.0})
+        errors["count"] += 1
+        errors["error"] = estimate - price
+        errors["error_percent"] = (estimate - price) / price
+        errors["total"] += abs(errors["error_percent"])
+        errors["mean_absolute_error_percent"] = errors["total"] / errors["count"]
+
+
+def get_nowcast_levels(
+    state: Dict[str, Any], indices: Optional[List[str]] = None
+) -> List[Dict]:
+    """Gets the estimated level of each index, with the error versus the last official level.
+
+    Indices without a base level, see `observe_index_levels`, are omitted.
+    """
+    results = []
+    for index in indices or list(state["ratios"]):
+        if index not in state["levels"]:
+            continue
+        errors = state["errors"].get(index, {})
+        results.append(
+            {
+                "symbol": index,
+                "nowcast": state["levels"][index] * state["ratios"][index],
+                "price": state["official"].get(index),
+                "prev_close": state["levels"][index],
+                "coverage": state["coverage"][index],
+                "error": errors.get("error"),
+                "error_percent": errors.get("error_percent"),
+                "mean_absolute_error_percent": errors.get(
+                    "mean_absolute_error_percent"
+                ),
+            }
+        )
+    return results
+
+
+async def nowcast_index_levels(
+    indices: Optional[List[str]] = None,
+    interval: float = 15,
+    use_cache: bool = True,
+    iterations: Optional[int] = None,
+) -> AsyncIterator[List[Dict]]:
+    """Estimates the levels of indices between official updates, from the quotes of their constituents.
+
+    Parameters
+    ----------
+    indices: Optional[List[str]]
+        The symbols of the indices. Default is every index with constituents.
+    interval: float
+        The number of seconds between the start of each poll of the quotes.
+    use_cache: bool
+        Set as False to bypass the cached indices file.
+    iterations: Optional[int]
+        The number of polls. Default is to poll until the generator is closed.
+
+    Yields
+    ------
+    List[Dict]
+        The indices whose estimate, or official level, changed, see `get_nowcast_levels`.
+    """
+    model = await get_indices_model(use_cache=use_cache)
+    if not model:
+        return
+    state = build_nowcast_state(model, indices)
+    symbols = list(state["members"]) + list(state["ratios"])
+    loop = asyncio.get_running_loop()
+    count = 0
+    while iterations is None or count < iterations:
+        started = loop.time()
+        quotes = await get_quotes_for_symbols(symbols)
+        changed = set(update_nowcast(state, quotes))
+        official = dict(state["official"])
+        observe_index_levels(state, quotes)
+        changed.update(
+            i for i in state["official"] if state["official"][i] != official.get(i)
+        )
+        count += 1
+        results = get_nowcast_levels(state, sorted(changed))
+        if results:
+            yield results
+        if iterations is None or count < iterations:
+            await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
@@ -0,0 +1,407 @@
+"""TMX News Module.
+
+Page through the news of many symbols, and keep track of the items already seen for each symbol.
+Every item fetched is added to a local full-text index, see `search_news_index`.
+"""
+
+import asyncio
+import json
+import re
+import sqlite3
+import warnings
+from datetime import (
+    date as dateType,
+    datetime,
+    timedelta,
+    timezone,
+)
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from openbb_tmx.utils import gql
+from openbb_tmx.utils.helpers import (
+    cache_dir,
+    get_data_from_gql,
+    get_random_agent,
+    run_parser,
+)
+
+# The maximum number of items in each page of news.
+NEWS_PAGE_SIZE = 100
+
+# The maximum number of pages requested for a symbol, and the number of pages requested at the same time.
+NEWS_MAX_PAGES = 50
+NEWS_MAX_CONCURRENT = 4
+
+# The schema of the local news index, see `get_news_index`.
+NEWS_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS news (
+    id INTEGER PRIMARY KEY,
+    newsid TEXT UNIQUE NOT NULL,
+    datetime TEXT NOT NULL,
+    headline TEXT,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS news_datetime ON news (datetime);
+CREATE TABLE IF NOT EXISTS news_symbols (
+    symbol TEXT NOT NULL,
+    newsid TEXT NOT NULL,
+    PRIMARY KEY (symbol, newsid)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+    headline, source, content='news', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS news_insert AFTER INSERT ON news BEGIN
+    INSERT INTO news_fts (rowid, headline, source) VALUES (new.id, new.headline, new.source);
+END;
+"""
+
+# The words of a search, with an optional "*" for a prefix.
+SEARCH_TERM_PATTERN = re.compile(r"(\w+)(\*?)")
+
+# The newest item seen for each symbol, as {"datetime": datetime, "newsids": set}, see `get_news`.
+_news_cursors: Dict[str, Dict[str, Any]] = {}
+
+
+def parse_news_datetime(value: str) -> datetime:
+    """Parses the timestamp of a news item."""
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
+
+
+def _as_datetime(value: Union[dateType, datetime]) -> datetime:
+    """Returns a date as the start of the day, in the local timezone."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, datetime.min.time()).astimezone()
+
+
+async def get_news_page(
+    symbol: str, page: int = 1, limit: int = NEWS_PAGE_SIZE
+) -> List[Dict]:
+    """Gets a single page of news for a symbol, newest first.
+
+    Each item has: headline, datetime, source, newsid, summary, and the symbol as "symbols".
+    """
+    payload = {
+        **gql.get_company_news_events_payload,
+        "variables": {"symbol": symbol, "page": page, "limit": limit, "locale": "en"},
+    }
+    response = await get_data_from_gql(
+        url="https://app-money.tmx.com/graphql",
+        data=json.dumps(payload),
+        headers={
+            "authority": "app-money.tmx.com",
+            "referer": f"https://money.tmx.com/en/quote/{symbol}",
+            "locale": "en",
+            "Content-Type": "application/json",
+            "User-Agent": get_random_agent(),
+            "Accept": "*/*",
+        },
+    )
+    news = (response.get("data") or {}).get("news") or []
+
+    return [{**item, "symbols": symbol} for item in news if item]
+
+
+async def get_symbol_news(
+    symbol: str,
+    limit: Optional[int] = None,
+    start_date: Optional[Union[dateType, datetime]] = None,
+    page: int = 1,
+    max_concurrent: int = NEWS_MAX_CONCURRENT,
+) -> List[Dict]:
+    """Gets the news of a symbol, requesting pages until a number of items, or a date, is reached.
+
+    The first request is a single page, and each following batch of pages is twice as large,
+    up to `max_concurrent`, so short requests, like polling for new items, stay small.
+
+    Parameters
+    ----------
+    symbol: str
+        The ticker symbol.
+    limit: Optional[int]
+        The maximum number of items. Default is all items since `start_date`, or a single page.
+    start_date: Optional[Union[date, datetime]]
+        The oldest date of the items. A datetime must be timezone aware.
+    page: int
+        The page number to start from.
+    max_concurrent: int
+        The maximum number of pages requested at the same time.
+
+    Returns
+    -------
+    List[Dict]
+        The news items, newest first, without duplicates.
+    """
+    start_date = _as_datetime(start_date) if start_date is not None else None
+    page_size = (
+        min(limit, NEWS_PAGE_SIZE) if limit and start_date is None else NEWS_PAGE_SIZE
+    )
+    last_page = page + NEWS_MAX_PAGES - 1 if limit or start_date else page
+    results: List[Dict] = []
+    seen: set = set()
+    batch = 1
+    while page <= last_page:
+        if limit:
+            needed = -(-(limit - len(results)) // page_size)
+            batch = min(batch, needed)
+        pages = list(range(page, min(page + batch, last_page + 1)))
+        responses = await asyncio.gather(
+            *[get_news_page(symbol, p, page_size) for p in pages]
+        )
+        done = False
+        for news in responses:
+            for item in news:
+                if item.get("newsid") in seen:
+                    continue
+                seen.add(item.get("newsid"))
+                if start_date and parse_news_datetime(item["datetime"]) < start_date:
+                    done = True
+                    continue
+                results.append(item)
+            if len(news) < page_size:
+                done = True
+        if done or (limit and len(results) >= limit):
+            break
+        page += len(pages)
+        batch = min(batch * 2, max_concurrent)
+
+    return results[:limit] if limit else results
+
+
+async def get_news(
+    symbols: List[str],
+    limit: Optional[int] = None,
+    start_date: Optional[Union[dateType, datetime]] = None,
+    page: int = 1,
+    only_new: bool = False,
+) -> List[Dict]:
+    """Gets the news of many symbols, with items shared by several symbols returned once.
+
+    The newest item of each symbol is kept as a high-water mark,
+    so repeated polls with `only_new` only request, and return, the items published since.
+
+    Parameters
+    ----------
+    symbols: List[str]
+        The ticker symbols.
+    limit: Optional[int]
+        The maximum number of items for each symbol.
+    start_date: Optional[Union[date, datetime]]
+        The oldest date of the items.
+    page: int
+        The page number to start from.
+    only_new: bool
+        Return only the items newer than the last item seen for each symbol.
+
+    Returns
+    -------
+    List[Dict]
+        The news items, newest first. Items for several symbols have the symbols comma separated.
+    """
+    symbols = [
+        s.upper().replace(".TO", "").replace(".TSX", "").replace("-", ".")
+        for s in symbols
+    ]
+    symbols = list(dict.fromkeys(symbols))
+
+    async def create_task(symbol: str) -> List[Dict]:
+        """Get the news for a single symbol."""
+        cursor = _news_cursors.get(symbol) if only_new else None
+        since = _as_datetime(start_date) if start_date is not None else None
+        if cursor is not None:
+            since = max(since, cursor["datetime"]) if since else cursor["datetime"]
+        try:
+            news = await get_symbol_news(symbol, limit, since, page)
+        except Exception:  # pylint: disable=broad-except
+            return []
+        if cursor is not None:
+            news = [d for d in news if d.get("newsid") not in cursor["newsids"]]
+        _update_cursor(symbol, news)
+        return news
+
+    responses = await asyncio.gather(*[create_task(symbol) for symbol in symbols])
+    try:
+        await run_parser(write_news_index, [d for news in responses for d in news])
+    except (OSError, sqlite3.Error) as e:
+        warnings.warn(f"The news could not be added to the local news index -> {e}")
+    results: Dict[Any, Dict] = {}
+    for news in responses:
+        for item in news:
+            key = item.get("newsid") or (item.get("headline"), item.get("datetime"))
+            if key in results:
+                results[key]["symbols"] += f",{item['symbols']}"
+            else:
+                results[key] = item
+
+    return sorted(
+        results.values(), key=lambda d: parse_news_datetime(d["datetime"]), reverse=True
+    )
+
+
+def _update_cursor(symbol: str, news: List[Dict]) -> None:
+    """Moves the high-water mark of a symbol to its newest item."""
+    if not news:
+        return
+    newest = max(parse_news_datetime(d["datetime"]) for d in news)
+    cursor = _news_cursors.get(symbol)
+    if cursor is None or newest > cursor["datetime"]:
+        cursor = {"datetime": newest, "newsids": set()}
+        _news_cursors[symbol] = cursor
+    if newest == cursor["datetime"]:
+        cursor["newsids"].update(
+            d.get("newsid")
+            for d in news
+            if parse_news_datetime(d["datetime"]) == newest
+        )
+
+
+def get_news_index_path() -> Path:
+    """Gets the path of the local news index, a SQLite database with a full-text index of the headlines."""
+    return Path(cache_dir).joinpath("tmx", "news.db")
+
+
+def get_news_index() -> sqlite3.Connection:
+    """Opens the local news index, creating it when it does not exist."""
+    path = get_news_index_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path)
+    connection.row_factory = sqlite3.Row
+    connection.executescript(NEWS_INDEX_SCHEMA)
+    return connection
+
+
+def _utc_timestamp(value: datetime) -> str:
+    """Returns a datetime as a UTC timestamp, which sorts as text."""
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S%z")
+
+
+def write_news_index(news: List[Dict]) -> int:
+    """Adds news items to the local news index.
+
+    Parameters
+    ----------
+    news: List[Dict]
+        The news items, from `get_news_page`. Items already in the index only add their symbols.
+
+    Returns
+    -------
+    int
+        The number of items added.
+    """
+    items = [d for d in news if d.get("newsid") and d.get("datetime")]
+    if not items:
+        return 0
+    connection = get_news_index()
+    try:
+        with connection:
+            # The row count of the statement, without the writes of the full-text trigger.
+            added = connection.executemany(
+                "INSERT OR IGNORE INTO news (newsid, datetime, headline, source)"
+                + " VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        d["newsid"],
+                        _utc_timestamp(parse_news_datetime(d["datetime"])),
+                        d.get("headline"),
+                        d.get("source"),
+                    )
+                    for d in items
+                ],
+            ).rowcount
+            connection.executemany(
+                "INSERT OR IGNORE INTO news_symbols (symbol, newsid) VALUES (?, ?)",
+                [
+                    (symbol, d["newsid"])
+                    for d in items
+                    for symbol in str(d.get("symbols") or "").split(",")
+                    if symbol
+                ],
+            )
+    finally:
+        connection.close()
+
+    return added
+
+
+def search_news_index(
+    query: Optional[str] = None,
+    symbols: Optional[List[str]] = None,
+    start_date: Optional[Union[dateType, datetime]] = None,
+    end_date: Optional[Union[dateType, datetime]] = None,
+    limit: Optional[int] = 100,
+) -> List[Dict]:
+    """Searches the news in the local news index.
+
+    Parameters
+    ----------
+    query: Optional[str]
+        The words to search for in the headline, or source. Every word must match.
+        End a word with "*" to match it as a prefix.
+    symbols: Optional[List[str]]
+        The ticker symbols of the news. Default is all symbols.
+    start_date: Optional[Union[date, datetime]]
+        The oldest date of the news.
+    end_date: Optional[Union[date, datetime]]
+        The newest date of the news, inclusive.
+    limit: Optional[int]
+        The maximum number of items.
+
+    Returns
+    -------
+    List[Dict]
+        The news items, newest first, with: newsid, datetime, headline, source,
+        and the comma separated symbols of each item.
+    """
+    if not get_news_index_path().exists():
+        return []
+    conditions: List[str] = []
+    parameters: List[Any] = []
+    if query:
+        terms = [
+            f'"{term}"{prefix}' for term, prefix in SEARCH_TERM_PATTERN.findall(query)
+        ]
+        if not terms:
+            return []
+        conditions.append(
+            "news.id IN (SELECT rowid FROM news_fts WHERE news_fts MATCH ?)"
+        )
+        parameters.append(" ".join(terms))
+    if symbols:
+        symbols = [
+            s.upper().replace(".TO", "").replace(".TSX", "").replace("-", ".")
+            for s in symbols
+        ]
+        conditions.append(
+            "news.newsid IN (SELECT newsid FROM news_symbols WHERE symbol IN ("
+            + ", ".join("?" * len(symbols))
+            + "))"
+        )
+        parameters.extend(symbols)
+    if start_date:
+        conditions.append("news.datetime >= ?")
+        parameters.append(_utc_timestamp(_as_datetime(start_date)))
+    if end_date:
+        end = (
+            end_date
+            if isinstance(end_date, datetime)
+            else _as_datetime(end_date + timedelta(days=1)) - timedelta(seconds=1)
+        )
+        conditions.append("news.datetime <= ?")
+        parameters.append(_utc_timestamp(end))
+    sql = (
+        "SELECT news.newsid, news.datetime, news.headline, news.source,"
+        + " (SELECT group_concat(symbol) FROM news_symbols"
+        + " WHERE news_symbols.newsid = news.newsid) AS symbols"
+        + " FROM news"
+        + (" WHERE " + " AND ".join(conditions) if conditions else "")
+        + " ORDER BY news.datetime DESC"
+    )
+    if limit:
+        sql += " LIMIT ?"
+        parameters.append(limit)
+    connection = get_news_index()
+    try:
+        return [dict(row) for row in connection.execute(sql, parameters)]
+    finally:
+        connection.close()
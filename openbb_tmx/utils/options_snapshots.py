@@ -0,0 +1,320 @@
+"""TMX Options Snapshots Module.
+
+Store polls of the live options chains as a log of the fields that changed between polls.
+"""
+
+import gzip
+from datetime import (
+    date as dateType,
+    datetime,
+)
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from openbb_tmx.utils.helpers import (
+    cache_dir,
+    decode_contract_symbols,
+    get_current_options,
+    get_options_root,
+    run_parser,
+)
+
+# The fields of the options chain that are recorded.
+SNAPSHOT_FIELDS = ["bid", "ask", "last_trade_price", "volume", "open_interest"]
+
+# The columns of the change log.
+SNAPSHOT_COLUMNS = ["timestamp", "contract_symbol", "field", "value"]
+
+# The last recorded state of each option root symbol, as (trade date, state).
+_snapshot_states: Dict[str, Tuple[str, pd.DataFrame]] = {}
+
+
+def get_snapshots_archive(symbol: str) -> Path:
+    """Gets the directory of the local snapshots log for an option root symbol.
+
+    Each day is stored as a separate file, `{archive}/{YYYY-MM-DD}.csv.gz`.
+    The first poll of the day records every field, and later polls only record the fields that changed.
+    """
+    return Path(cache_dir).joinpath("tmx", "options_snapshots", symbol.upper())
+
+
+def diff_chain_snapshots(
+    previous: Optional[pd.DataFrame], current: pd.DataFrame, timestamp: str
+) -> pd.DataFrame:
+    """Gets the fields that changed between two polls of an options chain.
+
+    Parameters
+    ----------
+    previous: Optional[pd.DataFrame]
+        The previous state, indexed by contract symbol with a column for each of `SNAPSHOT_FIELDS`.
+        When None, every field with a value is returned.
+    current: pd.DataFrame
+        The options chain, with a "contract_symbol" column.
+    timestamp: str
+        The time of the current poll.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with columns: timestamp, contract_symbol, field, value.
+        Contracts in `previous` that are not in `current` have an empty value for each field they had.
+    """
+    current = (
+        current.drop_duplicates(subset=["contract_symbol"])
+        .set_index("contract_symbol")[SNAPSHOT_FIELDS]
+        .astype(float)
+    )
+    removed = pd.DataFrame(columns=SNAPSHOT_FIELDS)
+    if previous is None or previous.empty:
+        changed = current.notna().to_numpy()
+    else:
+        # Contracts that left the chain are recorded as empty values, so they are not carried forward.
+        removed = previous.loc[~previous.index.isin(current.index)].reindex(
+            columns=SNAPSHOT_FIELDS
+        )
+        previous = previous.reindex(index=current.index, columns=SNAPSHOT_FIELDS)
+        changed = ~(
+            (current == previous) | (current.isna() & previous.isna())
+        ).to_numpy()
+
+    rows, columns = np.nonzero(changed)
+    changes = pd.DataFrame(
+        {
+            "timestamp": timestamp,
+            "contract_symbol": current.index.to_numpy()[rows],
+            "field": np.array(SNAPSHOT_FIELDS)[columns],
+            "value": current.to_numpy()[rows, columns],
+        },
+        columns=SNAPSHOT_COLUMNS,
+    )
+    rows, columns = np.nonzero(removed.notna().to_numpy())
+    if len(rows) == 0:
+        return changes
+    removals = pd.DataFrame(
+        {
+            "timestamp": timestamp,
+            "contract_symbol": removed.index.to_numpy()[rows],
+            "field": np.array(SNAPSHOT_FIELDS)[columns],
+            "value": np.nan,
+        },
+        columns=SNAPSHOT_COLUMNS,
+    )
+
+    return pd.concat([changes, removals], ignore_index=True)
+
+
+def replay_chain_snapshots(log: pd.DataFrame) -> pd.DataFrame:
+    """Rebuilds the last state of an options chain from its change log."""
+    if log.empty:
+        return pd.DataFrame(columns=SNAPSHOT_FIELDS)
+    return (
+        log.drop_duplicates(subset=["contract_symbol", "field"], keep="last")
+        .pivot(index="contract_symbol", columns="field", values="value")
+        .reindex(columns=SNAPSHOT_FIELDS)
+        .dropna(how="all")
+    )
+
+
+def _pivot_log(log: pd.DataFrame, columns: str) -> pd.DataFrame:
+    """Pivots a change log by timestamp, carrying each value forward within its day.
+
+    Every day starts with a complete poll, so values are not carried from one day to the next.
+    Values recorded as empty, like a contract that left the chain, stay empty.
+    """
+    log = log.drop_duplicates(subset=["timestamp", columns], keep="last")
+    log = log.assign(removed=log["value"].isna().astype(float))
+    wide = log.pivot(index="timestamp", columns=columns, values="value")
+    # 1 where the last value recorded is empty, 0 where it is a value, and NaN before any record.
+    removed = log.pivot(index="timestamp", columns=columns, values="removed")
+    days = wide.index.astype(str).str[:10]
+
+    return wide.groupby(days).ffill().mask(removed.groupby(days).ffill() == 1)
+
+
+def _write_changes(archive: Path, day: str, changes: pd.DataFrame) -> None:
+    """Appends changes to the log of the day, as a new gzip member."""
+    archive.mkdir(parents=True, exist_ok=True)
+    file = archive.joinpath(f"{day}.csv.gz")
+    header = not file.exists()
+    with gzip.open(file, "at", encoding="utf-8") as f:
+        changes.to_csv(f, index=False, header=header)
+
+
+def _read_log(file: Path) -> pd.DataFrame:
+    """Reads the log of a single day."""
+    return pd.read_csv(file, dtype={"contract_symbol": str, "field": str})
+
+
+async def record_chain_snapshot(
+    symbol: str,
+    chains: Optional[pd.DataFrame] = None,
+    timestamp: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """Polls the current options chain and records the fields that changed since the last poll.
+
+    Parameters
+    ----------
+    symbol: str
+        The ticker symbol, or option root symbol.
+    chains: Optional[pd.DataFrame]
+        The options chain from `get_current_options`, if it was already downloaded.
+    timestamp: Optional[datetime]
+        The time of the poll. Default is now.
+
+    Returns
+    -------
+    pd.DataFrame
+        The changes recorded, with columns: timestamp, contract_symbol, field, value.
+    """
+    symbol = await get_options_root(symbol)
+    if chains is None:
+        chains = await get_current_options(symbol)
+    timestamp = timestamp or datetime.now()
+    day = timestamp.strftime("%Y-%m-%d")
+    archive = get_snapshots_archive(symbol)
+
+    state: Optional[pd.DataFrame] = None
+    if symbol in _snapshot_states and _snapshot_states[symbol][0] == day:
+        state = _snapshot_states[symbol][1]
+    elif archive.joinpath(f"{day}.csv.gz").exists():
+        log = await run_parser(_read_log, archive.joinpath(f"{day}.csv.gz"))
+        state = replay_chain_snapshots(log)
+
+    changes = diff_chain_snapshots(
+        state, chains, timestamp.isoformat(timespec="seconds")
+    )
+    if not changes.empty:
+        await run_parser(_write_changes, archive, day, changes)
+
+    current = (
+        chains.drop_duplicates(subset=["contract_symbol"])
+        .set_index("contract_symbol")[SNAPSHOT_FIELDS]
+        .astype(float)
+    )
+    _snapshot_states[symbol] = (day, current)
+
+    return changes
+
+
+def read_chain_snapshots(
+    symbol: str,
+    start_date: Optional[Union[str, dateType]] = None,
+    end_date: Optional[Union[str, dateType]] = None,
+) -> pd.DataFrame:
+    """Reads the change log of an option root symbol.
+
+    Parameters
+    ----------
+    symbol: str
+        The option root symbol.
+    start_date: Optional[Union[str, date]]
+        The first day of the log. Default is the first day stored.
+    end_date: Optional[Union[str, date]]
+        The last day of the log. Default is the last day stored.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with columns: timestamp, contract_symbol, field, value.
+    """
+    start = str(start_date) if start_date else ""
+    end = str(end_date) if end_date else "9999-12-31"
+    files = sorted(
+        file
+        for file in get_snapshots_archive(symbol).glob("*.csv.gz")
+        if start <= file.name[:10] <= end
+    )
+    logs = [_read_log(file) for file in files]
+    logs = [log for log in logs if not log.empty]
+    if not logs:
+        return pd.DataFrame(columns=SNAPSHOT_COLUMNS)
+
+    return pd.concat(logs, ignore_index=True)
+
+
+def get_contract_history(
+    symbol: str,
+    contract_symbol: str,
+    start_date: Optional[Union[str, dateType]] = None,
+    end_date: Optional[Union[str, dateType]] = None,
+) -> pd.DataFrame:
+    """Gets the recorded time series of a single contract.
+
+    Parameters
+    ----------
+    symbol: str
+        The option root symbol.
+    contract_symbol: str
+        The contract symbol, from the "contract_symbol" column of the options chain.
+    start_date: Optional[Union[str, date]]
+        The first day of the series.
+    end_date: Optional[Union[str, date]]
+        The last day of the series.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame indexed by timestamp, with a column for each of `SNAPSHOT_FIELDS`.
+        There is a row for each poll where the contract changed.
+    """
+    log = read_chain_snapshots(symbol, start_date, end_date)
+    log = log[log["contract_symbol"] == contract_symbol]
+    if log.empty:
+        return pd.DataFrame(columns=SNAPSHOT_FIELDS)
+
+    history = _pivot_log(log, "field").reindex(columns=SNAPSHOT_FIELDS)
+    history.index = pd.to_datetime(history.index)
+    history.columns.name = None
+
+    return history
+
+
+def get_open_interest_history(
+    symbol: str,
+    start_date: Optional[Union[str, dateType]] = None,
+    end_date: Optional[Union[str, dateType]] = None,
+    by: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Gets the recorded open interest of an option root symbol, aggregated by strike and expiration.
+
+    Parameters
+    ----------
+    symbol: str
+        The option root symbol.
+    start_date: Optional[Union[str, date]]
+        The first day of the series.
+    end_date: Optional[Union[str, date]]
+        The last day of the series.
+    by: Optional[List[str]]
+        The columns to aggregate by, any of: expiration, strike, option_type.
+        Default is ["expiration", "strike"].
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with columns: timestamp, the columns in `by`, open_interest.
+        There is a row for each timestamp where the open interest of any contract changed.
+    """
+    by = by or ["expiration", "strike"]
+    log = read_chain_snapshots(symbol, start_date, end_date)
+    log = log[log["field"] == "open_interest"]
+    if log.empty:
+        return pd.DataFrame(columns=["timestamp", *by, "open_interest"])
+
+    # The open interest of every contract at every timestamp.
+    open_interest = _pivot_log(log, "contract_symbol").fillna(0)
+    contracts = decode_contract_symbols(open_interest.columns.to_series())
+    keys = [contracts[column].to_numpy() for column in by]
+    aggregate = open_interest.T.groupby(keys).sum().T
+    aggregate.index = pd.to_datetime(aggregate.index)
+    aggregate.index.name = "timestamp"
+    aggregate.columns.names = by
+
+    return (
+        aggregate.stack(list(range(len(by))))
+        .rename("open_interest")
+        .reset_index()
+        .astype({"open_interest": "int64"})
+    )
@@ -0,0 +1 @@
+"""TMX benchmarks."""
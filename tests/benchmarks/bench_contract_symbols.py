@@ -0,0 +1,75 @@
+"""Benchmark the options contract symbol codec.
+
+Run with: python -m tests.benchmarks.bench_contract_symbols
+"""
+
+from timeit import timeit
+
+import numpy as np
+import pandas as pd
+from openbb_tmx.utils.helpers import decode_contract_symbols, encode_contract_symbols
+
+
+def make_chain(n_expirations: int = 24, n_strikes: int = 250) -> pd.DataFrame:
+    """Create a synthetic chain with calls and puts at every expiration and strike."""
+    expirations = pd.date_range("2024-01-19", periods=n_expirations, freq="W-FRI")
+    strikes = np.round(np.arange(1, n_strikes + 1) * 0.5, 2)
+    index = pd.MultiIndex.from_product(
+        [expirations.strftime("%Y-%m-%d"), strikes, ["call", "put"]],
+        names=["expiration", "strike", "optionType"],
+    )
+    return index.to_frame(index=False)
+
+
+def encode_loop(symbol: str, chain: pd.DataFrame) -> pd.Series:
+    """The previous row-by-row implementation, for comparison."""
+    strikes = []
+    for _strike in chain["strike"]:
+        _strike = str(_strike).split(".")
+        front = "0" * (5 - len(_strike[0]))
+        back = "0" * (3 - len(_strike[1]))
+        strikes.append(f"{front}{_strike[0]}{_strike[1]}{back}")
+    return (
+        symbol
+        + " " * (6 - len(symbol))
+        + pd.to_datetime(chain["expiration"]).dt.strftime("%y%m%d")
+        + (chain["optionType"].replace("call", "C").replace("put", "P"))
+        + pd.Series(strikes, index=chain.index)
+    )
+
+
+def main(number: int = 10) -> None:
+    """Print the timings for each implementation."""
+    chain = make_chain()
+    encoded = encode_contract_symbols(
+        "RY", chain["expiration"], chain["optionType"], chain["strike"]
+    )
+    assert encoded.equals(encode_loop("RY", chain))
+    decoded = decode_contract_symbols(encoded)
+    assert encode_contract_symbols(
+        decoded["root"],
+        decoded["expiration"],
+        decoded["option_type"],
+        decoded["strike"],
+    ).equals(encoded)
+
+    loop = timeit(lambda: encode_loop("RY", chain), number=number) / number
+    vectorized = (
+        timeit(
+            lambda: encode_contract_symbols(
+                "RY", chain["expiration"], chain["optionType"], chain["strike"]
+            ),
+            number=number,
+        )
+        / number
+    )
+    decode = timeit(lambda: decode_contract_symbols(encoded), number=number) / number
+
+    print(f"Contracts: {len(chain)}")
+    print(f"Encode, loop:       {loop * 1000:.2f} ms")
+    print(f"Encode, vectorized: {vectorized * 1000:.2f} ms")
+    print(f"Decode, vectorized: {decode * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """TMX fetchers tests."""
 
+import asyncio
 from datetime import date
 import pytest
 from openbb_core.app.service.user_service import UserService
@@ -12,6 +13,7 @@ from openbb_tmx.models.equity_profile import TmxEquityProfileFetcher
 from openbb_tmx.models.equity_quote import TmxEquityQuoteFetcher
 from openbb_tmx.models.equity_search import TmxEquitySearchFetcher
 from openbb_tmx.models.etf_countries import TmxEtfCountriesFetcher
+from openbb_tmx.models.etf_holders import TmxEtfHoldersFetcher
 from openbb_tmx.models.etf_holdings import TmxEtfHoldingsFetcher
 from openbb_tmx.models.etf_info import TmxEtfInfoFetcher
 from openbb_tmx.models.etf_search import TmxEtfSearchFetcher
@@ -19,11 +21,17 @@ from openbb_tmx.models.etf_sectors import TmxEtfSectorsFetcher
 from openbb_tmx.models.gainers import TmxGainersFetcher
 from openbb_tmx.models.historical_dividends import TmxHistoricalDividendsFetcher
 from openbb_tmx.models.index_constituents import TmxIndexConstituentsFetcher
+from openbb_tmx.models.index_memberships import TmxIndexMembershipsFetcher
 from openbb_tmx.models.index_sectors import TmxIndexSectorsFetcher
 from openbb_tmx.models.index_snapshots import TmxIndexSnapshotsFetcher
 from openbb_tmx.models.insiders_trading import TmxInsidersTradingFetcher
+from openbb_tmx.models.news_search import TmxNewsSearchFetcher
 from openbb_tmx.models.options_chains import TmxOptionsChainsFetcher
+from openbb_tmx.models.options_stats import TmxOptionsStatsFetcher
 from openbb_tmx.models.price_target_consensus import TmxPriceTargetConsensusFetcher
+from openbb_tmx.models import put_call_ratios
+from openbb_tmx.models.put_call_ratios import TmxPutCallRatiosFetcher
+from openbb_tmx.utils import news
 
 test_credentials = UserService().default_user_settings.credentials.model_dump()
 
@@ -67,7 +75,7 @@ def test_tmx_available_indices_fetcher(credentials=test_credentials):
 
 @pytest.mark.record_http
 def test_tmx_calendar_earnings_fetcher(credentials=test_credentials):
-    params = {}
+    params = {"use_cache": False}
 
     fetcher = TmxCalendarEarningsFetcher()
     result = fetcher.test(params, credentials)
@@ -80,6 +88,7 @@ def test_tmx_company_filings_fetcher(credentials=test_credentials):
         "symbol": "SHOP",
         "start_date": date(2023, 6, 30),
         "end_date": date(2023, 9, 30),
+        "use_cache": False,
     }
 
     fetcher = TmxCompanyFilingsFetcher()
@@ -88,7 +97,8 @@ def test_tmx_company_filings_fetcher(credentials=test_credentials):
 
 
 @pytest.mark.record_http
-def test_tmx_company_news_fetcher(credentials=test_credentials):
+def test_tmx_company_news_fetcher(tmp_path, monkeypatch, credentials=test_credentials):
+    monkeypatch.setattr(news, "cache_dir", str(tmp_path))
     params = {"symbols": "SHOP", "limit": 5}
 
     fetcher = TmxCompanyNewsFetcher()
@@ -127,6 +137,15 @@ def test_tmx_etf_countries_fetcher(credentials=test_credentials):
     assert result is None
 
 
+@pytest.mark.record_http
+def test_tmx_etf_holders_fetcher(credentials=test_credentials):
+    params = {"symbol": "RY,TD", "use_cache": False}
+
+    fetcher = TmxEtfHoldersFetcher()
+    result = fetcher.test(params, credentials)
+    assert result is None
+
+
 @pytest.mark.record_http
 def test_tmx_etf_holdings_fetcher(credentials=test_credentials):
     params = {"symbol": "XIU", "use_cache": False}
@@ -190,6 +209,15 @@ def test_tmx_index_constituents_fetcher(credentials=test_credentials):
     assert result is None
 
 
+@pytest.mark.record_http
+def test_tmx_index_memberships_fetcher(credentials=test_credentials):
+    params = {"symbol": "RY,SHOP,CNQ", "use_cache": False}
+
+    fetcher = TmxIndexMembershipsFetcher()
+    result = fetcher.test(params, credentials)
+    assert result is None
+
+
 @pytest.mark.record_http
 def test_tmx_index_sectors_fetcher(credentials=test_credentials):
     params = {"symbol": "^TSX", "use_cache": False}
@@ -217,6 +245,26 @@ def test_tmx_insiders_trading_fetcher(credentials=test_credentials):
     assert result is None
 
 
+def test_tmx_news_search_fetcher(tmp_path, monkeypatch, credentials=test_credentials):
+    monkeypatch.setattr(news, "cache_dir", str(tmp_path))
+    news.write_news_index(
+        [
+            {
+                "newsid": "test-news-search",
+                "datetime": "2024-01-15T08:30:00-0500",
+                "headline": "Royal Bank of Canada declares quarterly dividend",
+                "source": "Newsfile",
+                "symbols": "RY",
+            }
+        ]
+    )
+    params = {"query": "dividend", "symbol": "RY", "start_date": date(2024, 1, 1)}
+
+    fetcher = TmxNewsSearchFetcher()
+    result = fetcher.test(params, credentials)
+    assert result is None
+
+
 @pytest.mark.record_http
 def test_tmx_options_chains_fetcher(credentials=test_credentials):
     params = {"symbol": "SHOP", "use_cache": False}
@@ -226,6 +274,15 @@ def test_tmx_options_chains_fetcher(credentials=test_credentials):
     assert result is None
 
 
+@pytest.mark.record_http
+def test_tmx_options_stats_fetcher(credentials=test_credentials):
+    params = {"start_date": date(2023, 11, 1), "end_date": date(2023, 12, 31)}
+
+    fetcher = TmxOptionsStatsFetcher()
+    result = fetcher.test(params, credentials)
+    assert result is None
+
+
 @pytest.mark.record_http
 def test_tmx_price_target_consensus_fetcher(credentials=test_credentials):
     params = {"symbol": "SHOP"}
@@ -233,3 +290,77 @@ def test_tmx_price_target_consensus_fetcher(credentials=test_credentials):
     fetcher = TmxPriceTargetConsensusFetcher()
     result = fetcher.test(params, credentials)
     assert result is None
+
+
+@pytest.mark.record_http
+def test_tmx_put_call_ratios_fetcher(credentials=test_credentials):
+    params = {"index": False, "use_cache": False}
+
+    fetcher = TmxPutCallRatiosFetcher()
+    result = fetcher.test(params, credentials)
+    assert result is None
+
+
+def test_tmx_put_call_ratios_incremental(tmp_path, monkeypatch):
+    lines = [
+        "Date;Call Volume;Put Volume;Total Volume;Put/Call Ratio",
+        "2024-01-02;100;50;150;0.5",
+        "2024-01-03;200;100;300;0.5",
+    ]
+    server = {"ranges": True}
+    requests = []
+
+    async def get_data_from_url(url, use_cache=True, callback=None, **kwargs):
+        content = ("\n".join(lines) + "\n").encode()
+        byte_range = (kwargs.get("headers") or {}).get("Range")
+        requests.append(byte_range)
+        if byte_range and server["ranges"]:
+            start = int(byte_range[len("bytes=") : -1])
+            return (206, content[start:]) if start < len(content) else (416, b"")
+        return 200, content
+
+    monkeypatch.setattr(put_call_ratios, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(put_call_ratios, "get_data_from_url", get_data_from_url)
+
+    history = asyncio.run(put_call_ratios.get_put_call_ratios())
+    assert history["date"].tolist() == ["2024-01-02", "2024-01-03"]
+    assert requests == [None]
+    size = len(("\n".join(lines) + "\n").encode())
+    overlap = len((lines[-1] + "\n").encode())
+
+    # Only the last stored line, and the appended bytes, are requested,
+    # and the new row is merged into the stored history.
+    lines.append("2024-01-04;300;300;600;1.0")
+    history = asyncio.run(put_call_ratios.get_put_call_ratios())
+    assert history["date"].tolist()[-1] == "2024-01-04"
+    assert len(history) == 3
+    assert requests[1:] == [f"bytes={size - overlap}-"]
+
+    # Nothing new returns only the last stored line, and the history is unchanged.
+    history = asyncio.run(put_call_ratios.get_put_call_ratios())
+    assert len(history) == 3
+    assert len(requests) == 3
+
+    # A rewritten file no longer matches the last stored line, and is downloaded again.
+    lines[-1] = "2024-01-04;300;150;450;0.5"
+    history = asyncio.run(put_call_ratios.get_put_call_ratios())
+    assert history["put_call_ratio"].tolist()[-1] == 0.5
+    assert requests[3] is not None and requests[4] is None
+
+    # A server ignoring the range answers with the whole file, which is used without a second request.
+    server["ranges"] = False
+    lines.append("2024-01-05;400;200;600;0.5")
+    history = asyncio.run(put_call_ratios.get_put_call_ratios())
+    assert history["date"].tolist() == [
+        "2024-01-02",
+        "2024-01-03",
+        "2024-01-04",
+        "2024-01-05",
+    ]
+    assert len(requests) == 6
+
+    # The former helper is kept, and downloads the complete history.
+    with pytest.warns(DeprecationWarning):
+        history = put_call_ratios.get_pcr()
+    assert len(history) == 4
+    assert requests[-1] is None
@@ -0,0 +1,484 @@
+"""TMX utils tests."""
+
+import asyncio
+import json
+import os
+from datetime import date, datetime, timedelta
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+from openbb_tmx.models.etf_search import TmxEtfSearchData, parse_screen
+from openbb_tmx.models.options_stats import parse_options_stats
+from openbb_tmx.utils import (
+    black_scholes,
+    earnings,
+    etf_index,
+    filings,
+    helpers,
+    indices,
+    options_snapshots,
+)
+from openpyxl import Workbook
+
+
+def test_tmx_earnings_settled_transition(tmp_path, monkeypatch):
+    monkeypatch.setattr(earnings, "cache_dir", str(tmp_path))
+    today = datetime.now().date()
+    day = (today - timedelta(days=5)).isoformat()
+    earnings.write_earnings_archive({day: []})
+    file = earnings.get_earnings_archive().joinpath(f"{day}.json")
+
+    # Written 10 days ago, while the date was upcoming, the file is not settled and has expired.
+    written = datetime.now() - timedelta(days=10)
+    os.utime(file, (written.timestamp(), written.timestamp()))
+    assert earnings.get_stale_earnings_dates([day]) == [day]
+
+    # Written 2 days after the date, the file is not settled, but is still within the TTL.
+    written = datetime.combine(date.fromisoformat(day), datetime.min.time())
+    written += timedelta(days=2)
+    assert not earnings.is_earnings_date_settled(day, written)
+
+    # Written after the date is settled, the file is kept for good.
+    written = datetime.now() - timedelta(days=1)
+    os.utime(file, (written.timestamp(), written.timestamp()))
+    assert earnings.is_earnings_date_settled(day, written)
+    assert earnings.get_stale_earnings_dates([day]) == []
+
+
+def test_tmx_eod_chains_empty_markers(tmp_path, monkeypatch):
+    header = (
+        "Date,Symbol,Class Symbol,Root Symbol,Underlying Symbol,Ins. Type,Strike Price,"
+        + "Expiry Date,Call/Put\n"
+    )
+    responses = {"body": "<html>Too many requests</html>"}
+
+    async def get_data_from_url(url, use_cache=True, **kwargs):
+        return responses["body"]
+
+    async def get_options_root(symbol, use_cache=True):
+        return symbol
+
+    monkeypatch.setattr(helpers, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(helpers, "get_data_from_url", get_data_from_url)
+    monkeypatch.setattr(helpers, "get_options_root", get_options_root)
+    archive = helpers.get_eod_chains_archive("XYZ")
+
+    # An error page writes nothing, so the days are requested again.
+    with pytest.warns(UserWarning):
+        asyncio.run(
+            helpers.download_eod_chains_range("XYZ", "2024-01-08", "2024-01-09")
+        )
+    assert not archive.exists()
+
+    # A valid file without rows marks the settled days as empty.
+    responses["body"] = header
+    data = asyncio.run(
+        helpers.download_eod_chains_range("XYZ", "2024-01-08", "2024-01-09")
+    )
+    assert data.empty
+    assert sorted(file.name for file in archive.iterdir()) == [
+        "2024-01-08.csv.gz",
+        "2024-01-09.csv.gz",
+    ]
+
+
+def test_tmx_parse_eod_chains_symbols():
+    columns = [
+        "Date",
+        "Symbol",
+        "Class Symbol",
+        "Root Symbol",
+        "Underlying Symbol",
+        "Ins. Type",
+        "Strike Price",
+        "Expiry Date",
+        "Call/Put",
+        "Bid Price",
+        "Ask Price",
+        "Bid Size",
+        "Ask Size",
+        "Last Price",
+        "Volume",
+        "Prev. Close Price",
+        "Change",
+        "Open Price",
+        "High Price",
+        "Low Price",
+        "Total Value",
+        "Nb. Trade",
+        "Settlement Price",
+        "Open Interest",
+        "Implied Volatility",
+    ]
+    rows = [
+        "2024-01-08,RY 240119C100.00,RY,RY,RY,Option,100,2024-01-19,0,"
+        + "2,2.1,10,10,2.05,5,2,0.05,2,2.1,2,10,1,2.05,100,20",
+        "2024-01-08,RY,RY,RY,RY,Equity,0,2024-01-19,0,"
+        + "0,0,0,0,101,0,100,1,100,102,99,0,0,0,0,0",
+    ]
+    data = helpers.parse_eod_chains("\n".join([",".join(columns), *rows]))
+
+    assert len(data) == 1
+    assert (
+        data["contract_symbol"].iloc[0]
+        == helpers.encode_contract_symbols(
+            "RY",
+            pd.Series(pd.to_datetime(["2024-01-19"])),
+            pd.Series(["call"]),
+            pd.Series([100.0]),
+        ).iloc[0]
+    )
+    assert data["exchange_symbol"].iloc[0] == "RY 240119C100.00"
+
+
+def test_tmx_etf_history_delisted(tmp_path, monkeypatch):
+    monkeypatch.setattr(helpers, "cache_dir", str(tmp_path))
+    helpers.write_etf_snapshot(
+        [{"symbol": "AAA", "aum": 1}, {"symbol": "BBB", "aum": 2}], "2024-01-08"
+    )
+    counts = helpers.write_etf_snapshot([{"symbol": "AAA", "aum": 1}], "2024-01-09")
+    assert counts == {"funds": 0, "holdings": 0, "delisted": 1}
+    helpers.write_etf_snapshot([{"symbol": "AAA", "aum": 3}], "2024-01-10")
+
+    history = helpers.get_etf_history(["AAA", "BBB"], columns=["aum"])
+    assert history[history["symbol"] == "AAA"]["aum"].tolist() == [1, 1, 3]
+    assert history[history["symbol"] == "BBB"]["date"].tolist() == ["2024-01-08"]
+
+
+def test_tmx_etf_snapshot_unreadable_latest(tmp_path, monkeypatch):
+    monkeypatch.setattr(helpers, "cache_dir", str(tmp_path))
+    archive = helpers.get_etf_snapshots_archive()
+    archive.mkdir(parents=True)
+    archive.joinpath("latest.csv.gz").write_bytes(b"not a gzip file")
+
+    with pytest.warns(UserWarning):
+        counts = helpers.write_etf_snapshot([{"symbol": "AAA", "aum": 1}], "2024-01-08")
+    assert counts["funds"] == 1
+    assert helpers.get_etf_history(["AAA"], columns=["aum"])["aum"].tolist() == [1]
+
+
+def test_tmx_stored_filings_sync_failure(tmp_path, monkeypatch):
+    async def download_company_filings(symbol, start_date, end_date):
+        raise RuntimeError("No window of filings could be downloaded.")
+
+    monkeypatch.setattr(filings, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(filings, "download_company_filings", download_company_filings)
+    today = datetime.now().date()
+    filing = {"filingDate": today.isoformat(), "name": "Report", "urlToPdf": "a.pdf"}
+    filings.write_filings_store("RY", [filing], today - timedelta(days=30), today)
+
+    with pytest.warns(UserWarning):
+        data = asyncio.run(
+            filings.get_stored_company_filings("RY", today - timedelta(days=10), today)
+        )
+    assert [d["urlToPdf"] for d in data] == ["a.pdf"]
+
+
+def test_tmx_sync_filings_stats(tmp_path, monkeypatch):
+    async def get_company_filings_window(symbol, start_date, end_date, limit):
+        return [{"filingDate": start_date.isoformat(), "urlToPdf": "a.pdf"}], 2
+
+    monkeypatch.setattr(filings, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(
+        helpers, "get_company_filings_window", get_company_filings_window
+    )
+    today = datetime.now().date()
+    results = asyncio.run(
+        filings.sync_company_filings("RY", today - timedelta(days=10), today)
+    )
+    assert results == {
+        "added": 1,
+        "requests": 2,
+        "windows": 1,
+        "splits": 0,
+        "saturated": 0,
+        "failed": 0,
+    }
+
+
+def test_tmx_parse_options_stats():
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "Equity Options"
+    worksheet.append(["Montreal Exchange"])
+    worksheet.append(["Monthly Statistics", None, None, None])
+    worksheet.append(["Symbol", "Volume", "Open Interest", None])
+    worksheet.append(["RY", 1000, 5000, None])
+    worksheet.append([None, None, None, None])
+    worksheet.append(["Symbol", "Volume", "Open Interest", None])
+    worksheet.append(["TD", 2000, 6000, None])
+    workbook.create_sheet("Notes")
+    content = BytesIO()
+    workbook.save(content)
+
+    tables = parse_options_stats(content.getvalue())
+    assert list(tables) == ["equity_options"]
+    table = tables["equity_options"]
+    assert table.columns.tolist() == ["symbol", "volume", "open_interest"]
+    assert table["symbol"].tolist() == ["RY", "TD"]
+    assert table["open_interest"].tolist() == [5000, 6000]
+
+
+def test_tmx_validate_models_trusted():
+    data = [
+        {
+            "symbol": "XIU",
+            "currency": "CAD",
+            "close": "30.5",
+            "fund_family": "BlackRock",
+            "volume_avg_daily": 10,
+        }
+    ]
+    validated = helpers.validate_models(TmxEtfSearchData, data)
+    dumps = [model.model_dump() for model in validated]
+    constructed = helpers.validate_models(TmxEtfSearchData, dumps, trusted=True)
+    assert [model.model_dump() for model in constructed] == dumps
+    assert constructed[0].issuer == "BlackRock"
+
+
+def test_tmx_quotes_failed_batch(monkeypatch):
+    async def get_data_from_gql(url, data, headers, **kwargs):
+        symbols = json.loads(data)["variables"]["symbols"]
+        if "BAD" in symbols:
+            raise RuntimeError("Error with the request.")
+        return {
+            "data": {
+                "getQuoteForSymbols": [{"symbol": s, "price": 1.0} for s in symbols]
+            }
+        }
+
+    monkeypatch.setattr(helpers, "get_data_from_gql", get_data_from_gql)
+    with pytest.warns(UserWarning, match="2 of 4 quotes"):
+        quotes = asyncio.run(
+            helpers.get_quotes_for_symbols(["RY", "TD", "BAD", "BNS"], batch_size=2)
+        )
+    assert sorted(quotes) == ["RY", "TD"]
+
+
+def test_tmx_index_snapshots_failed_quotes(monkeypatch):
+    async def get_indices_model(use_cache=True):
+        return {
+            "symbols": {"^TSX": 0, "^TX60": 1},
+            "snapshots": [{"symbol": "^TSX"}, {"symbol": "^TX60"}],
+        }
+
+    async def get_data_from_gql(url, data, headers, **kwargs):
+        raise RuntimeError("Error with the request.")
+
+    monkeypatch.setattr(indices, "get_indices_model", get_indices_model)
+    monkeypatch.setattr(helpers, "get_data_from_gql", get_data_from_gql)
+    with pytest.warns(UserWarning, match="2 of 2 quotes"):
+        snapshots = asyncio.run(indices.get_index_snapshots())
+    assert snapshots == [{"symbol": "^TSX"}, {"symbol": "^TX60"}]
+
+
+def test_tmx_black_scholes_implied_volatility():
+    # Textbook values, S = K = 100, T = 1 year, r = 5%, sigma = 20%.
+    prices = black_scholes.black_scholes_price(
+        np.array([100.0, 100.0]),
+        np.array([100.0, 100.0]),
+        np.array([1.0, 1.0]),
+        np.array([0.2, 0.2]),
+        np.array([True, False]),
+        r=0.05,
+    )
+    assert prices == pytest.approx([10.4506, 5.5735], abs=1e-4)
+
+    # The last two contracts are below their intrinsic value, and expired.
+    sigma = black_scholes.implied_volatility(
+        np.array([10.4506, 5.5735, 1.0, 10.0]),
+        np.array([100.0, 100.0, 120.0, 100.0]),
+        np.array([100.0, 100.0, 100.0, 100.0]),
+        np.array([1.0, 1.0, 1.0, 0.0]),
+        np.array([True, False, True, True]),
+        r=0.05,
+    )
+    assert sigma[:2] == pytest.approx([0.2, 0.2], abs=1e-4)
+    assert np.isnan(sigma[2:]).all()
+
+
+def test_tmx_black_scholes_greeks():
+    greeks = black_scholes.calculate_greeks(
+        np.array([100.0, 100.0]),
+        np.array([100.0, 100.0]),
+        np.array([1.0, 1.0]),
+        np.array([0.2, 0.2]),
+        np.array([True, False]),
+        r=0.05,
+    )
+    assert greeks["delta"].tolist() == pytest.approx([0.6368, -0.3632], abs=1e-4)
+    assert greeks["gamma"].tolist() == pytest.approx([0.018762] * 2, abs=1e-6)
+    assert greeks["vega"].tolist() == pytest.approx([0.37524] * 2, abs=1e-5)
+    assert greeks["theta"].tolist() == pytest.approx(
+        [-6.4140 / 365, -1.6579 / 365], abs=1e-5
+    )
+    assert greeks["rho"].tolist() == pytest.approx([0.53232, -0.41890], abs=1e-5)
+
+
+def _chain(rows):
+    """Build an options chain with the recorded fields, from (contract_symbol, bid, open_interest)."""
+    return pd.DataFrame(
+        [
+            {
+                "contract_symbol": contract_symbol,
+                "bid": bid,
+                "ask": None,
+                "last_trade_price": None,
+                "volume": None,
+                "open_interest": open_interest,
+            }
+            for contract_symbol, bid, open_interest in rows
+        ]
+    )
+
+
+def test_tmx_options_snapshots_removed_contracts(tmp_path, monkeypatch):
+    call, put = "RY    240315C00100000", "RY    240315P00100000"
+    polls = [
+        ("2024-03-01T10:00:00", _chain([(call, 1.0, 10), (put, 2.0, 5)])),
+        ("2024-03-01T10:01:00", _chain([(call, 1.0, 12)])),
+        ("2024-03-01T10:02:00", _chain([(call, 1.0, 12), (put, 2.5, 7)])),
+    ]
+    monkeypatch.setattr(options_snapshots, "cache_dir", str(tmp_path))
+    archive = options_snapshots.get_snapshots_archive("RY")
+
+    state = None
+    for timestamp, chain in polls:
+        changes = options_snapshots.diff_chain_snapshots(state, chain, timestamp)
+        options_snapshots._write_changes(archive, "2024-03-01", changes)
+        log = options_snapshots.read_chain_snapshots("RY")
+        state = options_snapshots.replay_chain_snapshots(log)
+        if timestamp == polls[1][0]:
+            # Only the changed open interest, and the fields of the removed contract, are recorded.
+            assert sorted(zip(changes["contract_symbol"], changes["field"])) == [
+                (call, "open_interest"),
+                (put, "bid"),
+                (put, "open_interest"),
+            ]
+            assert changes[changes["contract_symbol"] == put]["value"].isna().all()
+            assert state.index.tolist() == [call]
+
+    assert state.loc[put, "open_interest"] == 7
+    history = options_snapshots.get_contract_history("RY", put)
+    assert history["bid"].isna().tolist() == [False, True, False]
+
+    open_interest = options_snapshots.get_open_interest_history(
+        "RY", by=["option_type"]
+    )
+    puts = open_interest[open_interest["option_type"] == "put"]
+    calls = open_interest[open_interest["option_type"] == "call"]
+    assert puts["open_interest"].tolist() == [5, 0, 7]
+    assert calls["open_interest"].tolist() == [10, 12, 12]
+
+
+def test_tmx_search_etf_index():
+    index = etf_index.build_etf_search_index(
+        [
+            {
+                "symbol": "XIU",
+                "name": "iShares S&P/TSX 60 Index ETF",
+                "investment_style": "Canadian Equity",
+            },
+            {
+                "symbol": "XBB",
+                "name": "iShares Core Canadian Universe Bond Index ETF",
+                "investment_style": "Canadian Fixed Income",
+            },
+            {
+                "symbol": "ZCN",
+                "name": "BMO S&P/TSX Capped Composite Index ETF",
+                "investment_style": "Canadian Equity",
+            },
+            {
+                "symbol": "ZEB",
+                "short_name": "BMO Énergie",
+                "name": "BMO Equal Weight Banks Index ETF",
+                "investment_style": "Canadian Equity",
+            },
+        ]
+    )
+
+    def rows(query):
+        return [row for row, _ in etf_index.search_etf_index(index, query)]
+
+    assert etf_index.search_etf_index(index, "XIU") == [(0, 8.0)]
+    # Every word must match, in any field.
+    assert rows("ishares bond") == [1]
+    assert rows("bmo banks") == [3]
+    assert rows("ishares zzz") == []
+    # Prefixes match, and count for less than whole words.
+    assert rows("canad")[0] == 1
+    assert sorted(rows("canad")) == [0, 1, 2, 3]
+    assert rows("equ")[0] == 3
+    assert etf_index.search_etf_index(index, "equal") == [(3, 4.0)]
+    # Accents and case are ignored.
+    assert rows("ENERGIE") == [3]
+
+
+def test_tmx_screen_etfs():
+    tables = etf_index.build_etf_tables(
+        [
+            {"symbol": "A", "aum": 500, "mer": 0.5, "distribution_yield": 2.0},
+            {"symbol": "B", "aum": 100, "mer": 0.2, "distribution_yield": 3.0},
+            {"symbol": "C", "aum": None, "mer": 0.1, "distribution_yield": None},
+            {"symbol": "D", "aum": 500, "mer": 0.3, "distribution_yield": 1.0},
+            {"symbol": "E", "aum": 50, "mer": "N/A", "distribution_yield": 4.0},
+        ]
+    )
+
+    def screen(**kwargs):
+        return etf_index.screen_etfs(tables, **kwargs).tolist()
+
+    # Funds without a value are excluded from a filter, and sorted last.
+    assert screen(filters={"aum": (100, None)}) == [0, 1, 3]
+    assert screen(sort_by=[("mer", False)]) == [2, 1, 3, 0, 4]
+    # Ties keep the order of the universe, unless broken by the next key.
+    assert screen(sort_by=[("aum", True)]) == [0, 3, 1, 4, 2]
+    assert screen(sort_by=[("aum", True)], limit=2) == [0, 3]
+    assert screen(sort_by=[("aum", True), ("mer", False)], limit=2) == [3, 0]
+    # Only the given rows are screened, in their order.
+    assert screen(rows=np.array([4, 1, 0]), filters={"aum": (None, 100)}) == [4, 1]
+    # Percents are in the units of the source, and strict bounds exclude the value.
+    filters = parse_screen("distribution_yield>0.02, aum<=500")
+    assert screen(filters=filters) == [1, 4]
+    with pytest.raises(ValueError):
+        screen(limit=0)
+
+
+def test_tmx_update_nowcast():
+    model = {
+        "constituents": {
+            "table": pd.DataFrame(
+                {"symbol": ["X", "Y", "Y"], "weight": [60.0, 40.0, 5.0]}
+            ),
+            "bounds": {"^A": (0, 2), "^B": (2, 3)},
+        }
+    }
+    state = indices.build_nowcast_state(model)
+    assert state["members"] == {"X": [("^A", 0.6)], "Y": [("^A", 0.4), ("^B", 1.0)]}
+
+    # The first quote sets the base of each constituent, at its previous close.
+    quotes = {
+        "X": {"price": 11.0, "prevClose": 10.0},
+        "Y": {"price": 20.0, "prevClose": 20.0},
+        "Z": {"price": 5.0, "prevClose": 4.0},
+    }
+    assert indices.update_nowcast(state, quotes) == ["^A"]
+    assert state["ratios"]["^A"] == pytest.approx(1.06)
+    assert state["coverage"] == {"^A": pytest.approx(1.0), "^B": pytest.approx(1.0)}
+
+    # Only the constituents whose price changed are applied.
+    quotes = {"X": {"price": 11.0}, "Y": {"price": 22.0}, "^A": {"price": None}}
+    assert indices.update_nowcast(state, quotes) == ["^A", "^B"]
+    assert state["ratios"]["^A"] == pytest.approx(1.10)
+    assert state["ratios"]["^B"] == pytest.approx(1.10)
+    assert indices.update_nowcast(state, quotes) == []
+
+    indices.observe_index_levels(state, {"^A": {"price": 105.0, "prevClose": 100.0}})
+    [level] = indices.get_nowcast_levels(state)
+    assert level["symbol"] == "^A"
+    assert level["nowcast"] == pytest.approx(110.0)
+    assert level["error"] == pytest.approx(5.0)
+    assert level["error_percent"] == pytest.approx(5.0 / 105.0)